@@ -36,7 +36,6 @@ from pathlib import Path  # For accessing and conduct operations on files/direct
 import os
 import webbrowser # To load/view *.htm or *.html files.
 
-import re  # For search and spot regular expressions in {text, metadata, binary,...} I/O files.
 import subprocess # To record I/O terminal events.
 from joblib import Parallel
 import multiprocessing
@@ -52,6 +51,13 @@ from colorama import Fore, Back, Style  # To print certain text in standard colo
                                  # quantum points vs. classical points about the measurement dataset
 import termplotlib as tpl # To draw plots on circuit results during/after experiment. 
 from colored import fg, bg
+from QFLCC_log import EventLog  # Buffered JSON lines event log of the program checkpoints (with shell_output.txt).
+qflcc_log = EventLog() # Written in batches and at program exit, without a shell process per entry.
+
+def restart():
+ """- Write out and close the event log, then restart the program (which starts its own log)."""
+ qflcc_log.close()
+ subprocess.run(["python", "QAI-LCode_QFLCC.py"])
 
 import click
 @click.group()
@@ -126,11 +132,9 @@ def main_exit():
          entry_stage = -1 # This value resets entry to 0 via its
                           # default increment += 1. 
          entry_stage += 1
-         file_ = open('shell_output.txt', 'a')
          now = datetime.datetime.now() # Date the I/O file entry 
-         subprocess.run("echo {}- Checkpoint logged on {} for all programs: \
-///-PROGRAM TERMINATED--///".format(entry_stage, now.strftime("%Y-%m-%d %H:%M:%S")), 
-shell=True, stdout=file_)
+         qflcc_log.log("{}- Checkpoint logged on {} for all programs: \
+///-PROGRAM TERMINATED--///".format(entry_stage, now.strftime("%Y-%m-%d %H:%M:%S")), stage='exit', flush=True)
          raise SystemExit      
         
 #---------------------------------------------------------------------------------------------------
@@ -213,7 +217,7 @@ def prompt():
                 break
              elif promptIn == 'b' or promptIn == 'begin' or promptIn == 'r' or promptIn == 'restart':
                   print('Restarting program...☝(° ͜ʖ ͡°)☝')
-                  subprocess.run(["python", "QAI-LCode_QFLCC.py"])  # Restart program.
+                  restart()  # Restart program.
                   break
              elif promptIn == 'cls' or promptIn == 'clear':
                   os.system('cls') # Clear screen.
@@ -528,6 +532,8 @@ sleep(5)
 # and listing steps starts here.  
 ##########################################
 from tqdm import tqdm  # This is for progressbar display.
+from QFLCC_sync import sync_datasets # Incremental copy of new/changed IBMQ/QI data files only.
+from QFLCC_dataset import READERS # Dataset export extensions (*.csv, *.json, *.htm).
 
 ibmq_f=0 # File flag set to 0 by default for IBMQ files if as not IN   
 qi_f=0   # File flag set to 0 by default for QInspire files as not IN
@@ -544,46 +550,44 @@ QI_dir = os.path.join(ppath, 'QI\\test\\')
 QI_files = os.listdir(QI_dir) # Fetching the list of all the files.
 IBMQ_files = os.listdir(IBMQ_dir) # Fetching the list of all the files.
 print('Importing IBMQ/QI data files: ', IBMQ_files, QI_files)  # Prints from e.g., C:/here/my_dir
+sync_mode = 'copy'  # Set to 'symlink' to link the data files, or 'reference' to read them in place (no copy).
+sync_check = 'stat' # Set to 'hash' to compare file contents rather than size/mtime before copying.
 
-pool = ThreadPoolExecutor(max_workers)
-
-file_ = open('shell_output.txt', 'w+') 
-subprocess.run("echo ///--- QFLCC Shell Log_file START ---///", shell=True, stdout=file_) 
+qflcc_log.start("///--- QFLCC Shell Log_file START ---///") # A new shell_output.txt log for this run.
 
 now = datetime.datetime.now() # Date each I/O file entry.
 
-try:
-   # with MultithreadedCopier(max_threads=16) as copier: # this is to achieve e.g., ~35x speedup on a 32 core machine. 
-   # with ThreadPool(4) as copier:
-    with pool as executor:
-            for file_name1 in QI_files:
-             future = executor.submit(shutil.copy, QI_dir + file_name1, cpath)  # future = pool.submit(my_task, argument) 
-                                                                                # does not block.
-             qi_f=1
-            for file_name1 in IBMQ_files:
-                future = executor.submit(shutil.copy, IBMQ_dir+file_name1, cpath)
-                ibmq_f=1
-            value = future.result() # This one blocks.
-            print(Back.RED + fg.black 
-                  + f'Thread ---> <{value}> <--- got {future}. Maximum threads initiated: {int(max_workers)}')
-            pool.shutdown()  
-
+# Only new or changed files are copied; every copy is waited on and its error (if any) is reported.
+sync_report = sync_datasets([QI_dir, IBMQ_dir], cpath, mode=sync_mode, check=sync_check, 
+                            max_workers=max_workers)
+print(Back.RED + fg.black 
+      + f'Sync ---> <{sync_report}> <--- Maximum threads initiated: {int(max_workers)}' + Back.RESET)
+# A file flag is set when any dataset of its folder is present to be read, whatever other files failed to sync.
+data_dir = lambda src_dir: src_dir if sync_mode == 'reference' else cpath # Where synced files are read from.
+qi_f = int(any(Path(f).suffix.lower() in READERS and os.path.isfile(os.path.join(data_dir(QI_dir), f)) 
+               for f in QI_files))
+ibmq_f = int(any(Path(f).suffix.lower() in READERS and os.path.isfile(os.path.join(data_dir(IBMQ_dir), f)) 
+                 for f in IBMQ_files))
+
+if not sync_report.errors:
     print('All IBMQ/QI data files imported successfully!')
     #----------------------------------
     # File directory listing code
     #----------------------------------
-except Exception as e:
+else:
     for i in tqdm(range(0, 10), ncols = 100, desc =Back.RESET+"Progress: "+Fore.RED): # Progress level of a copy operation. 
          time.sleep(.05)
     print('1 or more IBMQ/QI data files import failed!')
-    qi_f=0
-    ibmq_f=0
-    print(e)
+    for failed_file, e in sync_report.errors:
+         print(Fore.RED + f'{failed_file}: {e}' + Fore.RESET)
+for shadowed_file, kept_file in sync_report.shadowed: # Same file name in both folders: only one copy is kept.
+    print(Fore.YELLOW + f'{shadowed_file}: not imported, {kept_file} has the same file name!' + Fore.RESET)
 
 print(Back.RESET+'||||||||||||||||||||||||||||||||||||||') #, fileresult, sep="\n")
 print(Fore.YELLOW + 'You may view any of the files listed below by clicking on the file or [Ctrl + Mouse_click] option:')
 
 res = os.listdir()
+res += [ref for ref in sync_report.referenced if os.path.basename(ref) not in res] # Data files read in place.
 fileresult = []
 
 for (idx, st) in enumerate(res, 1):
@@ -593,8 +597,8 @@ for (idx, st) in enumerate(res, 1):
     for i in tqdm(range(0, 1), ncols=100, desc =Back.RESET+f"Progress: {st}"+fg.lightcyan + Style.BRIGHT): # Progress level of copy operation.
      # For any error related to this line on colors, install this: pip install tqdm==4.59.
      time.sleep(.05)
-     subprocess.run("echo {}- Checkpoint logged on {} for file # {} \
-as {}".format(idx, now.strftime("%Y-%m-%d %H:%M:%S"), idx, fileresult[idx-1]), shell=True, stdout=file_)
+     qflcc_log.log("{}- Checkpoint logged on {} for file # {} \
+as {}".format(idx, now.strftime("%Y-%m-%d %H:%M:%S"), idx, fileresult[idx-1]), stage='listing', dataset=fileresult[idx-1])
 
 #res=os.listdir().index() # Enable this line (with its print next) to have clickable files to load and view 
                           # on screen (not in terminal).
@@ -652,7 +656,7 @@ def file_reader():
                        file_reader() # Restart.
   elif user_input == 'b' or user_input == 'begin' or user_input == 'r' or user_input == 'restart':
                   print('Restarting program...☝(° ͜ʖ ͡°)☝')
-                  subprocess.run(["python", "QAI-LCode_QFLCC.py"])  # Restart program.
+                  restart()  # Restart program.
                   break
   elif user_input == 'cls' or user_input == 'clear':
                   os.system('cls') # Clear screen.
@@ -720,29 +724,42 @@ def filenum_call():
 filenum_call()
 
 from pathlib import Path
+from QFLCC_dataset import load_dataset  # Single-parse dataset readers (*.csv, *.json, *.htm) with cached max/min P's.
+from QFLCC_bits import BitColumn, pair_report, bins_match, row_pairs, AlignmentIndex  # Packed-integer binary string columns and their alignment.
+from QDF_stats import STATS_FILE  # QDF circuit stats table of the IBM QDF circuit run.
+from QFLCC_verdict import verdict, NA, NULL  # Table-driven Δp validation verdict classifier.
+from QFLCC_confidence import match_confidence, dataset_shots, SEED as CONFIDENCE_SEED  # Shot noise intervals and significance of the Δp verdict.
+from QFLCC_compare import support_matrix  # IBMQ and dataset P's lined up over the union of their binary strings.
+# Text colors of every Δp verdict and of the Δp bars colored by the verdict rules.
+VERDICT_COLORS = {'Weak': Fore.LIGHTRED_EX, NA: Fore.LIGHTWHITE_EX, 'Avg.': Fore.LIGHTYELLOW_EX,
+                  'Above Avg.': Fore.LIGHTCYAN_EX, 'Strong': Fore.LIGHTGREEN_EX, NULL: fg.silver}
+DELTA_COLORS = {'white': Style.BRIGHT + Fore.WHITE, 'red': Style.BRIGHT + Fore.RED, 'silver': Style.NORMAL + fg.silver,
+                'yellow': Style.BRIGHT + Fore.LIGHTYELLOW_EX, 'magenta': Style.BRIGHT + Fore.LIGHTMAGENTA_EX,
+                'green': Style.BRIGHT + Fore.LIGHTGREEN_EX}
+dataset = None # The selected dataset parsed once by csv_analyzer() and reused by the analysis steps.
 
 def csv_analyzer():
 #-------------------------------------
 # Open the QFLCA "*.csv" for analysis. 
 #-------------------------------------
-   global pngfile
-
-   with open(fileresult[idx-1], 'r') as x:
-         pngfile=Path(f'{fileresult[idx - 1]}').stem
-         sample_data = list(csv.reader(x, delimiter=","))
-         print(Fore.RED + Back.YELLOW +
-               f'Sample_data initiated... selected file for analysis from index value = 0 to {len(entries)-1} is: {idx}', sep="\n")
-         print(Fore.CYAN + Back.RESET + '\033[1;4m' + '- User menu options are limited to Basic QFLCC program options.'+ '\033[0m')
-         print(Fore.LIGHTCYAN_EX + '\033[1;4m' + '- Table data list:' + '\033[0m'+ Fore.RED + Back.CYAN + Fore.RED)
-         subprocess.call([f'{pngfile}.png'], shell=True) # After stem from the selected csv filename, show the relevant 
-                                                         # histogram and circuit with the csv file being analyzed.
-         subprocess.call([f'{pngfile}_H.png'], shell=True) 
-         sample_data = np.array(sample_data) # Import the P data into an array. 
-         print(sample_data) 
-         
-         for row in sample_data:
-                y=row[0]  # Store array's element value in y before converting csv left column data to a float value. 
-                print(row[0] + Back.GREEN)
+   global pngfile, dataset
+
+   dataset = load_dataset(fileresult[idx-1]) # Parse the selected dataset export once for all analysis steps.
+   pngfile=Path(f'{fileresult[idx - 1]}').stem
+   sample_data = dataset.rows()
+   print(Fore.RED + Back.YELLOW +
+         f'Sample_data initiated... selected file for analysis from index value = 0 to {len(entries)-1} is: {idx}', sep="\n")
+   print(Fore.CYAN + Back.RESET + '\033[1;4m' + '- User menu options are limited to Basic QFLCC program options.'+ '\033[0m')
+   print(Fore.LIGHTCYAN_EX + '\033[1;4m' + '- Table data list:' + '\033[0m'+ Fore.RED + Back.CYAN + Fore.RED)
+   subprocess.call([f'{pngfile}.png'], shell=True) # After stem from the selected csv filename, show the relevant 
+                                                   # histogram and circuit with the csv file being analyzed.
+   subprocess.call([f'{pngfile}_H.png'], shell=True) 
+   sample_data = np.array(sample_data) # Import the P data into an array. 
+   print(sample_data) 
+   
+   for row in sample_data:
+          y=row[0]  # Store array's element value in y before converting csv left column data to a float value. 
+          print(row[0] + Back.GREEN)
      ##############################################
 # Getting the current work directory (cwd).
 filesFlag = 0
@@ -815,8 +832,8 @@ def file_ext_call():
           print("Image file to view...")
           filesFlag==0
           break
-     elif file_extension=='.csv':
-          print("*.csv being read for analysis...")
+     elif file_extension in READERS: # Any dataset export with a registered reader, e.g. *.csv, *.json, *.htm.
+          print(f"*{file_extension} being read for analysis...")
           csv_analyzer()
           filesFlag==1
           break
@@ -838,34 +855,32 @@ print('Next data item...')
 prompt()
 
 def dataframe():
-  global sample_data, df, df2, dfMin
+  global sample_data, df, df2, dfMin, dataset
   ####################################################################
   # Setting up the the first dataframe classification and analysis of
   # maximum and minimum P's on the selected file (dataset) by the user. 
   # This step is executed prior to a deeper analysis for QFLCA and QDF 
   # circuit's dataset.
   ####################################################################
-  sample_data = np.genfromtxt(fileresult[idx-1], delimiter=',', skip_header=1) #, dtype=(None, str)) 
-  #, skip_header=True) #, dtype=None) # Attributes to expand dataframe classification and analysis. 
+  if dataset is None or (Path(dataset.path).with_suffix('') 
+                         != Path(fileresult[idx-1]).with_suffix('')): # Reuse the dataset parsed by csv_analyzer() unless another file is selected.
+       dataset = load_dataset(fileresult[idx-1])
+  sample_data = dataset.probs # Attributes to expand dataframe classification and analysis. 
   print("========================================================================")
-  print (bg.orange + fg.black +"Min value element of Table: ", sample_data.min(axis=0)[1])
+  print (bg.orange + fg.black +"Min value element of Table: ", dataset.p_min)
   
-  df = pd.read_csv(fileresult[idx-1]) 
+  df = dataset.to_frame() 
   print(df.iloc[0,0:3]) # Classified data from the dataframe df.
   print("========================================================================")
-  print ("Max value element of Table: ", sample_data.max(axis=0)[1]) # Second csv column values are compared.
-  df.max(axis=0)[1] # Will return max value of each column.
+  print ("Max value element of Table: ", dataset.p_max) # Second csv column values are compared.
   
-  # Using DataFrame.query() method...
-  df2 = df.query('probability == probability.max()')
+  # Max and min P rows from the cached argmax/argmin of the dataset.
+  df2 = dataset.max_rows()
   print("Max P with its qubit/cbit list element:", df2)
   
-  dfMin = df.query('probability == probability.min()')
+  dfMin = dataset.min_rows()
   print("Min P with its qubit/cbit list element:", dfMin)
-  
-  for row in sample_data:
-        if row[1] == sample_data.max(axis=0)[1]: #'0.67578125 from e.g., QFLCA_02 csv file':
-              print(df2, row[1])
+  print(df2, dataset.p_max) #'0.67578125 from e.g., QFLCA_02 csv file'
 
 dataframe()
 
@@ -874,13 +889,13 @@ def PAnalysis():
 # P analysis of the selected dataset. #
 #######################################
       global df2, df3
-      if  (sample_data.max(axis=0)[1] < 0.5 and sample_data.max(axis=0)[1] > 0.2):  # Conditions to 
+      if  (dataset.p_max < 0.5 and dataset.p_max > 0.2):  # Conditions to 
           # assign values to e.g., a weak classical min(∆P) = max(P) of a quantum outcome range (from 
           # the qubit dataset). Complement here is min(P) of the dataset if the user inputs for the opposition. 
            df2=df.loc[((df['probability'] < 0.5) & (df['probability'] > 0.27)), :].binary_string[:]
            df3=df.loc[((df['probability'] < 0.5) & (df['probability'] > 0.27)), :].probability[:] # Classify 
            # in the given included range of n:m
-      elif (sample_data.max(axis=0)[1] < 1 and sample_data.max(axis=0)[1] >= 0.5):  # Conditions to assign values 
+      elif (dataset.p_max < 1 and dataset.p_max >= 0.5):  # Conditions to assign values 
             # to e.g., a strong classical max(∆P) = min(P) of a quantum outcome range (from the qubit dataset). 
             # Complement here is max(P) of the dataset if the user inputs for the opposition.
            df2=df.loc[((df['probability'] < 1) & (df['probability'] >= 0.5)), :].binary_string[:]
@@ -888,7 +903,7 @@ def PAnalysis():
 
 def qdf_PAnalysis():
  global qdf, bitpair, df2bin, df3Mem, dfcomp, bitcomp # Main global variables to compute classical bit and qubit P's.
- if (sample_data.max(axis=0)[1] < 1):             
+ if (dataset.p_max < 1):             
     PAnalysis() 
     print(Fore.GREEN + Back.RESET + 'Strong Prediction binary string is: ' + Fore.YELLOW,  
           df2.to_string(index=False, header=False) + Fore.GREEN + ', with a P value of' 
@@ -897,31 +912,13 @@ def qdf_PAnalysis():
     ### 
     df2bin= df2.to_string(index=False, header=False)
      
-    qdf0=[df2bin[i:i+2] for i in range(math.floor(len(df2bin)/2)-1, math.ceil(len(df2bin)), 2)] # Use this formula 
-    # to satisfy conditions of relevant outer binary string relative to central bit-pair according to Eq. (20) or 
-    # Ref. [1] of the current Elsevier J. paper (given your/the QDF circuit design)...
-    qdf1=[df2bin[i:i+2] for i in range(math.floor(len(df2bin)/2), math.ceil(len(df2bin)), 2)]
-    qdf2=[df2bin[i:i+2] for i in range(math.floor(len(df2bin)/2)-1, math.ceil(len(df2bin)), math.floor(len(df2bin)/2))]
-    
-    qdf= qdf0 or qdf1 or qdf2 # Dynamic assignment of either df2bin range.
-
-    if len(df2bin) <= 6 and qi_f == 1: # This if statement is designed to analyze QI dataset. One or more if statements 
-         # needed to be added for IBMQ or different circuit/dataset configurations with their recorded binary strength 
-         # lengths in their tables (their *.csv structure).
-         print(Fore.GREEN + 'Paired qubit (left list element) relative to classical bit output (right list element): '
-               + Fore.YELLOW, qdf0)
-         qdf= qdf0  # Assign resultant value of qdf0 to qdf.  
-    elif len(df2bin) > 6 and qi_f == 1: 
-         print(Fore.GREEN + 'Paired qubit (left list element) relative to classical bit output (right list element): '
-               + Fore.YELLOW, qdf1)
-         qdf= qdf1  # Assign resultant value of qdf1 to qdf.
-    else:  # Depending on QDF circuit design and configuration, more elif statements can be added to suit a bit-pair 
-           # count and string foci as the one designed under IBMQ platform compared to QI (or QInspire) platform.    
-         print(Fore.GREEN + 'Paired qubit (left list element) relative to classical bit output (right list element): '
-               + Fore.YELLOW, qdf2) # Focus on the maximum from the middle qubit pair, if we put i+3, is to denote 
-               # a pair + 1 qubit denoting up to three particles involved e.g. a photon Alice, Bob and the prize entangled. 
-               # Iterate over a range of bins that are multiples of 2 (i.e. the size of the split substrings) for row in sample_data:
-         qdf= qdf2  # Assign resultant value of qdf2 to qdf. 
+    # Focused qubit pairs of the max P binary string, relative to the central bit-pair according to Eq. (20) of 
+    # Ref. [1] of the current Elsevier J. paper (given your/the QDF circuit design), by the same pair extraction 
+    # engine as QFLCC_batch.py. The qdf0 (QI, length <= 6), qdf1 (QI, length > 6) or qdf2 (IBMQ or other circuit 
+    # configurations) layout is picked by qdf_layout() in QFLCC_bits.py; add a layout there for other designs.
+    pair_codes, cbit, qdf = row_pairs(dataset.bits, dataset.argmax, qi=qi_f == 1)
+    print(Fore.GREEN + 'Paired qubit (left list element) relative to classical bit output (right list element): '
+          + Fore.YELLOW, qdf)
   
     if dir_flag == 0:
          prompt() 
@@ -941,7 +938,7 @@ the rightmost bit is for the measured qubit with the lowest index (q[0]). The le
 as the most significant qubit.\n-* Measurement focuses on QDF circuit bit pairs given the circuit configuration \
 == focus on the maximum from the middle qubit pair in a list of measurement results. The program loop iterates over a range of \
 bins that are multiples of 2 (i.e. the size of the split substrings) for row in sample_data...'+ Fore.YELLOW) 
-    df2list = qdf0 or qdf1 or qdf2 
+    df2list = qdf 
     qubit_print=''
     if '01' in df2list[:-1]: # Print the verdict on the one element prior last.
           print(fg.yellow+'{P_|01>b(01)} = 1 == ES')
@@ -962,16 +959,16 @@ bins that are multiples of 2 (i.e. the size of the split substrings) for row in
     if '1b' in df2list[:]: 
           print(bg.orange + fg.lightgreen, qubit_print, Back.RESET + fg.lightgreen + "The binary string "+ Fore.YELLOW  
                 + "\'..1b\' (classical bit)" + fg.lightgreen + " ends upon the least significant qubit (rightmost qubit).") 
+    report = pair_report(dataset.bits, dataset.probs, qi=qi_f==1) # P mass of every focused pair state over all outcomes.
+    print(fg.green+'P mass of the focused pair states over all outcomes: '+fg.yellow
+          +', '.join(f'|{pair}>={mass:.4f}' for pair, mass in zip(('00', '01', '10', '11'), report.state_mass))
+          +fg.green+', classical bit 0b/1b: '+fg.yellow+f'{report.cbit_mass[0]:.4f}/{report.cbit_mass[1]:.4f}')
 
     dfcomp = 1-df3  # Calculation of the P complement for the bitpair. 
     np.seterr(all="ignore") # Suppress irrelevant/outdated floating point numpy errors. 
 
-    for bit in df2:
-         if bit == "1":
-             bit == "0"
-         else:
-             bit == "1"
-    bitcomp = bit.replace("1", "2").replace("0", "1").replace("2", "0")
+    bitcomp = BitColumn.from_strings(df2).complement().to_strings()[-1] # Complement of the (last) binary string 
+                                                                        # on its packed bits.
 
     if len(df2bin)>0 and qi_f==1: 
          # The following lines cover the bitpair property between the qdf0 to qdf1 or qdfn as assigned above (as replaced bits).
@@ -994,7 +991,7 @@ bins that are multiples of 2 (i.e. the size of the split substrings) for row in
                +fg.yellow, bitpair, fg.green+"has a P' value of"+ Fore.LIGHTRED_EX, dfcomp.to_string(index=False, header=False))
  else: 
     print(fg.red+'Erroneous or Tied P values!') 
-    subprocess.run(["python", "QAI-LCode_QFLCC.py"])  # Restart program. 
+    restart()  # Restart program. 
 
  """ Complex code alternative for the line:
  if len(df2bin)>0 and qi_f==1:
@@ -1068,10 +1065,11 @@ def sim_log():
  
  entry_stage += 1
  idxplus = len(res) + entry_stage
- subprocess.run("echo {}- Checkpoint logged on {} for file # {}\
+ qflcc_log.log("{}- Checkpoint logged on {} for file # {}\
  as {} parallel to simulation run file {{ QDF-LCode_IBMQ-2024-codable }}, \
  Simulation State ///--{}--///".format(idxplus, now.strftime("%Y-%m-%d %H:%M:%S"), 
-                                       idx, fileresult[idx-1], sim_state), shell=True, stdout=file_)
+                                       idx, fileresult[idx-1], sim_state), 
+               stage='simulation', dataset=fileresult[idx-1], entry=entry_stage, state=sim_state[0], flush=True)
  """End of simulation log."""
 
 def PAnalysis_model():
@@ -1114,7 +1112,9 @@ def PAnalysis_model():
  sim_state[0] = " QDF CIRCUIT SIMULATION BEGINS "
  sim_log() 
  #---------------------------------------------------------------------------------------------------------------------
- ibm_qdf_module = importlib.import_module("QDF-LCode_IBMQ-2024-codable") # Unconventional call from the targeted module.      
+ ibm_qdf_module = importlib.import_module("QDF-LCode_IBMQ-2024-codable") # Unconventional call from the targeted module,
+                  # imported once with no side effects.      
+ ibm_qdf_module.main() # Build, run and plot the IBM QDF circuit (its result is cached by circuit and shots for reuse).
  bar(1.)
  #---------------------------------------------------------------------------------------------------------------------
  # Log the prompt of simulation to the user to proceed, restart or exit program.
@@ -1150,49 +1150,25 @@ def PAnalysis_model():
 
  print(Back.LIGHTGREEN_EX + Fore.YELLOW + "\033[1m<--- QDF CIRCUITS SIMULATION_DATASET_ANALYSIS BEGINS --->\033[0m" + Back.RESET)
 
- ibmq_result = 'ibm-qdf-stats.txt'
- with open(ibmq_result, 'r') as file:    
-        # Read the contents of the file
-        content = file.read()
-        
-        # Extract all the p values from the content as float.
-        N = re.findall(r'[-+]?(?:\d*\.*\d+)', content) 
-        n_list = list(map(float, N)) 
-
-        # Convert all the metadata digits to str to sort out binaries.
-        bin_list = list(map(str, N))  # This is to identify qubit binary strings. 
-
-        # Calculate quantum event p's for the total P.
-        P = n_list[0]  # The P result is stored to the p_list.
-        p1 = n_list[1] # 1st p result is stored to the p_list.
-        pq1 = bin_list[4]
-        p2 = n_list[2] # 2nd p result is stored to the p_list.
-        pq2 = bin_list[5]
-        p3 = n_list[3] # 3rd p result is stored to the p_list.
-        pq3 = bin_list[6]
-
- ibmq_p_max = max(p1, p2, p3)  # Identify the max value from the p list.
- max_p_index = n_list.index(ibmq_p_max) # Store the index value for p_max from the ibmq_result file.
-
- ibmq_p_min = min(p1, p2, p3)  # Identify the min value from the p list.
- min_p_index = n_list.index(ibmq_p_min) # Store the index value for p_min from the ibmq_result file.
+ ibmq_result = STATS_FILE
+ ibmq_stats = ibm_qdf_module.result_exp.to_dataset(name=ibmq_result) # Every outcome of the IBM QDF circuit run above, 
+                                                                        # the same P's as plotted and saved.
+ P = round(float(ibmq_stats.probs.sum()), 6) # The P result summed over all outcomes.
+
+ ibmq_p_max = ibmq_stats.p_max  # Identify the max value from the p list.
+ max_p_index = ibmq_stats.argmax + 1 # Store the sample set number of p_max from the ibmq_result file.
+
+ ibmq_p_min = ibmq_stats.p_min  # Identify the min value from the p list.
+ min_p_index = ibmq_stats.argmin + 1 # Store the sample set number of p_min from the ibmq_result file.
  
  # Set the default p color codes to 'white' as defined below in the p_color list until an if condition applies.
- p_color = [Style.BRIGHT + Fore.WHITE, Style.BRIGHT + Fore.WHITE, Style.BRIGHT + Fore.WHITE,
-            Style.BRIGHT + Fore.WHITE, Style.BRIGHT + Fore.WHITE]
+ p_color = [Style.BRIGHT + Fore.WHITE for i in range(len(ibmq_stats))]
  
- if round(p1, 2) <= round(ibmq_p_min, 2): # Classify/color code min(p1).      
-      p_color[0] = Style.BRIGHT + Fore.RED 
- if round(p2, 2) <= round(ibmq_p_min, 2): # Classify/color code min(p2). 
-      p_color[1] = Style.BRIGHT + Fore.RED
- if round(p3, 2) <= round(ibmq_p_min, 2): # Classify/color code min(p3). 
-      p_color[2] = Style.BRIGHT + Fore.RED
- if round(p1, 2) >= round(ibmq_p_max, 2): # Classify/color code max(p1).      
-      p_color[0] = Style.BRIGHT + Fore.CYAN
- if round(p2, 2) >= round(ibmq_p_max, 2): # Classify/color code max(p2). 
-      p_color[1] = Style.BRIGHT + Fore.CYAN
- if round(p3, 2) >= round(ibmq_p_max, 2): # Classify/color code max(p3). 
-      p_color[2] = Style.BRIGHT + Fore.CYAN
+ for i, p in enumerate(ibmq_stats.probs): 
+      if round(p, 2) <= round(ibmq_p_min, 2): # Classify/color code min(p).      
+           p_color[i] = Style.BRIGHT + Fore.RED 
+      if round(p, 2) >= round(ibmq_p_max, 2): # Classify/color code max(p).      
+           p_color[i] = Style.BRIGHT + Fore.CYAN
 
  print(f"{Fore.LIGHTMAGENTA_EX}{hline}\nPlot = [{Fore.LIGHTGREEN_EX}P samples of the IBMQ model circuit,\
  if meets {Fore.LIGHTYELLOW_EX} ∝ {Fore.LIGHTGREEN_EX} p of the selected dataset file\
@@ -1212,8 +1188,8 @@ def PAnalysis_model():
  print(f'''{Fore.LIGHTMAGENTA_EX}\n\033[4m<-- P Results Sampled from {{ {ibmq_result} }} file are: -->\033[0m''')
  with alive_bar(3, bar = 'blocks' , manual=True) as bar:
   model_fig = tpl.figure() # Now plot histogram with horizontal bars for the computed probabilities.
-  model_fig.barh([P, p1, p2, p3], [Style.BRIGHT + Fore.LIGHTGREEN_EX+"P(Total)", p_color[0]+f"ibmq qdf p({bin_list[4]})",  
-                             p_color[1]+f"ibmq qdf p({bin_list[5]})", p_color[2]+f"ibmq qdf p({bin_list[6]})"], 
+  model_fig.barh([P] + ibmq_stats.probs.tolist(), [Style.BRIGHT + Fore.LIGHTGREEN_EX+"P(Total)"] 
+                 + [p_color[i]+f"ibmq qdf p({bits})" for i, bits in enumerate(ibmq_stats.bins)], 
          force_ascii=False), sleep(1) 
   model_fig.show(), sleep(1)
   print('')
@@ -1223,18 +1199,8 @@ def PAnalysis_model():
   #-------------------------------------------------------------------------------------
   # Now classify and print which sampled qdf_bit_pair set from the 
   # ibmq_result file is max_p and which min_p. 
-  if min_p_index == 1:
-   qdf_bit_pairs[0] = pq1
-  if min_p_index == 2:
-   qdf_bit_pairs[0] = pq2  
-  if min_p_index == 3:
-   qdf_bit_pairs[0] = pq3
-  if max_p_index == 1:
-   qdf_bit_pairs[1] = pq1
-  if max_p_index == 2:
-   qdf_bit_pairs[1] = pq2  
-  if max_p_index == 3:
-   qdf_bit_pairs[1] = pq3
+  qdf_bit_pairs[0] = ibmq_stats.min_bin
+  qdf_bit_pairs[1] = ibmq_stats.max_bin
 
  print(Fore.YELLOW+f'{hline}') 
  print(fg.purple+f'*- min(P) from {{ {ibmq_result} }} is performed by the QDF bit pairs\
@@ -1245,68 +1211,25 @@ def PAnalysis_model():
  #-----------------------------------------------------------------------------------------------------------
  # Recall and store which binary string had the minimum P from the table of the selected dataset (dataframe).
  global df_min, df_min_bin  
- if  (sample_data.min(axis=0)[1] < 1):  
-           df_min=df.loc[(df['probability'] <= sample_data.min(axis=0)[1]), :].binary_string[:]
+ if  (dataset.p_min < 1):  
+           df_min=df.loc[(df['probability'] <= dataset.p_min), :].binary_string[:]
            df_min_bin = df_min.to_string(index=False, header=False) 
  #-----------------------------------------------------------------------------------------------------------
  deltaMatch_max = (1 - abs(ibmq_p_max - float(df3Mem)) ) # Calculate Δp of max(P) Match. 
- deltaMatch_min = (1 - abs(ibmq_p_min - sample_data.min(axis=0)[1]) ) # Calculate Δp of min(P) Match. 
- delta_p_min = abs(ibmq_p_min - sample_data.min(axis=0)[1]) # Calculate Δp of min(P).  
+ deltaMatch_min = (1 - abs(ibmq_p_min - dataset.p_min) ) # Calculate Δp of min(P) Match. 
+ delta_p_min = abs(ibmq_p_min - dataset.p_min) # Calculate Δp of min(P).  
  delta_p_max = abs(ibmq_p_max - float(df3Mem)) # Calculate Δp of max(P).  
  
- Valid_Verdict = ['Weak',f'{{∞ , ⁿ/ₐ}}', 'Avg.', 'Strong', '␀']  # Validation Verdict of a strong
-                                                              # vs. weak correlation match between 
-                                                              # the selected file dataset p's and the IBM QDF 
-                                                              # circuit event p's... 
+ # Validation Verdict of a strong vs. weak correlation match between the selected file dataset p's and the 
+ # IBM QDF circuit event p's, classified/color coded by the threshold table of QFLCC_verdict.py (first holding rule wins). 
  # Note: A verdict of ␀ denotes missing information or unknown about the max or min of the p's 
  # (calculable if config is corrected or complemented).
-  
- if round(deltaMatch_max, 2) >= 0 and round(deltaMatch_max, 2) < 0.5: # Classify/color code max Δp match.      
-      p_color[3] = Style.BRIGHT + Fore.RED
-      Valid_Verdict = Fore.LIGHTRED_EX + Valid_Verdict[0] 
- 
- if round(deltaMatch_max, 2) >= 0.5 and round(deltaMatch_max, 2) <= 0.55: # Classify/color code max Δp match.      
-      p_color[3] = Style.NORMAL + fg.silver
-      Valid_Verdict = Fore.LIGHTWHITE_EX + Valid_Verdict[1] 
-
- if round(deltaMatch_min, 2) >= 0 and round(deltaMatch_min, 2) < 1/3: # Classify/color code min Δp match.      
-      p_color[4] = Style.BRIGHT + Fore.RED
-      Valid_Verdict = Fore.LIGHTRED_EX + Valid_Verdict[0] 
- 
- if (round(deltaMatch_min, 2) <= 1/3 and 
-     round(deltaMatch_max, 2) <= 1/3) or (round(deltaMatch_min, 2) <= 1/2 and 
-                                          round(deltaMatch_max, 2) <= 1/2): # Classify/color code min-max Δp match.      
-      p_color[3] = Style.NORMAL + fg.silver
-      p_color[4] = p_color[3]
-      Valid_Verdict = Fore.LIGHTWHITE_EX + Valid_Verdict[1] 
-
- if round(deltaMatch_max, 2) > 0.55 and round(deltaMatch_max, 2) < 0.66: # Classify/color code max Δp match.      
-      p_color[3] = Style.BRIGHT + Fore.LIGHTYELLOW_EX
-      Valid_Verdict = Fore.LIGHTYELLOW_EX + Valid_Verdict[2] 
-      
- if (round(deltaMatch_max, 2) >= 0.66 and 
-     round(deltaMatch_max, 2) < 0.9) and (round(deltaMatch_min, 2) >= 0.66 and 
-                                          round(deltaMatch_max, 2) < 0.9): # Classify/color code min-max Δp match.       
-      p_color[3] = Style.BRIGHT + Fore.LIGHTMAGENTA_EX
-      p_color[4] = p_color[3]
-      Valid_Verdict = Fore.LIGHTCYAN_EX + 'Above ' + Valid_Verdict[2] 
-
- if (round(deltaMatch_max, 2) >= 0.9 and 
-     round(deltaMatch_max, 2) <= 1) and (round(deltaMatch_min, 2) >= 0.9 and 
-                                          round(deltaMatch_max, 2) <= 1): # Classify/color code min-max Δp match.      
-      p_color[3] = Style.BRIGHT + Fore.LIGHTGREEN_EX 
-      p_color[4] = p_color[3]
-      Valid_Verdict = Fore.LIGHTGREEN_EX + Valid_Verdict[3] 
- 
- if (round(deltaMatch_min, 2) <= 1/3 and 
-     round(deltaMatch_max, 2) <= 1/2) or (round(deltaMatch_min, 2) <= 1/2 and 
-                                           round(deltaMatch_max, 2) <= 1/2): # Classify/color code min-max Δp match.      
-      p_color[3] = Style.NORMAL + fg.silver
-      p_color[4] = p_color[3]
-      Valid_Verdict = fg.silver + Valid_Verdict[4] # See note for a ␀ verdict!
+ verdict_text, max_color, min_color = verdict(deltaMatch_min, deltaMatch_max)
+ delta_color = [DELTA_COLORS[max_color], DELTA_COLORS[min_color]]
+ Valid_Verdict = VERDICT_COLORS[verdict_text] + verdict_text # See note for a ␀ verdict!
 
  PAnalysis_fig = tpl.figure() # Now plot histogram with horizontal bars for the computed probabilities of the two datasets.
- PAnalysis_fig.barh([P, float(df3Mem), float(dfcompMem), sample_data.min(axis=0)[1], ibmq_p_min, ibmq_p_max,  
+ PAnalysis_fig.barh([P, float(df3Mem), float(dfcompMem), dataset.p_min, ibmq_p_min, ibmq_p_max,  
                      delta_p_min, delta_p_max, deltaMatch_min, deltaMatch_max], 
      [Style.BRIGHT + Fore.LIGHTGREEN_EX + f"P(\x1B[4mTotal\x1B[0m{Style.BRIGHT + Fore.LIGHTGREEN_EX})", 
       f'{Style.BRIGHT+Fore.WHITE}{{ {fileresult[filenum-1]} }} max(P(\x1B[4m{df2bin}\x1B[0m{Style.BRIGHT+Fore.WHITE}))', 
@@ -1314,10 +1237,10 @@ def PAnalysis_model():
       Style.BRIGHT + Fore.WHITE + f"{{ {fileresult[filenum-1]} }} min(P(\x1B[4m{df_min_bin}\x1B[0m{Style.BRIGHT + Fore.WHITE}))",  
       f"{Style.BRIGHT +  Fore.YELLOW}{{ ibm qdf }} min((P(\x1B[4m{qdf_bit_pairs[0]}\x1B[0m{Style.BRIGHT + Fore.YELLOW})) ",
       f"{Style.BRIGHT +  Fore.YELLOW}{{ ibm qdf }} max((P(\x1B[4m{qdf_bit_pairs[1]}\x1B[0m{Style.BRIGHT + Fore.YELLOW})) ",
-      p_color[4] + "Δp of \x1B[4mmin(P)\x1B[0m" + p_color[4], 
-      p_color[3] + f"Δp of \x1B[4mmax(P)\x1B[0m" + p_color[3], 
-      p_color[4]+ "Δp of\x1B[4m min(P) match\x1B[0m" + p_color[4], 
-      p_color[3]+ "Δp of\x1B[4m max(P) match\x1B[0m" + p_color[3]], force_ascii=False), sleep(1)
+      delta_color[1] + "Δp of \x1B[4mmin(P)\x1B[0m" + delta_color[1], 
+      delta_color[0] + f"Δp of \x1B[4mmax(P)\x1B[0m" + delta_color[0], 
+      delta_color[1]+ "Δp of\x1B[4m min(P) match\x1B[0m" + delta_color[1], 
+      delta_color[0]+ "Δp of\x1B[4m max(P) match\x1B[0m" + delta_color[0]], force_ascii=False), sleep(1)
  PAnalysis_fig.show()
  bar(1.)
  
@@ -1327,6 +1250,22 @@ def PAnalysis_model():
 \033[4m{Valid_Verdict + ' Match {{ '+ str(round(deltaMatch_min, 2)) +' , '+ str(round(deltaMatch_max, 2)) +' }}'}\033[0m\
 {Fore.LIGHTYELLOW_EX}")
  
+ # Confidence of the Δp verdict under shot noise: bootstrap intervals of both matches, the share of
+ # resampled runs giving the same verdict, and an equality test of the two outcome distributions
+ # lined up on their common qubits. Exact P's of the IBM QDF circuit (no shots) are not resampled.
+ common = AlignmentIndex(min(int(ibmq_stats.bits.widths.min()), int(dataset.bits.widths.min())))
+ _, aligned_p = support_matrix([ibmq_stats, dataset], key=lambda d: common.aligned(d.bits).to_strings())
+ # The min/max P's are those the verdict above is classified from; a fixed seed gives the same shares on every run.
+ confidence = match_confidence(ibmq_stats.probs, dataset.probs, ibmq_stats.shots, dataset_shots(dataset),
+                               aligned=(aligned_p[0], aligned_p[1]), seed=CONFIDENCE_SEED,
+                               points=((ibmq_p_min, ibmq_p_max), (dataset.p_min, float(df3Mem))))
+ print(f"{Fore.LIGHTMAGENTA_EX}*- Δp Confidence: {fg.yellow}{confidence}\
+ \n   {Fore.LIGHTCYAN_EX}{confidence.level:.0%} CI of {{ {fileresult[filenum-1]} }} max(P) {confidence.outcome_text('data', dataset.argmax)},\
+ min(P) {confidence.outcome_text('data', dataset.argmin)}; {{ ibm qdf }} max(P) {confidence.outcome_text('ref', ibmq_stats.argmax)},\
+ min(P) {confidence.outcome_text('ref', ibmq_stats.argmin)}\
+ \n   {Fore.LIGHTCYAN_EX}{confidence.share(verdict_text):.0%} of resampled runs give the same verdict; the two distributions\
+ {'differ beyond' if confidence.significant() else 'are within'} shot noise.{Fore.LIGHTYELLOW_EX}")
+
  DeltaP_verdict = Valid_Verdict
  Valid_Verdict = ['Weak',f'{{∞ , ⁿ/ₐ}}', 'Avg.', 'Strong', '␀']  # Reset Valid_Verdict list elements upon 
                                                                   # the previously rendered verdict. 
@@ -1339,10 +1278,10 @@ def PAnalysis_model():
  vv_circuits =[False]  
  vv_bins = [False] 
  # Validation Verdict on the two circuits qubit string sets over min and max P's as compared for a match. 
- if re.match(s2, s1):
+ if bins_match(s1.split()[0], s2): # Compared on the common qubits of the two register layouts.
      vv_bins = fg.lightgreen+ Valid_Verdict[3]
      qdf_s_match = f"{{ {s1} , {s2} }}"
- elif re.match(s4, s3):
+ elif bins_match(s3.split()[0], s4): # df2bin lists every row in the max P range, one per line.
      vv_bins = fg.lightgreen + Valid_Verdict[3]
      qdf_s_match = f"{{ {s3} , {s4} }}"
  else:
@@ -1362,7 +1301,7 @@ def PAnalysis_model():
  if ((vv_bins == fg.red + 
       Valid_Verdict[4]) or (vv_bins == fg.lightgreen + Valid_Verdict[3])) and (DeltaP_verdict == fg.silver + Valid_Verdict[4]):
       vv_circuits = f'{{ {fg.lightred + Valid_Verdict[4]} , {False} }}' # A ␀ or false match verdict! See also next line/condition.
- if (float(df3Mem) <= 1/3 and sample_data.min(axis=0)[1]<= 1/3) and (ibmq_p_max >= 1/2):
+ if (float(df3Mem) <= 1/3 and dataset.p_min<= 1/3) and (ibmq_p_max >= 1/2):
      vv_circuits = f'{fg.lightred}{{ {Valid_Verdict[4]} , {fg.yellow}{Valid_Verdict[1]}{fg.lightred} }}' # A ␀ match verdict! In short,
       # a state transition matrix with all elements between certain circuit components return a 0 state or null match and 
       # state 2 for one of the two circuits! See P's preliminary analysis for the measured QDF circuit. 
@@ -1380,7 +1319,7 @@ def PAnalysis_model():
 
  # Log validation verdict results on simulation and dataset analysis.
  entry_stage = 2  
- sim_state[0] = f"Δp Data: {Valid_Verdict}, QDF Qubit Sets: {vv_bins + ' Match ' + qdf_s_match},  QDF Circuits: {vv_circuits} Match"
+ sim_state[0] = f"Δp Data: {Valid_Verdict}, Δp Equality p: {confidence.p_value:.3g}, QDF Qubit Sets: {vv_bins + ' Match ' + qdf_s_match},  QDF Circuits: {vv_circuits} Match"
  sim_log()
 
  print(f"{hline + Fore.LIGHTMAGENTA_EX}\n *- The IBM QDF circuit can be reconfigured for worst and best case Hamiltonian scenarios,\
@@ -1518,9 +1457,9 @@ def entry_add():
      global entry_stage  # Redefine the entry count as global.
      entry_stage+=1
      idxplus = len(res)+entry_stage
-     subprocess.run("echo {}- Checkpoint logged on {} for the QFLCC Game:\
+     qflcc_log.log("{}- Checkpoint logged on {} for the QFLCC Game:\
  Alice and Bob's Quantum Doubles {}".format(idxplus, now.strftime("%Y-%m-%d %H:%M:%S"), __game_version__), 
- shell=True, stdout=file_)
+ stage='game')
 
 entry_add()
 
@@ -1649,7 +1588,7 @@ def restart_QFLCC():
    #root.iconify()
    win_min == True
    flagClose() # An option to choose between destroying/quit the present form. 
-   subprocess.run(["python", "QAI-LCode_QFLCC.py"])
+   restart()  # Restart program.
 
 ##################################################################################
 # Mimic an animated GIF displaying a series of GIFs an animated GIF was used to 
@@ -1723,6 +1662,7 @@ def update_text():
 def change_color():
    my_label0.config(bg= "gray51", fg= "red")
 
+qflcc_log.flush() # Write the buffered entries before the log is shown.
 f = open("shell_output.txt", "r")
 file_string = f.read()
 schar = ' '
@@ -1860,9 +1800,9 @@ def winner_show():
 def winner_next():
              entry_add()
              level_show()
-             subprocess.run('echo "{}- ///--- Win Entry --- \
-{} /// Level: {} Scored: {} at {}"'.format(entry_stage, excited2, levels, points, now.strftime("%Y-%m-%d %H:%M:%S")), 
-shell=True, stdout=file_)  # Date last I/O file entry.
+             qflcc_log.log('{}- ///--- Win Entry --- \
+{} /// Level: {} Scored: {} at {}'.format(entry_stage, excited2, levels, points, now.strftime("%Y-%m-%d %H:%M:%S")), 
+stage='game', level=levels, points=points)  # Date last I/O file entry.
              print("\n",f'Next...'+fg.lightgreen+' Level:', levels, f'{here}'+fg.orange) 
 
 def loser_show():
@@ -1882,9 +1822,9 @@ def loser_show():
 def loser_next():
              entry_add() # Reopen log file and register an event entry.
              level_show()
-             subprocess.run('echo "{}- ///--- Lose Entry --- {} /// Level: {} \
-Scored: {} at {}"'.format(entry_stage, grounded3, levels, points, now.strftime("%Y-%m-%d %H:%M:%S")), 
-shell=True, stdout=file_) # Date last I/O file entry.
+             qflcc_log.log('{}- ///--- Lose Entry --- {} /// Level: {} \
+Scored: {} at {}'.format(entry_stage, grounded3, levels, points, now.strftime("%Y-%m-%d %H:%M:%S")), 
+stage='game', level=levels, points=points) # Date last I/O file entry.
              print("\n",f'Next...'+fg.lightgreen+' Level:', levels, f'{here}'+fg.orange) 
 
 def dual_show():
@@ -1905,9 +1845,9 @@ def dual_next():
              sleep(1)
              entry_add()
              level_show()
-             subprocess.run('echo "{}- ///--- Dual Entry --- {} /// Level: {} \
-Scored: {} at {}"'.format(entry_stage, dual3, levels, points, now.strftime("%Y-%m-%d %H:%M:%S")), 
-shell=True, stdout=file_) # Date last I/O file entry.
+             qflcc_log.log('{}- ///--- Dual Entry --- {} /// Level: {} \
+Scored: {} at {}'.format(entry_stage, dual3, levels, points, now.strftime("%Y-%m-%d %H:%M:%S")), 
+stage='game', level=levels, points=points) # Date last I/O file entry.
              print("\n",f'Next...'+fg.lightgreen+' Level:', levels, f'{here}'+fg.orange) 
 
 def guesser_show():
@@ -1928,9 +1868,9 @@ def guesser_next():
              sleep(1)
              entry_add()
              level_show()
-             subprocess.run('echo "{}- ///--- Guesser Entry --- {} /// Level: {} \
-Scored: {} at {}"'.format(entry_stage, guesser3, levels, points, now.strftime("%Y-%m-%d %H:%M:%S")), 
-shell=True, stdout=file_) # Date last I/O file entry.
+             qflcc_log.log('{}- ///--- Guesser Entry --- {} /// Level: {} \
+Scored: {} at {}'.format(entry_stage, guesser3, levels, points, now.strftime("%Y-%m-%d %H:%M:%S")), 
+stage='game', level=levels, points=points) # Date last I/O file entry.
              print("\n",f'Next...'+fg.lightgreen+' Level:', levels, f'{here}'+fg.orange) 
 
 def helper_show():
@@ -1951,9 +1891,9 @@ def helper_next():
              sleep(1)
              entry_add()
              level_show()
-             subprocess.run('echo "{}- ///--- Helper Win Entry --- {} /// Level: {} \
-Scored: {} at {}"'.format(entry_stage, helperTarget1, levels, points, now.strftime("%Y-%m-%d %H:%M:%S")), 
-shell=True, stdout=file_) # Date last I/O file entry.
+             qflcc_log.log('{}- ///--- Helper Win Entry --- {} /// Level: {} \
+Scored: {} at {}'.format(entry_stage, helperTarget1, levels, points, now.strftime("%Y-%m-%d %H:%M:%S")), 
+stage='game', level=levels, points=points) # Date last I/O file entry.
              print("\n",f'Next...'+fg.lightgreen+' Level:', levels, f'{here}'+fg.orange) 
 
 def level_show():
@@ -2055,21 +1995,20 @@ def game_over():
              if j == 0:
                  uCommand = str(input(fg.lightcyan+"\n\r> "))
         if uCommand =='b' or keyboard.is_pressed("b"):
-            subprocess.run(["python", "QAI-LCode_QFLCC.py"])  # Restart program.
-            file_.close() # Close the log file recording events from the user's I/O terminal.
+            restart()  # Restart program, with the log file recording events from the user's I/O terminal written first.
         elif keyboard.is_pressed("r") or uCommand =='r': # keyboard.wait("r"):
             level_start()
         else: 
             print(bg.cyan+fg.red+'End of Program...'+ Back.RESET + Fore.RESET)
-            subprocess.run('echo "///--- QFLCC Shell Log_file HALT --- /// on {}"'.format(entry_stage, 
-                            now.strftime("%Y-%m-%d %H:%M:%S")), shell=True, stdout=file_) # Date last I/O file entry.
+            qflcc_log.log('///--- QFLCC Shell Log_file HALT --- /// on {}'.format(
+                          now.strftime("%Y-%m-%d %H:%M:%S")), stage='halt', flush=True) # Date last I/O file entry.
             sys.exit() # Game Over and HALT.       
 
 def level_next():
              entry_add()
-             subprocess.run('echo "///--- Level Entry --- {}{} ///, Level: {} Scored: \
-{} at {}"'.format(entry_stage, guesser3, levels, points, now.strftime("%Y-%m-%d %H:%M:%S")), 
-shell=True, stdout=file_) # Date last I/O file entry.
+             qflcc_log.log('///--- Level Entry --- {}{} ///, Level: {} Scored: \
+{} at {}'.format(entry_stage, guesser3, levels, points, now.strftime("%Y-%m-%d %H:%M:%S")), 
+stage='game', level=levels, points=points) # Date last I/O file entry.
 
 #########################################################################################
 # QAI functions to compare correlated values based on User Input and weight them through 
@@ -2403,7 +2342,7 @@ def promptGame():
                       stayIn() # To remain to make further volume change.
                       break      
              elif promptIn == 'b' or promptIn == 'begin':
-                  subprocess.run(["python", "QAI-LCode_QFLCC.py"])  # Restart program to analyze and validate a new dataset.
+                  restart()  # Restart program to analyze and validate a new dataset.
                   break
              elif promptIn == 'f' or promptIn == 'form':
                   print('Revisit dataset(s) form load & play [Temporal State]...☝ (° ͜ʖ ͡°)👉🗊 ⟵ ⛁ : '
@@ -17,13 +17,11 @@
 # Import the QISKit SDK... INstall Qiskit v.1 and update older ones < v.0.1 from above notes.  
 import termplotlib as tpl # To draw plots on circuit results during/after experiment. 
 import numpy as np
+import os
 import sys
-import re  # For search and spot regular expressions in {text, metadata, binary,...} I/O files.
 from time import sleep
-from qiskit import QuantumCircuit, ClassicalRegister, QuantumRegister
-from qiskit import *
-from qiskit_aer import Aer  # 2024 update... from its deprecated release.
 from colorama import Fore, Back, Style  # For colored text messages.
+from QDF_stats import STATS_FILE  # Structured QDF circuit stats file.
 #-----------------------------------------------------------------------------------------
 # Newly added package in 2023/2024, the U3 gate has been renamed the U gate.
 # from https://quantum-computing.ibm.com/composer/docs/iqx/operations_glossary
@@ -34,19 +32,54 @@ from colorama import Fore, Back, Style  # For colored text messages.
 # https://github.com/Qiskit/qiskit-terra/issues/4106
 #-----------------------------------------------------------------------------------------
 from math import pi
-from qiskit.compiler import transpile, assemble # In 2024, execute now is renamed to transpile. 
-from qiskit.visualization import *
-from qiskit.providers.backend import Backend # Specify backend device for data processing
-from qiskit_ibm_provider import IBMProvider  # 2024 update... from its deprecated release. 
+try:
+    from qiskit import QuantumCircuit, ClassicalRegister, QuantumRegister
+    from qiskit import *
+    from qiskit_aer import Aer  # 2024 update... from its deprecated release.
+    from qiskit.compiler import transpile, assemble # In 2024, execute now is renamed to transpile. 
+    from qiskit.visualization import *
+    from qiskit.providers.backend import Backend # Specify backend device for data processing
+    from qiskit_ibm_provider import IBMProvider  # 2024 update... from its deprecated release. 
+    QISKIT = True
+except ImportError:  # Offline analysis hosts run the QDF circuit on the built-in NumPy simulator.
+    QISKIT = False
+from QDF_sim import Circuit, QDFResult, build_qdf, circuit_key, sample_counts, probabilities, parallel_counts  # Lightweight NumPy statevector simulator of the QDF circuit.
+from QDF_cache import ResultCache, deterministic  # Persistent LRU cache of QDF circuit results.
+from QDF_noise import noisy_probabilities  # Depolarizing and readout noise trajectories of the QDF circuit.
+#-----------------------------------------------------------------------------------------
+# Backend to simulate the QDF circuit on: 'aer' for the Qiskit Aer qasm_simulator, or 
+# 'local' for the built-in QDF_sim.py statevector simulator (no Qiskit stack needed). 
+#-----------------------------------------------------------------------------------------
+backend = os.environ.get('QDF_BACKEND', 'aer' if QISKIT else 'local')
+# Mode of the reference P's: 'shots' samples counts of N shots, 'exact' computes the outcome P's analytically
+# (deterministic and reproducible, with no sampling noise in the Δp validation verdicts).
+# 'parallel' splits a large shot budget into seeded tasks on a process pool (see QDF_sim.parallel_counts). 
+# 'noisy' averages the outcome P's over Pauli trajectories of depolarizing gate noise plus readout flips 
+# (see QDF_noise.py), to set hardware noise apart from the circuit configuration in the Δp verdicts. 
+qdf_mode = os.environ.get('QDF_MODE', 'shots')
+qdf_shots = int(os.environ.get('QDF_SHOTS', 8192)) # Number of shots to run the program (experiment).
+qdf_seed = int(os.environ['QDF_SEED']) if os.environ.get('QDF_SEED') else None # Root seed for reproducible counts.
+# Process pool size of the 'parallel' mode. Windows starts workers by re-importing the main program, so the 
+# QFLCC program keeps to one process there unless QDF_WORKERS is set. 
+qdf_workers = int(os.environ.get('QDF_WORKERS', 1 if sys.platform == 'win32' else 0)) or None
+# Write the ibm-qdf-shell_output.bin counts and ibm-qdf-stats.csv table as side outputs of qdf_circuit(). 
+qdf_persist = os.environ.get('QDF_PERSIST', '1') != '0'
+# Noise rates of the 'noisy' mode: depolarizing P after single-qubit (QDF_P1) and multi-qubit (QDF_P2) gates, 
+# readout flip P of every classical bit (QDF_READOUT) and the number of trajectories (QDF_TRAJECTORIES). 
+qdf_noise = {'p1': float(os.environ.get('QDF_P1', 0.001)), 'p2': float(os.environ.get('QDF_P2', 0.01)),
+             'p01': float(os.environ.get('QDF_READOUT', 0.02)), 'trajectories': int(os.environ.get('QDF_TRAJECTORIES', 1024))}
+results = {}  # Results of run(), keyed by circuit definition and run settings, for reuse across analyses.
+# Keep exact and seeded results in the __qflcc_cache__/qdf folder, so an unchanged reference circuit is not 
+# simulated again after a program restart (QDF_CACHE=0 to disable, QDF_CACHE_SIZE entries at most). 
+qdf_cache = ResultCache(max_entries=int(os.environ.get('QDF_CACHE_SIZE', 256))) if os.environ.get('QDF_CACHE', '1') != '0' else None
 
-def qdf_circuit():  # Function to compose/build a QDF circuit.
- global qc    # Instantiate qc as a global variable to represent the quantum circuit.  
+def qiskit_qdf():  # Function to compose/build the QDF circuit in Qiskit.
  # Set your API Token. IBMQ.enable_account ('API Token') Create a Quantum Register with 
  # 4 qubits.
- q = QuantumRegister(4)
+ q = QuantumRegister(4, 'q') # Named registers, so the drawn circuit (and its run() key) is the same on every build.
  
  # Create a Classical Register with 4 bits.
- c = ClassicalRegister(4) # as _b in Fig. 6 of Ref. [1]
+ c = ClassicalRegister(4, 'c') # as _b in Fig. 6 of Ref. [1]
  
  # Create a Quantum Circuit.
  qc = QuantumCircuit(q, c)
@@ -129,6 +162,75 @@ def qdf_circuit():  # Function to compose/build a QDF circuit.
  qc.swap(q[1],q[2]).c_if(c, 2)   # SWAP gate is used if condition c=2 or 10 in binary
  qc.measure(q, c)  # Map the quantum measurement to the classical bits
  qc.barrier(range(4))
+ return qc
+
+def run_qdf(circuit=None, shots=None, mode=None, seed=None, workers=None):
+ #-----------------------------------------------------------------------------------------
+ # Run the QDF circuit and return its counts/P's as a QDFResult, with no output files. 
+ # Settings not given are taken from the QDF_* settings above. Exact, parallel and noisy 
+ # modes run on the built-in simulator; shots mode runs on the selected backend.
+ #-----------------------------------------------------------------------------------------
+ shots = shots or qdf_shots
+ mode = mode or qdf_mode
+ seed = qdf_seed if seed is None else seed
+ if circuit is None:
+     circuit = qiskit_qdf() if backend == 'aer' else build_qdf()
+ local_circuit = circuit if isinstance(circuit, Circuit) else build_qdf()
+ if mode == 'exact':  # Outcome P's computed analytically over the mid-circuit measurements and c_if conditions.
+     return QDFResult(probabilities(local_circuit), backend='local', mode='exact')
+ if mode == 'noisy':  # Outcome P's averaged over seeded noise trajectories, with readout flips.
+     probs = noisy_probabilities(local_circuit, seed=seed, **qdf_noise)
+     return QDFResult(probs, seeds={'seed': seed, **qdf_noise}, backend='local', mode='noisy')
+ if mode == 'parallel':  # Seeded shot tasks on a process pool, merged into one set of counts.
+     counts, seeds = parallel_counts(local_circuit, shots, seed, workers or qdf_workers)
+     return QDFResult.from_counts(counts, shots, seeds=seeds, backend='local', mode='parallel')
+ if backend == 'aer' and not isinstance(circuit, Circuit):
+     dyn_pick = Aer.get_backend('qasm_simulator') # The device to run on dynamically... 2024 update. 
+     if seed is None:
+         job_exp = dyn_pick.run(circuit, shots = shots) # 2024 update... Qiskit package v.1.0 (see heading)
+     else:
+         job_exp = dyn_pick.run(circuit, shots = shots, seed_simulator = seed) # Reproducible Aer counts.
+     counts = job_exp.result().get_counts(circuit)
+     return QDFResult.from_counts(counts, shots, seeds={'seed': seed}, backend='aer', mode='shots')
+ counts = sample_counts(local_circuit, shots, seed) # Shots drawn from the exact outcome P's of the QDF circuit.
+ return QDFResult.from_counts(counts, shots, seeds={'seed': seed}, backend='local', mode='shots')
+
+def run(circuit=None, shots=None, mode=None, seed=None, refresh=False):
+ #-----------------------------------------------------------------------------------------
+ # Result of the QDF circuit for the given settings, simulated on the first call and reused
+ # from the results cache after that, keyed by the circuit definition and the run settings. 
+ # Exact and seeded results are also read from/written to the on-disk qdf_cache, since they 
+ # are the same on every run. refresh=True simulates again and replaces the cached result.
+ #-----------------------------------------------------------------------------------------
+ mode = mode or qdf_mode
+ shots = None if mode in ('exact', 'noisy') else (shots or qdf_shots)
+ seed = qdf_seed if seed is None else seed
+ noise = {'noise': qdf_noise} if mode == 'noisy' else {}  # Noise rates set the result of the noisy mode.
+ seeded = {} if mode == 'exact' else {'seed': seed}  # Exact P's are the same whatever the seed.
+ # The default QDF circuit is keyed by its built-in definition (the Qiskit circuit is the same, gate for gate).
+ key = circuit_key(build_qdf() if circuit is None else circuit, shots=shots, mode=mode, backend=backend, 
+                   **seeded, **noise)
+ if not refresh and key in results:
+     return results[key]
+ stored = qdf_cache is not None and deterministic(mode, seed)
+ result = qdf_cache.get(key) if stored and not refresh else None
+ if result is None:
+     result = run_qdf(circuit, shots, mode, seed)
+     if stored:
+         qdf_cache.put(key, result)
+ results[key] = result
+ return result
+
+def refresh(circuit=None, shots=None, mode=None, seed=None):
+ """- Simulate the QDF circuit again for the given settings, replacing its cached result."""
+ return run(circuit, shots, mode, seed, refresh=True)
+
+def qdf_circuit(refresh=False):  # Function to compose/build a QDF circuit, simulate (or reuse its result) and plot it.
+ global qc    # Instantiate qc as a global variable to represent the quantum circuit.  
+ if backend == 'aer':
+     qc = qiskit_qdf()
+ else:
+     qc = build_qdf()  # The same QDF circuit, gate for gate, on the built-in simulator.
  
  global hline
  hline = "=================================================================================================================================="
@@ -156,24 +258,26 @@ def qdf_circuit():  # Function to compose/build a QDF circuit.
        "\033[1m<--- {{ Qiskit Aer, IBM }} QDF CIRCUIT SIMULATION BEGINS --->\033[0m" + Back.RESET) 
 
  #The following lines plot the P of measurements from the QDF circuit and draws the circuit. 
- global counts_exp   # Used to plot P results for N shots run on the QDF circuit.
+ global counts_exp, result_exp   # Used to plot P results for N shots run on the QDF circuit.
  #------------------------------------------------------------------------------------
  # Choose backend, number of shots and the plotting of histogram.
  #------------------------------------------------------------------------------------
  #my_provider = IBMProvider() # Previously was IBMQ.load_account().
  #print(Fore.LIGHTMAGENTA_EX + f"{hline + Fore.GREEN}\nIBMQ Providers:" + Fore.YELLOW, my_provider.backends())
  #ibmq_pick = my_provider.get_backend('ibmq_qasm_simulator') # To run on without dynamic support.
- dyn_pick = Aer.get_backend('qasm_simulator') # The device to run on dynamically... 2024 update. 
- print(Fore.LIGHTMAGENTA_EX + f"{hline + Fore.GREEN}\nDynamic Providers:"+ Fore.YELLOW, dyn_pick)
  #ibmq_pick = provider.get_backend('simulator_statevector')
  #ibmq_pick = my_provider.get_backend('ibmq_athens') # This machine was recently retired.
  #ibmq_pick = my_provider.get_backend('ibmq_16_melbourne') # This machine was recently retired.
- shots = 8192 # Number of shots to run the program (experiment); maximum is 8192 shots.
- job_exp = dyn_pick.run(qc, shots = shots) # 2024 update... Qiskit package v.1.0 (see heading)
- result = job_exp.result()
- print(Fore.GREEN + f'Counts for Qubit Pairs out of {shots} shots:' + Fore.RED, 
-       result.get_counts(qc), Fore.LIGHTGREEN_EX)
- counts_exp = (result.get_counts(qc))
+ result_exp = run(refresh=refresh) # Counts/P's of every outcome of the QDF circuit (qc above), handed over in memory. 
+ shots = result_exp.shots
+ counts_exp = result_exp.counts
+ provider = "Qiskit Aer qasm_simulator" if result_exp.backend == 'aer' else "QDF_sim statevector simulator"
+ print(Fore.LIGHTMAGENTA_EX + f"{hline + Fore.GREEN}\n{result_exp.mode.capitalize()} Provider:"+ Fore.YELLOW, provider)
+ if counts_exp is None:
+     print(Fore.GREEN + f'Exact P values for Qubit Pairs:' + Fore.RED, result_exp.probabilities, Fore.LIGHTGREEN_EX)
+ else:
+     print(Fore.GREEN + f'Counts for Qubit Pairs out of {shots} shots:' + Fore.RED, 
+           counts_exp, Fore.LIGHTGREEN_EX)
  
  #--- The above code snippet is the old version limited to counts ratio to maximum number 
  # of shots = 8192 resulting to plot probabilities in older Qiskit versions (as 
@@ -182,7 +286,7 @@ def qdf_circuit():  # Function to compose/build a QDF circuit.
  # out the same probabilities based on Maximum of counts/total number of shots = 
  # a list of P(qubit pairs). 
  # The observed probabilities are computed by taking the respective counts and dividing 
- # by the total number of shots as follows.
+ # by the total number of shots (see QDFResult in QDF_sim.py), for every outcome.
  #---------------------------------------------------------------------------------------
  #---------------------------------------------------------------------------------------
  # The following lines calculate P values and plot them for the 'counts_exp' above after 
@@ -192,81 +296,48 @@ def qdf_circuit():  # Function to compose/build a QDF circuit.
  P = 1 # The total probability of QDF circuit events relative to classical states or 
        # denoting the system's Hamiltonian (total energy). 
 
- file = "ibm-qdf-shell_output.bin" # I/O bin or metadata file to binary file to read/write.
- with open(file, 'w') as file_to_write:
-    file_to_write.write(str(counts_exp))
-    file_to_write.close() # End write counts_exp metadata to the file. 
-
- n_list = []  # Create an empty list for numbers to store. 
- bin_list = []  # Create an empty list for binaries to store. 
- 
- with open(file, 'r') as file:
-        
-        # Read the contents of the file
-        content = file.read()
-        
-        # Extract all the digits from the content and convert to int.
-        N = re.findall(r'\d+', content) 
-        n_list = list(map(int, N)) 
-
-        # Convert all the metadata digits to str to sort out binaries.
-        bin_list = list(map(str, N)) 
+ if qdf_persist and counts_exp is not None:
+     file = "ibm-qdf-shell_output.bin" # I/O bin or metadata file to keep the counts_exp metadata.
+     with open(file, 'w') as file_to_write:
+        file_to_write.write(str(counts_exp))
+        file_to_write.close() # End write counts_exp metadata to the file. 
 
-        # Calculate quantum event p's for the total P.
-        p1 = n_list[1]/shots # 1st p result is stored to the p_list.
-        p2 = n_list[3]/shots # 2nd p result is stored to the p_list.
-        p3 = n_list[5]/shots # 3rd p result is stored to the p_list.
- 
- # This prepares a list of event p's summing up to P in total from the shots. 
+ bin_list = result_exp.bins   # Outcome binaries, in run order.
+ p_list = result_exp.probs    # Event p's for the total P, one per outcome.
+ p_terms = f" {Fore.YELLOW}+{Fore.LIGHTCYAN_EX} ".join(f"{{ p{i+1}({bits}) = {p} }}" 
+                                                     for i, (bits, p) in enumerate(zip(bin_list, p_list)))
+ # This prepares a list of event p's summing up to P in total from the shots (or exactly). 
  # Counts for QDF pairwise qubits:
- print(f'{Fore.YELLOW} Σ ({n_list[1]}, {n_list[3]}, {n_list[5]}) = {shots} shots ⟶  \
- ⟨P(b|ij⟩)⟩ = {{ ({{n1, n2, n3}}/{shots})b|ij⟩ }} \
- \n = {Fore.LIGHTCYAN_EX}{{ p1({bin_list[0]}) = {p1} }} {Fore.YELLOW}+{Fore.LIGHTCYAN_EX}\
- {{ p2({bin_list[2]}) = {p2} }} {Fore.YELLOW}+{Fore.LIGHTCYAN_EX}\
- {{ p3({bin_list[4]}) = {p3} }} {Fore.YELLOW}= {P}'), sleep(3)
+ if counts_exp is None:
+     print(f'{Fore.YELLOW} Σ ({", ".join(map(str, p_list))}) = {P} exact ⟶  ⟨P(b|ij⟩)⟩ = {{ (p1, ..., p{len(p_list)})b|ij⟩ }} \
+ \n = {Fore.LIGHTCYAN_EX}{p_terms} {Fore.YELLOW}= {P}'), sleep(3)
+ else:
+     print(f'{Fore.YELLOW} Σ ({", ".join(str(counts_exp[bits]) for bits in bin_list)}) = {shots} shots ⟶  \
+ ⟨P(b|ij⟩)⟩ = {{ ({{n1, ..., n{len(p_list)}}}/{shots})b|ij⟩ }} \
+ \n = {Fore.LIGHTCYAN_EX}{p_terms} {Fore.YELLOW}= {P}'), sleep(3)
 
  # Set the default p color codes to 'white' as defined below in the p_color list until an if condition applies.
- p_color = [Style.BRIGHT + Fore.WHITE, Style.BRIGHT + Fore.WHITE, Style.BRIGHT + Fore.WHITE]
+ p_color = [Style.BRIGHT + Fore.WHITE for p in p_list]
  
  # Set the high & low p's color-coded conditions of the p_color list against the total P color, set to LIGHTGREEN_EX.
- if p1 < 0.5 and p1 >= 0.33:
-     p_color[0] = Style.BRIGHT + Fore.WHITE
- if p2 < 0.5 and p2 >= 0.33:
-     p_color[1] = Style.BRIGHT + Fore.WHITE
- if p3 < 0.5 and p3 >= 0.33:
-     p_color[2] = Style.BRIGHT + Fore.WHITE
-
- if p1 < 0.33 and p1 >= 0.25:
-     p_color[0] = Style.DIM + Fore.YELLOW
- if p2 < 0.33 and p2 >= 0.25:
-     p_color[1] = Style.DIM + Fore.YELLOW
- if p3 < 0.33 and p3 >= 0.25:
-     p_color[2] = Style.DIM + Fore.YELLOW
-
- if p1 < 0.25:
-     p_color[0] = Style.DIM + Fore.RED
- if p2 < 0.25:
-     p_color[1] = Style.DIM +  Fore.RED
- if p3 < 0.25:
-     p_color[2] = Style.DIM + Fore.RED
+ for i, p in enumerate(p_list):
+     if p < 0.5 and p >= 0.33:
+         p_color[i] = Style.BRIGHT + Fore.WHITE
+     if p < 0.33 and p >= 0.25:
+         p_color[i] = Style.DIM + Fore.YELLOW
+     if p < 0.25:
+         p_color[i] = Style.DIM + Fore.RED
+     if p > 0.5 and p < P:
+         p_color[i] = Style.BRIGHT + Fore.LIGHTCYAN_EX
 
- if p1 > 0.5 and p1 < P:
-     p_color[0] = Style.BRIGHT + Fore.LIGHTCYAN_EX
- if p2 > 0.5 and p2 < P:
-     p_color[1] = Style.BRIGHT + Fore.LIGHTCYAN_EX
- if p3 > 0.5 and p3 < P:
-     p_color[2] = Style.BRIGHT + Fore.LIGHTCYAN_EX
-
- if ((p1 <= 0.5 and p1 >= 0.4) 
-     or (p2 <= 0.5 and p2 >= 0.4) 
-     or (p3 <= 0.5 and p3 >= 0.4)):  # This condition implies to superposition as discussed in Refs. [1, 2], 
-                                     # as the main discussion around state ⟨2⟩ of qubit pairs from a single  
-                                     # field vs. a QDF transformation.
-     p_color[:] = Style.BRIGHT + Fore.LIGHTMAGENTA_EX # Any color in the p_list is set to that successful event p as magenta. 
- if p1 == P or p2 == P or p3 == P:  # This only occurs when a p ⟶ ⟨P_success⟩ = P = 1, as
-                                    # 100% success probability of the expected measurement outcome.
-                                    # See Ref. [2] publication for more details. 
-     p_color[:] = Style.BRIGHT + Fore.LIGHTGREEN_EX # Any color in the p_list is set to that successful event p as green. 
+ if any(p <= 0.5 and p >= 0.4 for p in p_list):  # This condition implies to superposition as discussed in Refs. [1, 2], 
+                                                # as the main discussion around state ⟨2⟩ of qubit pairs from a single  
+                                                # field vs. a QDF transformation.
+     p_color[:] = [Style.BRIGHT + Fore.LIGHTMAGENTA_EX]*len(p_list) # Any color in the p_list is set to that successful event p as magenta. 
+ if any(p == P for p in p_list):  # This only occurs when a p ⟶ ⟨P_success⟩ = P = 1, as
+                                  # 100% success probability of the expected measurement outcome.
+                                  # See Ref. [2] publication for more details. 
+     p_color[:] = [Style.BRIGHT + Fore.LIGHTGREEN_EX]*len(p_list) # Any color in the p_list is set to that successful event p as green. 
  
  # Plot QDF pairwise qubits p's relative to P:
  print(f"{Fore.LIGHTMAGENTA_EX}{hline}\n Plot = [{Fore.LIGHTGREEN_EX}Experimented n of N counts\
@@ -275,15 +346,15 @@ def qdf_circuit():  # Function to compose/build a QDF circuit.
  \n{hline}")      
 
  fig = tpl.figure()
- fig.barh([P, p1, p2, p3], [Style.BRIGHT + Fore.LIGHTGREEN_EX+f"P(b|ij⟩)", p_color[0]+f"p1(b|ij⟩) = p1({bin_list[0]})", 
-                            p_color[1]+f"p2(b|ij⟩) = p2({bin_list[2]})", p_color[2]+f"p3(b|ij⟩) = p3({bin_list[4]})"], 
+ fig.barh([P] + p_list, [Style.BRIGHT + Fore.LIGHTGREEN_EX+f"P(b|ij⟩)"] 
+          + [p_color[i]+f"p{i+1}(b|ij⟩) = p{i+1}({bits})" for i, bits in enumerate(bin_list)], 
           force_ascii=False)
  fig.show()
 
- # Store the P's for simulation use by the QFLCC program for dataset analysis and QDF circuit predictions.
- with open('ibm-qdf-stats.txt', 'w') as file_to_write:
-    file_to_write.write(f"{P}, {p1}, {p2}, {p3}\nP, p({bin_list[0]}), p({bin_list[2]}), p({bin_list[4]})")
-    file_to_write.close() # End write counts_exp metadata to the file. 
+ # Store the counts and P's of every outcome for simulation use by the QFLCC program for dataset analysis and 
+ # QDF circuit predictions, as a binary_string,count,probability table (see QDF_stats.py).
+ if qdf_persist:
+     result_exp.save(STATS_FILE)
  
  print(Fore.LIGHTMAGENTA_EX +
        "\n\033[4m<<-- IBM QDF Circuit Measurement Results by Qiskit Aer Simulator Plotted Successfully! End of Task... -->>\033[0m\n"
@@ -293,25 +364,30 @@ def qdf_circuit():  # Function to compose/build a QDF circuit.
  os.system("pause >nul")
  print(f"\033[F{Fore.LIGHTGREEN_EX + hline}")
  
-#---------------------------------------------------------------------------------------------------
-# <----- Display histogram results of the QDF circuit event P's and then printing the circuit ----->
-#---------------------------------------------------------------------------------------------------
-qdf_circuit() # Call this function to plot P results given the number of shots. 
+def main(refresh=False):  # Nothing runs on import; the QFLCC program calls main() for a reference run. 
+ #---------------------------------------------------------------------------------------------------
+ # <----- Display histogram results of the QDF circuit event P's and then printing the circuit ----->
+ #---------------------------------------------------------------------------------------------------
+ qdf_circuit(refresh) # Call this function to plot P results given the number of shots. 
+
+ #-------------------------------------------------------------------------------------------------------
+ # Visualize the Circuit in the terminal by printing the circuit... This is in python. IBMQ kernel 
+ # does not require print(), or simply enter qc.draw() in this case. See code from the
+ # 'QDF-LCode_IBMQ-2024-raw-codable.ipynb' codable file or its 'QDF-LCode_IBMQ-2024-raw.ipynb' base file.  
+ #-------------------------------------------------------------------------------------------------------
+ print(qc.draw())
 
-#-------------------------------------------------------------------------------------------------------
-# Visualize the Circuit in the terminal by printing the circuit... This is in python. IBMQ kernel 
-# does not require print(), or simply enter qc.draw() in this case. See code from the
-# 'QDF-LCode_IBMQ-2024-raw-codable.ipynb' codable file or its 'QDF-LCode_IBMQ-2024-raw.ipynb' base file.  
-#-------------------------------------------------------------------------------------------------------
-print(qc.draw())
+ if qdf_persist:
+     fcircuit = "ibm-qdf-circuit_output.bin" # The file that the printed circuit is saved.
+     with open(fcircuit, 'w', encoding='utf-8') as file_to_write:
+         file_to_write.write(str(qc.draw()))
+         file_to_write.close() # End writing the printed circuit.
 
-fcircuit = "ibm-qdf-circuit_output.bin" # The file that the printed circuit is saved.
-with open(fcircuit, 'w', encoding='utf-8') as file_to_write:
-    file_to_write.write(str(qc.draw()))
-    file_to_write.close() # End writing the printed circuit.
+ print(Back.RESET + Fore.MAGENTA+"\n\033[4m<<-- QDF Circuit BUILT & RAN Successfully! End of Task... -->>\033[0m\n"
+        + Fore.LIGHTGREEN_EX), sleep(3)
+ print(Back.LIGHTGREEN_EX + Fore.YELLOW 
+       + f"{hline}\n\033[1m<--- {{ Qiskit Aer, IBM }} QDF CIRCUIT SIMULATION CONCLUDED --->\n{hline}\033[0m" + Back.RESET)
 
-print(Back.RESET + Fore.MAGENTA+"\n\033[4m<<-- QDF Circuit BUILT & RAN Successfully! End of Task... -->>\033[0m\n"
-       + Fore.LIGHTGREEN_EX), sleep(3)
-print(Back.LIGHTGREEN_EX + Fore.YELLOW 
-      + f"{hline}\n\033[1m<--- {{ Qiskit Aer, IBM }} QDF CIRCUIT SIMULATION CONCLUDED --->\n{hline}\033[0m" + Back.RESET) 
+if __name__ == "__main__":
+    main()
 #########--END OF PROGRAM--#########
\ No newline at end of file
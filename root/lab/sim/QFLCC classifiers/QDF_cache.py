@@ -0,0 +1,122 @@
+##################################################################################
+# Persistent result cache of QDF circuit runs for the QDF-LCode_IBMQ-2024-codable.py
+# module and the QAI-LCode_QFLCC.py program.
+# Standard filename is: QDF_cache.py
+# Every result is kept as one <key>.json entry in the __qflcc_cache__/qdf sidecar
+# folder, where key is the SHA-256 circuit_key() of the canonical gate list and
+# parameters of the circuit plus its run settings (shots, seed, mode, backend).
+# A rerun of an unchanged reference circuit, in the same program session or
+# after a restart, is read back from its entry instead of being simulated.
+# The folder is bounded in entries and bytes; the least recently used entries
+# (by mtime, touched on every hit) are evicted first.
+##################################################################################
+import json
+import os
+from pathlib import Path  # For accessing and conduct operations on files/directories
+from QFLCC_dataset import CACHE_DIR  # Sidecar cache folder of parsed datasets.
+from QDF_sim import QDFResult
+
+QDF_CACHE_DIR = os.path.join(CACHE_DIR, 'qdf')
+MAX_ENTRIES = 256
+MAX_BYTES = 64 << 20
+
+def deterministic(mode, seed):
+    """- True if a run gives the same result every time: exact P's, or counts sampled with a seed."""
+    return mode == 'exact' or seed is not None
+
+def result_record(result):
+    """- JSON-ready record of a QDFResult."""
+    return {'probabilities': result.probabilities, 'counts': result.counts, 'shots': result.shots,
+            'seeds': result.seeds, 'backend': result.backend, 'mode': result.mode}
+
+class ResultCache:
+    """- Size-bounded LRU cache of QDFResult's on disk, one JSON entry per circuit_key()."""
+    def __init__(self, path=QDF_CACHE_DIR, max_entries=MAX_ENTRIES, max_bytes=MAX_BYTES):
+        if max_entries < 1 or max_bytes < 1:
+            raise ValueError('QDF result cache needs room for at least one entry!')
+        self.path = Path(path)
+        self.max_entries = int(max_entries)
+        self.max_bytes = int(max_bytes)
+
+    def entry(self, key):
+        return self.path / f'{key}.json'
+
+    def get(self, key):
+    #-----------------------------------------------------------------
+    # Cached result of a key, or None on a miss. A hit touches the
+    # entry's mtime so it becomes the most recently used. Unreadable
+    # entries (e.g. cut short by a crash) are dropped as misses.
+    #-----------------------------------------------------------------
+        entry = self.entry(key)
+        try:
+            with open(entry, 'r') as x:
+                record = json.load(x)
+            os.utime(entry)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            self.discard(key)
+            return None
+        return QDFResult(**record)
+
+    def put(self, key, result):
+    #-----------------------------------------------------------------
+    # Store a result under its key (atomically, through a *.tmp file)
+    # and evict the least recently used entries over the size bounds.
+    # A cache that cannot be written (e.g. read-only folder) is skipped.
+    #-----------------------------------------------------------------
+        entry = self.entry(key)
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            tmp = entry.with_name(entry.name + '.tmp')
+            with open(tmp, 'w') as file_to_write:
+                json.dump(result_record(result), file_to_write, separators=(',', ':'))
+            os.replace(tmp, entry)
+            self.evict()
+        except OSError:
+            pass
+        return result
+
+    def discard(self, key):
+        """- Remove the entry of a key, if any."""
+        try:
+            os.remove(self.entry(key))
+        except OSError:
+            pass
+
+    def entries(self):
+        """- (mtime, size, path) of every entry, least recently used first."""
+        found = []
+        for entry in self.path.glob('*.json'):
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            found.append((st.st_mtime_ns, st.st_size, entry))
+        return sorted(found)
+
+    def evict(self):
+        """- Remove the least recently used entries until the cache is within max_entries and max_bytes."""
+        found = self.entries()
+        total = sum(size for _, size, _ in found)
+        while found and (len(found) > self.max_entries or total > self.max_bytes):
+            _, size, entry = found.pop(0)
+            try:
+                os.remove(entry)
+            except OSError:
+                pass
+            total -= size
+
+    def clear(self):
+        """- Remove every entry of the cache."""
+        for _, _, entry in self.entries():
+            try:
+                os.remove(entry)
+            except OSError:
+                pass
+
+    def __contains__(self, key):
+        return self.entry(key).is_file()
+
+    def __len__(self):
+        return len(self.entries())
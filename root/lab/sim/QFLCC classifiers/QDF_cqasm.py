@@ -0,0 +1,223 @@
+##################################################################################
+# cQASM v1.0 front-end of the QI (Quantum Inspire) QDF circuits, e.g. the
+# "QDF-LCode (QI).cq" file, for the QDF_sim.py simulator and the QAI-LCode_QFLCC.py
+# program.
+# Standard filename is: QDF_cqasm.py
+# A *.cq file is parsed into the same QDF_sim.Circuit representation as the IBM
+# QDF circuit, so QI reference P's are computed from the circuit source on the
+# local simulator instead of being read from precomputed QI_Exp_*.csv exports.
+# Supported cQASM:
+# * version, qubits N, # comments, .name and .name(n) subcircuits (iterated n times),
+#   parallel gate groups {G1 | G2 | ...} and q[i], q[i:j], q[i, j, k] operands.
+# * prep_z/x/y, measure_z/measure, measure_all, the single-qubit gates i, x, y, z, h,
+#   s, sdag, t, tdag, x90, y90, mx90, my90, rx, ry, rz, and cnot, cz, swap, cr, crk,
+#   toffoli. display, wait and barrier are skipped.
+# As on QI, qubit q[i] is measured into the classical bit b[i], and outcome binary
+# strings are written b[N-1]...b[0] with the trailing 'b' of the QI exports.
+#--------------------------/// Usage ///-----------------------------------------
+# python QDF_cqasm.py "QDF-LCode (QI).cq" --shots 1024 --seed 1 -o QI_Ref.csv
+##################################################################################
+import re
+from math import pi
+from pathlib import Path  # For accessing and conduct operations on files/directories
+import click
+from QDF_sim import Circuit, QDFResult, probabilities, sample_counts
+
+OPERAND = re.compile(r'[qb]\[[^\]]*\]|[^,\s]+')
+SUBCIRCUIT = re.compile(r'^\.(\w+)(?:\((\d+)\))?$')
+
+#---------------------------------------------------------------
+# cQASM gates as (number of qubit operands, number of angles,
+# builder appending the gate to a Circuit). Angles are radians.
+#---------------------------------------------------------------
+def rx(qc, q, theta):
+    return qc.u(theta, -pi/2, pi/2, q)
+
+GATES = {'i': (1, 0, lambda qc, q: None),
+         'x': (1, 0, lambda qc, q: qc.x(q)),
+         'y': (1, 0, lambda qc, q: qc.u(pi, pi/2, pi/2, q)),
+         'z': (1, 0, lambda qc, q: qc.z(q)),
+         'h': (1, 0, lambda qc, q: qc.h(q)),
+         's': (1, 0, lambda qc, q: qc.p(pi/2, q)),
+         'sdag': (1, 0, lambda qc, q: qc.p(-pi/2, q)),
+         't': (1, 0, lambda qc, q: qc.p(pi/4, q)),
+         'tdag': (1, 0, lambda qc, q: qc.p(-pi/4, q)),
+         'x90': (1, 0, lambda qc, q: rx(qc, q, pi/2)),
+         'mx90': (1, 0, lambda qc, q: rx(qc, q, -pi/2)),
+         'y90': (1, 0, lambda qc, q: qc.u(pi/2, 0, 0, q)),
+         'my90': (1, 0, lambda qc, q: qc.u(-pi/2, 0, 0, q)),
+         'rx': (1, 1, rx),
+         'ry': (1, 1, lambda qc, q, theta: qc.u(theta, 0, 0, q)),
+         'rz': (1, 1, lambda qc, q, theta: qc.rz(theta, q)),
+         'cnot': (2, 0, lambda qc, c, t: qc.cx(c, t)),
+         'cz': (2, 0, lambda qc, c, t: (qc.h(t), qc.cx(c, t), qc.h(t))),
+         'swap': (2, 0, lambda qc, q1, q2: qc.swap(q1, q2)),
+         'cr': (2, 1, lambda qc, c, t, lam: qc.cp(lam, c, t)),
+         'crk': (2, 1, lambda qc, c, t, k: qc.cp(2*pi/2**int(k), c, t)),
+         'toffoli': (3, 0, lambda qc, c1, c2, t: qc.ccx(c1, c2, t)),
+         'prep_z': (1, 0, lambda qc, q: qc.reset(q)),
+         'prep_x': (1, 0, lambda qc, q: (qc.reset(q), qc.h(q))),
+         'prep_y': (1, 0, lambda qc, q: (qc.reset(q), qc.h(q), qc.p(pi/2, q))),
+         'measure_z': (1, 0, lambda qc, q: qc.measure(q, q)),
+         'measure': (1, 0, lambda qc, q: qc.measure(q, q))}
+SKIPPED = ('display', 'display_binary', 'wait', 'barrier', 'skip')
+
+class Statement:
+    """- One cQASM gate statement: its lower-case name, operands and source line number."""
+    def __init__(self, name, operands, line):
+        self.name = name
+        self.operands = operands
+        self.line = line
+
+    def __repr__(self):
+        return f'{self.name} {", ".join(self.operands)} (line {self.line})'
+
+class Subcircuit:
+    """- A named block of statements (or parallel groups of statements) run iterations times."""
+    def __init__(self, name, iterations=1):
+        self.name = name
+        self.iterations = int(iterations)
+        self.statements = []  # Each item is a list of statements: one, or the members of a {..|..} group.
+
+class Program:
+    """- A parsed cQASM program: its version, number of qubits and subcircuits in order."""
+    def __init__(self, nqubits, subcircuits, version=None):
+        self.nqubits = nqubits
+        self.subcircuits = subcircuits
+        self.version = version
+
+    def statements(self):
+        """- Every statement in execution order, with subcircuits unrolled over their iterations."""
+        for sub in self.subcircuits:
+            for _ in range(sub.iterations):
+                for group in sub.statements:
+                    yield from group
+
+def qubit_indices(operand, nqubits, line):
+#-----------------------------------------------------------------
+# Qubit indices of an operand: q[i], q[i:j] (i to j inclusive) or
+# q[i, j, k]. Binary register operands (b[...]) are not supported.
+#-----------------------------------------------------------------
+    match = re.fullmatch(r'q\[([^\]]*)\]', operand.replace(' ', ''))
+    if match is None:
+        raise ValueError(f'line {line}: expected a qubit operand, got {operand!r}!')
+    indices = []
+    for part in match.group(1).split(','):
+        if ':' in part:
+            start, stop = (int(i) for i in part.split(':'))
+            indices.extend(range(start, stop + 1))
+        else:
+            indices.append(int(part))
+    for q in indices:
+        if not 0 <= q < nqubits:
+            raise ValueError(f'line {line}: qubit q[{q}] out of range for {nqubits} qubits!')
+    return indices
+
+def parse_statement(text, line):
+    """- Split a gate statement into its lower-case name and operands, e.g. 'CR q[1], q[4], 0.39'."""
+    name, _, rest = text.strip().partition(' ')
+    return Statement(name.lower(), OPERAND.findall(rest), line)
+
+def parse_cqasm(text):
+#-----------------------------------------------------------------
+# Parse cQASM source into a Program. Statements before the first
+# subcircuit header go into a default subcircuit run once.
+#-----------------------------------------------------------------
+    version = nqubits = None
+    subcircuits = [Subcircuit('default')]
+    for line, source in enumerate(text.splitlines(), 1):
+        code = source.split('#', 1)[0].strip()
+        if not code:
+            continue
+        keyword = code.split()[0].lower()
+        if keyword == 'version':
+            version = code.split()[1] if len(code.split()) > 1 else None
+        elif keyword == 'qubits':
+            nqubits = int(code.split()[1])
+        elif code.startswith('.'):
+            match = SUBCIRCUIT.match(code.replace(' ', ''))
+            if match is None:
+                raise ValueError(f'line {line}: malformed subcircuit header {code!r}!')
+            subcircuits.append(Subcircuit(match.group(1), match.group(2) or 1))
+        elif code.startswith('{'):
+            if not code.endswith('}'):
+                raise ValueError(f'line {line}: unterminated parallel gate group {code!r}!')
+            subcircuits[-1].statements.append([parse_statement(part, line) for part in code[1:-1].split('|')])
+        else:
+            subcircuits[-1].statements.append([parse_statement(code, line)])
+    if nqubits is None:
+        raise ValueError('No "qubits N" statement in the cQASM source!')
+    return Program(nqubits, [sub for sub in subcircuits if sub.statements or sub.name != 'default'], version)
+
+def to_circuit(program):
+#-----------------------------------------------------------------
+# Build the QDF_sim.Circuit of a parsed program, with q[i] measured
+# into classical bit b[i]. Gates with range/list operands apply on
+# every qubit (single-qubit gates) or every tuple of qubits taken
+# from the operands in order (multi-qubit gates).
+#-----------------------------------------------------------------
+    qc = Circuit(program.nqubits)
+    for st in program.statements():
+        if st.name in SKIPPED:
+            continue
+        if st.name == 'measure_all':
+            qc.measure_all()
+            continue
+        if st.name not in GATES:
+            raise ValueError(f'line {st.line}: unsupported cQASM gate {st.name!r}!')
+        nq, na, build = GATES[st.name]
+        if len(st.operands) != nq + na:
+            raise ValueError(f'line {st.line}: {st.name} takes {nq} qubit operand(s) and {na} angle(s), '
+                             f'got {len(st.operands)} operand(s)!')
+        qubits = [qubit_indices(op, program.nqubits, st.line) for op in st.operands[:nq]]
+        angles = [float(a) for a in st.operands[nq:]]
+        if len({len(q) for q in qubits}) != 1:
+            raise ValueError(f'line {st.line}: qubit operands of {st.name} differ in length!')
+        for targets in zip(*qubits):
+            build(qc, *targets, *angles)
+    return qc
+
+def load_cqasm(path):
+    """- Parse a *.cq file into a QDF_sim.Circuit."""
+    with open(path, 'r', encoding='utf-8') as x:
+        return to_circuit(parse_cqasm(x.read()))
+
+def qi_bins(result):
+    """- A result with its outcome binary strings in the QI export layout (trailing 'b')."""
+    result.probabilities = {bits + 'b': p for bits, p in result.probabilities.items()}
+    if result.counts is not None:
+        result.counts = {bits + 'b': n for bits, n in result.counts.items()}
+    return result
+
+def run_cqasm(path, shots=None, seed=None):
+#-----------------------------------------------------------------
+# Reference result of a *.cq circuit on the local simulator: exact
+# P's, or counts of shots drawn from them, as a QDFResult keyed by
+# QI binary strings.
+#-----------------------------------------------------------------
+    qc = load_cqasm(path)
+    if shots is None:
+        return qi_bins(QDFResult(probabilities(qc), backend='local', mode='exact'))
+    counts = sample_counts(qc, shots, seed)
+    return qi_bins(QDFResult.from_counts(counts, shots, seeds={'seed': seed}, backend='local', mode='shots'))
+
+@click.command()
+@click.argument('source', type=click.Path(exists=True, dir_okay=False))
+@click.option('--shots', type=int, default=None, help='Shots to sample (default: exact P values).')
+@click.option('--seed', type=int, default=None, help='Seed of the sampled shots.')
+@click.option('--draw', is_flag=True, help='Print the parsed circuit.')
+@click.option('-o', '--output', type=click.Path(dir_okay=False), default=None,
+              help='Write the P table as a QI "binary_string,probability" dataset.')
+def cli(source, shots, seed, draw, output):
+    """- Run a cQASM QI circuit on the local QDF simulator."""
+    if draw:
+        click.echo(load_cqasm(source).draw())
+    result = run_cqasm(source, shots, seed)
+    for bits, p in sorted(result.probabilities.items()):
+        click.echo(f'{bits},{p!r}')
+    if output:
+        result.to_dataset(name=Path(output).name, path=output).to_csv(output)
+        click.echo(f'Written {len(result)} outcomes of {Path(source).name} to {output}')
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,168 @@
+##################################################################################
+# Circuit-to-dataset fitting engine of the QDF circuit for the QAI-LCode_QFLCC.py
+# program.
+# Standard filename is: QDF_fit.py
+# The Ising time evolution angles of the QDF circuit (QDF_sim.QDF_ANGLES) are
+# searched for the circuit configuration whose exact outcome P's best match an
+# observed dataset P table, by a distance of QFLCC_compare.py (total variation
+# or KL divergence). The search is a seeded cross-entropy method: every round
+# samples a population of angle points around the current estimate, simulates
+# the whole population in one batched pass of QDF_sim.simulate(), and refits
+# the sampling mean and spread to the best (elite) points. The best-fit angles
+# and the residual P's (observed - model) of every outcome are reported, for one
+# dataset or a whole archive of datasets in one consolidated table. Dataset
+# binary strings (e.g. 5/6-bit QI exports with a 'b' marker) are lined up on the
+# 4-bit QDF register by an AlignmentIndex of QFLCC_bits.py first, and a dataset
+# with no outcome the circuit can produce is rejected rather than "fitted".
+#--------------------------/// Usage ///-----------------------------------------
+# python QDF_fit.py "QI_Exp_*.csv" --distance kl --seed 1 -o QDF_fit_results.csv
+##################################################################################
+import csv
+import numpy as np
+import click
+from QDF_sim import QDF_ANGLES, build_qdf, outcome_bins, qdf_angles, simulate
+from QFLCC_bits import AlignmentIndex  # Common qubit ordering of different register layouts.
+from QFLCC_compare import DISTANCES, distance
+from QFLCC_dataset import load_dataset  # Single-parse dataset readers with cached max/min P's.
+from QFLCC_report import archive_run, archive_summary  # Shared failure and summary reporting of the archive CLIs.
+
+EPS = 1e-12  # Least decrease of the distance taken as a better fit.
+FIT_COLUMNS = ['dataset', 'outcomes', 'distance', 'value', 'default_value', 'max_residual',
+               'max_residual_bin'] + list(QDF_ANGLES)
+
+class FitResult:
+    """- Best-fit QDF circuit angles for a dataset, with the observed and model P vectors
+    (indexed by classical register value) and the distance reached."""
+    def __init__(self, name, angles, value, default_value, observed, model, metric='tv', rounds=0):
+        self.name = name
+        self.angles = angles
+        self.value = float(value)
+        self.default_value = float(default_value)  # Distance of the circuit with the default QDF_ANGLES.
+        self.observed = observed
+        self.model = model
+        self.metric = metric
+        self.rounds = rounds
+
+    @property
+    def residuals(self):
+        """- Observed minus model P of every outcome."""
+        return self.observed - self.model
+
+    def rows(self, tol=1e-9):
+        """- (binary string, observed P, model P, residual) of every outcome with a P above tol."""
+        bins = outcome_bins(int(np.log2(len(self.observed))))
+        return [(b, float(o), float(m), float(o - m)) for b, o, m in zip(bins, self.observed, self.model)
+                if o > tol or m > tol]
+
+    def row(self):
+        """- The fit as a row of the FIT_COLUMNS results table."""
+        worst = int(np.argmax(np.abs(self.residuals)))
+        return {'dataset': self.name,
+                'outcomes': int((self.observed > 0).sum()),
+                'distance': self.metric,
+                'value': self.value,
+                'default_value': self.default_value,
+                'max_residual': float(self.residuals[worst]),
+                'max_residual_bin': outcome_bins(int(np.log2(len(self.observed))))[worst],
+                **{name: float(a) for name, a in self.angles.items()}}
+
+    def __str__(self):
+        """- The fit as a summary row: distance reached (and of the defaults), rounds and angles."""
+        angles = ' '.join(f'{name}={float(a):.4f}' for name, a in self.angles.items())
+        return (f'{self.name}: {self.metric} {self.value:.6f} (default {self.default_value:.6f}) '
+                f'after {self.rounds} round(s); {angles}')
+
+    def __repr__(self):
+        return f'FitResult({self.name}, {self.metric}={self.value:.6g} (default {self.default_value:.6g}), {self.angles})'
+
+def observed_vector(dataset, nqubits=4, index=None):
+#-----------------------------------------------------------------
+# Dense P vector (length 2^nqubits) of a dataset lined up on the
+# nqubits-bit QDF register by index (by default the leftmost bits
+# of every binary string, see QFLCC_bits.QubitMap.prefix()).
+#-----------------------------------------------------------------
+    index = index or AlignmentIndex(nqubits)
+    if index.common_width != nqubits:
+        raise ValueError(f'{dataset.name}: a {index.common_width}-bit alignment does not fit a {nqubits}-qubit circuit!')
+    codes = index.align(dataset.bits)[0].astype(np.int64)
+    observed = np.bincount(codes, weights=dataset.probs, minlength=2**nqubits)
+    return observed/observed.sum()
+
+def fit(dataset, names=None, metric='tv', population=256, elite=0.1, rounds=40, spread=np.pi,
+        seed=None, tol=1e-6, nqubits=4, index=None):
+#-----------------------------------------------------------------
+# Fit the QDF circuit angles listed in names (all QDF_ANGLES by
+# default, the others kept at their defaults) to a dataset. Each
+# round simulates population points in one batch; the search stops
+# after rounds rounds or once the sampling spread is below tol.
+# The dataset outcomes are lined up on the nqubits-bit register
+# by index (see observed_vector()).
+#-----------------------------------------------------------------
+    names = list(QDF_ANGLES) if names is None else list(names)
+    qdf_angles(dict.fromkeys(names, 0.0))  # Check the angle names once.
+    measure = distance(metric)
+    if population < 2 or not 0 < elite <= 1 or rounds < 1:
+        raise ValueError('The fit needs a population of 2 or more, an elite fraction in (0, 1] and 1 or more rounds!')
+    observed = observed_vector(dataset, nqubits, index)
+    rng = np.random.default_rng(seed)
+    nelite = max(1, int(round(elite*population)))
+
+    mean = np.array([QDF_ANGLES[name] for name in names], dtype=float)
+    std = np.full(len(names), float(spread))
+    best_x, default_value = mean.copy(), None
+    for done in range(1, rounds + 1):
+        points = mean + std*rng.standard_normal((population, len(names)))
+        points[0] = best_x  # Keep the best point so far (the defaults in the first round).
+        probs = simulate(build_qdf(dict(zip(names, points.T)), nqubits))
+        if default_value is None and not (observed @ (probs.max(axis=0) > EPS)) > EPS:
+            raise ValueError(f'{dataset.name}: no observed outcome is produced by the QDF circuit, nothing to fit!')
+        values = measure(observed, probs)
+        if default_value is None:
+            default_value = values[0]
+        best_value = values[0]
+        order = np.argsort(values, kind='stable')
+        if values[order[0]] < best_value - EPS:
+            best_x, best_value = points[order[0]].copy(), values[order[0]]
+        elites = points[order[:nelite]]
+        mean, std = elites.mean(axis=0), elites.std(axis=0)
+        if std.max() < tol:
+            break
+    angles = dict(zip(names, best_x.tolist()))
+    model = simulate(build_qdf(angles, nqubits))[0]
+    return FitResult(dataset.name, qdf_angles(angles), best_value, default_value, observed, model, metric, done)
+
+def fit_archive(paths, output='QDF_fit_results.csv', **settings):
+#-----------------------------------------------------------------
+# Fit every dataset of a list of paths and write one consolidated
+# FIT_COLUMNS table. Datasets that fail to parse or fit are
+# reported and skipped rather than halting the run.
+#-----------------------------------------------------------------
+    results, errors = archive_run(paths, lambda path: fit(load_dataset(path), **settings), 'QDF circuit fit')
+    with open(output, 'w', newline='') as file_to_write:
+        writer = csv.DictWriter(file_to_write, fieldnames=FIT_COLUMNS)
+        writer.writeheader()
+        writer.writerows(result.row() for result in results)
+    return results, errors
+
+@click.command()
+@click.argument("target")
+@click.option("-o", "--output", default='QDF_fit_results.csv', help="Consolidated fit results table (*.csv).")
+@click.option("-p", "--pattern", default='*', help="File pattern when TARGET is a directory.")
+@click.option("-d", "--distance", "metric", type=click.Choice(list(DISTANCES)), default='tv',
+              help="Distance to minimize.")
+@click.option("-a", "--angle", "names", multiple=True, type=click.Choice(list(QDF_ANGLES)),
+              help="QDF circuit angle to fit (repeat for several; all if not given).")
+@click.option("-n", "--population", default=256, help="Angle points simulated per round.")
+@click.option("-r", "--rounds", default=40, help="Search rounds at most.")
+@click.option("--seed", type=int, default=None, help="Seed of the search (random if not given).")
+def cli(target, output, pattern, metric, names, population, rounds, seed):
+    """- Fit the QDF circuit angles to every QFLCA dataset in TARGET (a directory or glob)."""
+    from QFLCC_batch import dataset_paths
+    results, errors = fit_archive(dataset_paths(target, pattern, exclude=[output]), output, names=names or None,
+                                  metric=metric, population=population, rounds=rounds, seed=seed)
+    for result in results:
+        click.echo(result)
+    archive_summary(f'{len(results)} dataset(s) fitted, {len(errors)} failed. Results written to {output}', errors)
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,135 @@
+##################################################################################
+# Noise model simulation of the QDF circuit for the QDF-LCode_IBMQ-2024-codable.py
+# module and the QAI-LCode_QFLCC.py program.
+# Standard filename is: QDF_noise.py
+# The QI_Exp_* datasets come from real hardware, so part of every Δp mismatch
+# with the noise-free QDF circuit is gate and readout noise. Here the noise is
+# simulated as Pauli (Kraus) trajectories on the batch axis of QDF_sim.simulate():
+# * Depolarizing gate noise: after every gate, each of its qubits gets a random
+#   X, Y or Z error with P p1 (single-qubit gates) or p2 (multi-qubit gates),
+#   drawn independently per trajectory. Averaging the outcome P's of all
+#   trajectories gives the depolarizing channel output.
+# * Readout noise: every classical bit of the final outcome P's is flipped
+#   0 -> 1 with P p01 and 1 -> 0 with P p10, as one transfer matrix per bit.
+#   (Mid-circuit measurements feeding c_if conditions are read without error.)
+# All noise rate points of a sweep share the same random draws (common random
+# numbers), so the P's change smoothly with the rates, and every rate point and
+# trajectory is simulated in the same vectorized pass.
+#--------------------------/// Usage ///-----------------------------------------
+# python QDF_noise.py --p1 0.001 --p2 0.01 --readout 0.02 -t 4096 --seed 1
+##################################################################################
+import numpy as np
+import click
+from QDF_sim import Circuit, build_qdf, outcome_bins, simulate
+
+TRAJECTORIES = 1024  # Pauli trajectories per noise rate point.
+NOISE_CHUNK = 1 << 14  # Trajectories simulated per vectorized pass.
+NOISELESS = ('measure', 'reset', 'barrier', 'pauli')
+
+def rate_array(rate, name):
+    """- Noise rate(s) as a 1-D array, checked to be P values."""
+    rate = np.atleast_1d(np.asarray(rate, dtype=float))
+    if rate.ndim != 1 or ((rate < 0) | (rate > 1)).any():
+        raise ValueError(f'The {name} noise rate(s) must be P values in [0, 1]!')
+    return rate
+
+def noise_slots(circuit):
+    """- (instruction index, qubit, gate size) of every qubit of every gate where an error may occur."""
+    return [(i, q, len(op.qubits)) for i, op in enumerate(circuit.ops)
+            if op.name not in NOISELESS for q in op.qubits]
+
+def pauli_codes(nslots, trajectories, seed=None):
+#-----------------------------------------------------------------
+# Random draws of the trajectories: a uniform number per noise slot
+# (an error occurs where it is below the slot's rate) and the Pauli
+# error X, Y or Z (code 1..3) applied if so.
+#-----------------------------------------------------------------
+    rng = np.random.default_rng(seed)
+    return rng.random((trajectories, nslots)), rng.integers(1, 4, (trajectories, nslots))
+
+def noisy_circuit(circuit, codes):
+#-----------------------------------------------------------------
+# Copy of a circuit with a per-batch Pauli gate after every noise
+# slot. codes is a (batch, number of noise slots) array of Pauli
+# codes 0..3, 0 (identity) where no error occurs. Errors after a
+# c_if gate share its condition.
+#-----------------------------------------------------------------
+    slots = noise_slots(circuit)
+    if codes.shape[1] != len(slots):
+        raise ValueError(f'{codes.shape[1]} Pauli codes per trajectory for {len(slots)} noise slots!')
+    after = {}
+    for k, (i, q, _) in enumerate(slots):
+        after.setdefault(i, []).append((q, k))
+    noisy = Circuit(circuit.nqubits, circuit.nclbits)
+    for i, op in enumerate(circuit.ops):
+        noisy.append(op.name, op.qubits, op.params, op.clbits).condition = op.condition
+        for q, k in after.get(i, []):
+            noisy.pauli(codes[:, k], q).condition = op.condition
+    return noisy
+
+def readout_error(probs, p01, p10=None):
+#-----------------------------------------------------------------
+# Outcome P's (..., 2^nclbits) after independent readout flips of
+# every classical bit, 0 -> 1 with P p01 and 1 -> 0 with P p10
+# (p10 defaults to p01). Rates are scalars or arrays broadcasting
+# over the leading axes of probs.
+#-----------------------------------------------------------------
+    probs = np.asarray(probs, dtype=float)
+    p01 = np.asarray(p01, dtype=float)
+    p10 = p01 if p10 is None else np.asarray(p10, dtype=float)
+    lead, n = probs.shape[:-1], int(np.log2(probs.shape[-1]))
+    shape = np.shape(p01) + (1,) * (len(lead) - np.ndim(p01) + n - 1)  # Over the bits left after a take().
+    p01, p10 = np.reshape(p01, shape), np.reshape(p10, shape)
+    tensor = probs.reshape(lead + (2,) * n)
+    for axis in range(len(lead), len(lead) + n):
+        zero, one = np.take(tensor, 0, axis=axis), np.take(tensor, 1, axis=axis)
+        tensor = np.stack([(1 - p01)*zero + p10*one, p01*zero + (1 - p10)*one], axis=axis)
+    return tensor.reshape(probs.shape)
+
+def noisy_sweep(circuit, p1=0.001, p2=0.01, p01=0.0, p10=None, trajectories=TRAJECTORIES,
+                seed=None, chunk=NOISE_CHUNK):
+#-----------------------------------------------------------------
+# Outcome P's of a circuit under gate and readout noise, as a
+# (number of rate points, 2^nclbits) array. p1, p2, p01 and p10
+# are scalars or 1-D arrays of rate points (broadcast together);
+# every rate point averages the same trajectories.
+#-----------------------------------------------------------------
+    if trajectories < 1:
+        raise ValueError('The noise simulation needs at least one trajectory!')
+    p1, p2, p01 = rate_array(p1, 'p1'), rate_array(p2, 'p2'), rate_array(p01, 'p01')
+    p10 = p01 if p10 is None else rate_array(p10, 'p10')
+    p1, p2, p01, p10 = np.broadcast_arrays(p1, p2, p01, p10)
+    slots = noise_slots(circuit)
+    uniform, errors = pauli_codes(len(slots), trajectories, seed)
+    size = np.array([k for _, _, k in slots])
+    rates = np.where(size > 1, p2[:, None], p1[:, None])  # (rate points, slots)
+    codes = np.where(uniform[None] < rates[:, None], errors[None], 0).reshape(-1, len(slots))
+    probs = np.empty((len(codes), 2**circuit.nclbits))
+    for start in range(0, len(codes), chunk):
+        probs[start:start + chunk] = simulate(noisy_circuit(circuit, codes[start:start + chunk]))
+    probs = probs.reshape(len(p1), trajectories, -1).mean(axis=1)
+    return readout_error(probs, p01, p10)
+
+def noisy_probabilities(circuit, p1=0.001, p2=0.01, p01=0.0, p10=None, trajectories=TRAJECTORIES,
+                        seed=None, tol=1e-12):
+    """- Noisy P of every outcome with a P above tol, as {binary string: P}."""
+    probs = noisy_sweep(circuit, p1, p2, p01, p10, trajectories, seed)[0]
+    return {b: float(p) for b, p in zip(outcome_bins(circuit.nclbits), probs) if p > tol}
+
+@click.command()
+@click.option("--p1", default=0.001, help="Depolarizing rate after single-qubit gates.")
+@click.option("--p2", default=0.01, help="Depolarizing rate (per qubit) after multi-qubit gates.")
+@click.option("--readout", default=0.0, help="Readout flip rate of every classical bit.")
+@click.option("-t", "--trajectories", default=TRAJECTORIES, help="Pauli trajectories to average.")
+@click.option("--seed", type=int, default=None, help="Seed of the trajectories (random if not given).")
+def cli(p1, p2, readout, trajectories, seed):
+    """- Print the noisy outcome P's of the QDF circuit next to its noise-free P's."""
+    qc = build_qdf()
+    clean = simulate(qc)[0]
+    noisy = noisy_sweep(qc, p1, p2, readout, trajectories=trajectories, seed=seed)[0]
+    for bits, p, q in zip(outcome_bins(qc.nclbits), clean, noisy):
+        if p > 1e-12 or q > 1e-12:
+            print(f'{bits}  {p:.6f}  {q:.6f}')
+
+if __name__ == "__main__":
+    cli()
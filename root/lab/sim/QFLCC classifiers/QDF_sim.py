@@ -0,0 +1,521 @@
+##################################################################################
+# Lightweight NumPy statevector simulator of the QDF circuit for the
+# QDF-LCode_IBMQ-2024-codable.py module and the QAI-LCode_QFLCC.py program.
+# Standard filename is: QDF_sim.py
+# It covers the gate set of qdf_circuit(): reset, x, h, cx, z, u, p, cp, swap,
+# measure, barrier and c_if conditions on the classical register, plus ccx and
+# rz for other QDF circuit configurations and per-batch pauli gates for noise
+# trajectories (see QDF_noise.py), with the Qiskit conventions:
+# * q[0] is the least significant qubit, and the rightmost bit of an outcome
+#   binary string is c[0], e.g. '0101' is c[3]c[2]c[1]c[0].
+# * u(theta, phi, lam), p(lam) and cp(lam) are the Qiskit U, phase and
+#   controlled-phase gates.
+# Mid-circuit measurements and resets split the simulation into branches, each
+# with its own classical register value, so c_if conditions are exact. The
+# trailing block of measurements is read off the final states directly. This
+# gives exact outcome P's with no sampling; counts are drawn from them on demand,
+# or by parallel_counts() as seeded shot tasks on a process pool.
+# A state is held as a (batch, 2, ..., 2) tensor, so a whole batch of gate
+# parameter points can be simulated at once: build_qdf() takes its Ising time
+# evolution angles as parameters, and sweep() returns the outcome P tensor over
+# a grid of those angles.
+#--------------------------/// Usage ///-----------------------------------------
+# python QDF_sim.py --shots 50000000 --seed 1 -w 32 -o ibm-qdf-stats.csv
+##################################################################################
+import hashlib
+import json
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import click
+
+PRUNE = 1e-15  # Branches with a P below this (for every batch point) are dropped.
+
+class Instruction:
+    """- One gate, measurement, reset or barrier of a Circuit, with an optional c_if condition."""
+    def __init__(self, name, qubits, params=(), clbits=()):
+        self.name = name
+        self.qubits = tuple(qubits)
+        self.params = tuple(params)
+        self.clbits = tuple(clbits)
+        self.condition = None  # Classical register value the instruction is conditioned on.
+
+    def c_if(self, value):
+        """- Apply only if the classical register holds value, as Qiskit c_if(c, value)."""
+        self.condition = int(value)
+        return self
+
+    def __repr__(self):
+        text = self.name
+        if self.params:
+            text += '(' + ', '.join(f'{p:.6g}' if np.ndim(p) == 0 else 'batch' for p in self.params) + ')'
+        text += ' ' + ', '.join(f'q[{q}]' for q in self.qubits)
+        if self.clbits:
+            text += ' -> ' + ', '.join(f'c[{c}]' for c in self.clbits)
+        if self.condition is not None:
+            text += f' if c=={self.condition}'
+        return text
+
+class Circuit:
+    """- A QDF circuit as an ordered list of instructions on nqubits qubits and nclbits classical bits."""
+    def __init__(self, nqubits, nclbits=None):
+        self.nqubits = int(nqubits)
+        self.nclbits = self.nqubits if nclbits is None else int(nclbits)
+        self.ops = []
+
+    def append(self, name, qubits, params=(), clbits=()):
+        for q in qubits:
+            if not 0 <= q < self.nqubits:
+                raise ValueError(f'Qubit {q} out of range for a {self.nqubits}-qubit circuit!')
+        for c in clbits:
+            if not 0 <= c < self.nclbits:
+                raise ValueError(f'Classical bit {c} out of range for {self.nclbits} classical bits!')
+        op = Instruction(name, qubits, params, clbits)
+        self.ops.append(op)
+        return op
+
+    def reset(self, q):
+        return self.append('reset', [q])
+
+    def x(self, q):
+        return self.append('x', [q])
+
+    def h(self, q):
+        return self.append('h', [q])
+
+    def z(self, q):
+        return self.append('z', [q])
+
+    def u(self, theta, phi, lam, q):
+        return self.append('u', [q], [theta, phi, lam])
+
+    def p(self, lam, q):
+        return self.append('p', [q], [lam])
+
+    def rz(self, lam, q):
+        return self.append('rz', [q], [lam])
+
+    def cx(self, control, target):
+        return self.append('cx', [control, target])
+
+    def cp(self, lam, control, target):
+        return self.append('cp', [control, target], [lam])
+
+    def swap(self, q1, q2):
+        return self.append('swap', [q1, q2])
+
+    def ccx(self, control1, control2, target):
+        return self.append('ccx', [control1, control2, target])
+
+    def pauli(self, codes, q):
+        """- Pauli gate I, X, Y or Z (code 0..3) on q, one code per batch point (e.g. noise trajectories)."""
+        return self.append('pauli', [q], [codes])
+
+    def barrier(self, *qubits):
+        return self.append('barrier', [])
+
+    def measure(self, qubits, clbits):
+        """- Measure a qubit (or a list of qubits) into a classical bit (or a list of bits)."""
+        if np.ndim(qubits) == 0:
+            return self.append('measure', [qubits], clbits=[clbits])
+        for q, c in zip(qubits, clbits):
+            op = self.append('measure', [q], clbits=[c])
+        return op
+
+    def measure_all(self):
+        return self.measure(range(self.nqubits), range(self.nqubits))
+
+    def draw(self):
+        """- Text listing of the circuit instructions, one per line."""
+        return f'Circuit({self.nqubits} qubits, {self.nclbits} clbits)\n' + '\n'.join(
+            f'{i:3d}: {op!r}' for i, op in enumerate(self.ops) if op.name != 'barrier')
+
+    def __str__(self):
+        return self.draw()
+
+def circuit_definition(circuit):
+    """- Canonical (JSON-ready) definition of a circuit: its sizes and every instruction with its parameters."""
+    if not isinstance(circuit, Circuit):  # E.g. a Qiskit circuit, defined by its drawing.
+        return {'circuit': str(circuit)}
+    return {'nqubits': circuit.nqubits, 'nclbits': circuit.nclbits,
+            'ops': [[op.name, list(op.qubits), [np.asarray(p, dtype=float).tolist() for p in op.params],
+                     list(op.clbits), op.condition] for op in circuit.ops if op.name != 'barrier']}
+
+def circuit_key(circuit, **settings):
+    """- SHA-256 key of a circuit definition and run settings (e.g. shots, seed, mode)."""
+    text = json.dumps({'circuit': circuit_definition(circuit), **settings}, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(text.encode()).hexdigest()
+
+#---------------------------------------------------------------
+# Gate matrices, broadcast to (batch, 2^k, 2^k) for batched
+# parameters. For a k-qubit gate the matrix index holds the bits
+# of its qubits in the listed order, first qubit leftmost.
+#---------------------------------------------------------------
+SQ2 = 1/np.sqrt(2)
+FIXED_GATES = {'x': np.array([[0, 1], [1, 0]], dtype=complex),
+               'h': np.array([[SQ2, SQ2], [SQ2, -SQ2]], dtype=complex),
+               'z': np.array([[1, 0], [0, -1]], dtype=complex),
+               'cx': np.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0]], dtype=complex),
+               'swap': np.array([[1, 0, 0, 0], [0, 0, 1, 0], [0, 1, 0, 0], [0, 0, 0, 1]], dtype=complex)}
+FIXED_GATES['ccx'] = np.eye(8, dtype=complex)[[0, 1, 2, 3, 4, 5, 7, 6]]
+PAULIS = np.stack([np.eye(2, dtype=complex), FIXED_GATES['x'],
+                   np.array([[0, -1j], [1j, 0]]), FIXED_GATES['z']])  # I, X, Y, Z by code 0..3.
+
+def u_matrix(theta, phi, lam):
+    """- Qiskit U(theta, phi, lam) gate of every batch point, shape (batch, 2, 2)."""
+    theta, phi, lam = (np.atleast_1d(np.asarray(a, dtype=float)) for a in (theta, phi, lam))
+    c, s = np.cos(theta/2), np.sin(theta/2)
+    return np.stack([np.stack([c + 0j, -np.exp(1j*lam)*s], axis=-1),
+                     np.stack([np.exp(1j*phi)*s, np.exp(1j*(phi + lam))*c], axis=-1)], axis=-2)
+
+def phase_matrix(lam, k=1):
+    """- Phase gate p(lam) (k=1) or controlled-phase cp(lam) (k=2) of every batch point."""
+    lam = np.atleast_1d(np.asarray(lam, dtype=float))
+    diag = np.ones(lam.shape + (2**k,), dtype=complex)
+    diag[..., -1] = np.exp(1j*lam)
+    return diag[..., :, None] * np.eye(2**k)
+
+def rz_matrix(lam):
+    """- Rz(lam) gate of every batch point."""
+    lam = np.atleast_1d(np.asarray(lam, dtype=float))
+    return np.stack([np.exp(-0.5j*lam), np.exp(0.5j*lam)], axis=-1)[..., :, None] * np.eye(2)
+
+def gate_matrix(op):
+    """- Matrix of a gate instruction as a (batch or 1, 2^k, 2^k) array."""
+    if op.name in FIXED_GATES:
+        return FIXED_GATES[op.name][None]
+    if op.name == 'u':
+        return u_matrix(*op.params)
+    if op.name == 'p':
+        return phase_matrix(op.params[0], 1)
+    if op.name == 'cp':
+        return phase_matrix(op.params[0], 2)
+    if op.name == 'rz':
+        return rz_matrix(op.params[0])
+    if op.name == 'pauli':
+        return PAULIS[np.atleast_1d(np.asarray(op.params[0], dtype=np.int64))]
+    raise ValueError(f'Unsupported gate {op.name!r}!')
+
+#---------------------------------------------------------------
+# State tensor helpers. Axis 1 + (n-1-q) holds qubit q, so the
+# flattened state index is the Qiskit basis state number.
+#---------------------------------------------------------------
+def qubit_axis(q, n):
+    return n - q
+
+def apply_gate(psi, matrix, qubits):
+#-----------------------------------------------------------------
+# Apply a (batch or 1, 2^k, 2^k) gate matrix on the listed qubits
+# of a (batch, 2, ..., 2) state tensor.
+#-----------------------------------------------------------------
+    n = psi.ndim - 1
+    axes = [qubit_axis(q, n) for q in qubits]
+    k = len(axes)
+    moved = np.moveaxis(psi, axes, range(n + 1 - k, n + 1))
+    shape = moved.shape
+    flat = moved.reshape(shape[0], -1, 2**k)
+    flat = np.einsum('bij,bkj->bki', np.broadcast_to(matrix, (shape[0],) + matrix.shape[1:]), flat)
+    return np.moveaxis(flat.reshape(shape), range(n + 1 - k, n + 1), axes)
+
+def project(psi, q, bit):
+    """- Copy of psi with the amplitudes where qubit q is not bit set to 0 (unnormalized)."""
+    n = psi.ndim - 1
+    out = psi.copy()
+    index = [slice(None)] * psi.ndim
+    index[qubit_axis(q, n)] = 1 - bit
+    out[tuple(index)] = 0
+    return out
+
+def branch_p(psi):
+    """- P of a branch for every batch point (squared norm of its unnormalized state)."""
+    return (np.abs(psi.reshape(psi.shape[0], -1))**2).sum(axis=1)
+
+def batch_size(circuit):
+    """- Number of batch points set by the circuit parameters (1 for scalar parameters)."""
+    size = 1
+    for op in circuit.ops:
+        for p in op.params:
+            if np.ndim(p) > 0:
+                if size not in (1, len(p)) and len(p) != 1:
+                    raise ValueError('Batched gate parameters differ in length!')
+                size = max(size, len(p))
+    return size
+
+def trailing_measures(circuit):
+    """- Index of the first instruction of the trailing block of measurements (and barriers)."""
+    start = len(circuit.ops)
+    while start > 0 and circuit.ops[start - 1].name in ('measure', 'barrier') \
+            and circuit.ops[start - 1].condition is None:
+        start -= 1
+    return start
+
+def simulate(circuit):
+#-----------------------------------------------------------------
+# Exact outcome P's of a circuit as a (batch, 2^nclbits) array,
+# indexed by classical register value. Each branch is a pair of
+# (classical register value, unnormalized state).
+#-----------------------------------------------------------------
+    n, nb = circuit.nqubits, batch_size(circuit)
+    psi = np.zeros((nb,) + (2,) * n, dtype=complex)
+    psi.reshape(nb, -1)[:, 0] = 1
+    branches = [(0, psi)]
+    end = trailing_measures(circuit)
+    for op in circuit.ops[:end]:
+        if op.name == 'barrier':
+            continue
+        next_branches = []
+        for creg, psi in branches:
+            if op.condition is not None and creg != op.condition:
+                next_branches.append((creg, psi))
+            elif op.name == 'measure':
+                q, c = op.qubits[0], op.clbits[0]
+                for bit in (0, 1):
+                    next_branches.append(((creg & ~(1 << c)) | (bit << c), project(psi, q, bit)))
+            elif op.name == 'reset':
+                q = op.qubits[0]
+                next_branches.append((creg, project(psi, q, 0)))
+                next_branches.append((creg, apply_gate(project(psi, q, 1), FIXED_GATES['x'][None], [q])))
+            else:
+                next_branches.append((creg, apply_gate(psi, gate_matrix(op), op.qubits)))
+        branches = [(creg, psi) for creg, psi in next_branches if branch_p(psi).max() > PRUNE]
+
+    # Trailing measurements: every basis state maps to one classical register value.
+    measured = [(op.qubits[0], op.clbits[0]) for op in circuit.ops[end:] if op.name == 'measure']
+    states = np.arange(2**n)
+    probs = np.zeros((nb, 2**circuit.nclbits))
+    for creg, psi in branches:
+        values = np.full(2**n, creg)
+        for q, c in measured:
+            values = (values & ~(1 << c)) | (((states >> q) & 1) << c)
+        basis_p = np.abs(np.broadcast_to(psi, (nb,) + psi.shape[1:]).reshape(nb, -1))**2
+        np.add.at(probs, (slice(None), values), basis_p)
+    return probs
+
+def outcome_bins(nclbits):
+    """- Binary strings of every classical register value, c[0] rightmost."""
+    return [format(v, f'0{nclbits}b') for v in range(2**nclbits)]
+
+def probabilities(circuit, tol=1e-12):
+    """- Exact P of every outcome with a P above tol, as {binary string: P} (first batch point)."""
+    probs = simulate(circuit)[0]
+    return {b: float(p) for b, p in zip(outcome_bins(circuit.nclbits), probs) if p > tol}
+
+def sample_counts(circuit, shots=8192, seed=None, probs=None):
+    """- Counts of shots drawn from the exact outcome P's, as {binary string: count}."""
+    if probs is None:
+        probs = simulate(circuit)[0]
+    probs = np.clip(probs, 0, None)
+    counts = np.random.default_rng(seed).multinomial(shots, probs/probs.sum())
+    return {b: int(n) for b, n in zip(outcome_bins(circuit.nclbits), counts) if n > 0}
+
+class QDFResult:
+    """- Outcome P's of a QDF circuit run ({binary string: P}), with its counts, shots and
+    seeds when shots were sampled (counts and shots are None for exact P's)."""
+    def __init__(self, probabilities, counts=None, shots=None, seeds=None, backend='local', mode='exact'):
+        self.probabilities = dict(probabilities)
+        self.counts = None if counts is None else dict(counts)
+        self.shots = shots
+        self.seeds = dict(seeds or {})
+        self.backend = backend
+        self.mode = mode
+
+    @classmethod
+    def from_counts(cls, counts, shots=None, **kwargs):
+        """- Result of sampled counts, with P's as count/shots."""
+        shots = shots or sum(counts.values())
+        return cls({bits: n/shots for bits, n in counts.items()}, counts, shots, **kwargs)
+
+    @property
+    def bins(self):
+        """- Outcome binary strings, in the order of the run."""
+        return list(self.probabilities)
+
+    @property
+    def probs(self):
+        """- Outcome P's, in the order of bins."""
+        return list(self.probabilities.values())
+
+    def __len__(self):
+        return len(self.probabilities)
+
+    def __getitem__(self, bits):
+        return self.probabilities.get(bits, 0.0)
+
+    def meta(self):
+        """- Run settings and seeds, as stored next to the stats table."""
+        return {'backend': self.backend, 'mode': self.mode, 'shots': self.shots, **self.seeds}
+
+    def to_dataset(self, name='', path=None):
+        """- The result as a PDataset P table (see QFLCC_dataset.py), in the order of bins."""
+        from QFLCC_dataset import PDataset
+        return PDataset(self.bins, self.probs, name=name, path=path, counts=self.counts, shots=self.shots)
+
+    def save(self, path='ibm-qdf-stats.csv'):
+        """- Write the result as a QDF circuit stats table (see QDF_stats.py)."""
+        from QDF_stats import write_stats
+        if self.counts is None:
+            return write_stats(None, path, probs=self.probabilities, meta=self.meta())
+        return write_stats(self.counts, path, self.shots, meta=self.meta())
+
+    def __repr__(self):
+        return f'QDFResult({self.mode}, {self.backend}, shots={self.shots}, {self.probabilities})'
+
+SHOT_CHUNK = 1 << 20  # Shots per seeded task of parallel_counts().
+
+def split_shots(shots, chunk=SHOT_CHUNK):
+    """- Shot budget split into tasks of at most chunk shots, e.g. 2.5M -> [1048576, 1048576, 402848]."""
+    shots = int(shots)
+    if shots <= 0:
+        raise ValueError('The number of shots must be positive!')
+    return [min(chunk, shots - start) for start in range(0, shots, chunk)]
+
+def task_seeds(seed, ntasks):
+    """- Independent integer seeds of ntasks tasks spawned from one root seed (None draws a fresh root)."""
+    root = np.random.SeedSequence(seed)
+    return root.entropy, [int(child.generate_state(1, np.uint64)[0]) for child in root.spawn(ntasks)]
+
+def parallel_counts(circuit, shots, seed=None, workers=None, chunk=SHOT_CHUNK):
+#-----------------------------------------------------------------
+# Draw a large shot budget on a process pool: the shots are split
+# into tasks of at most chunk shots, each with its own seed spawned
+# from the root seed, and the counts of every task are merged. The
+# split only depends on shots and chunk, so the same root seed gives
+# the same counts for any number of workers. Returns the counts and
+# the seeds record {root seed, chunk, task seeds} to store with them.
+#-----------------------------------------------------------------
+    tasks = split_shots(shots, chunk)
+    root, seeds = task_seeds(seed, len(tasks))
+    probs = simulate(circuit)[0]  # Exact outcome P's, computed once and shared by every task.
+    args = ([circuit]*len(tasks), tasks, seeds, [probs]*len(tasks))
+    executor = ProcessPoolExecutor(workers) if workers != 1 and len(tasks) > 1 else None
+    counts = {}
+    try:
+        for task_counts in (executor.map if executor else map)(sample_counts, *args):
+            for bits, n in task_counts.items():
+                counts[bits] = counts.get(bits, 0) + n
+    finally:
+        if executor:
+            executor.shutdown()
+    return dict(sorted(counts.items())), {'seed': root, 'chunk': chunk, 'seeds': seeds}
+
+#---------------------------------------------------------------
+# Gate angles of the QDF circuit exposed as parameters, with their
+# values in qdf_circuit(): the u() thetas of the potential (v) and
+# kinetic (k) Ising time evolution steps, the kinetic cp() angle
+# and the potential p() angle.
+#---------------------------------------------------------------
+QDF_ANGLES = {'u_v1': 5.0,
+              'u_k1': -(np.pi**2)/30,
+              'u_k2': -(np.pi**2)/8,
+              'cp_k': (np.pi**2)/8,
+              'p_v': 3*np.pi/4,
+              'u_v2': 5.0}
+
+def qdf_angles(angles=None):
+    """- QDF circuit angles with the given ones (scalars or 1-D batches) replacing the defaults."""
+    angles = dict(angles or {})
+    unknown = set(angles) - set(QDF_ANGLES)
+    if unknown:
+        raise ValueError(f'Unknown QDF circuit angle(s) {sorted(unknown)}, expected {list(QDF_ANGLES)}!')
+    return {**QDF_ANGLES, **angles}
+
+def build_qdf(angles=None, nqubits=4):
+#-----------------------------------------------------------------
+# The QDF circuit of qdf_circuit() in the
+# QDF-LCode_IBMQ-2024-codable.py module, gate for gate, with its
+# QDF_ANGLES set from angles (a scalar or a 1-D batch each) on
+# nqubits qubits (q[3] and up are idle and measured as |0>).
+#-----------------------------------------------------------------
+    if nqubits < 3:
+        raise ValueError('The QDF circuit needs at least 3 qubits!')
+    a = qdf_angles(angles)
+    pi = np.pi
+    qc = Circuit(nqubits, nqubits)
+    for q in range(nqubits):  # State initialization in the z-basis in the |0> state.
+        qc.reset(q)
+    qc.x(0)
+    qc.x(2)
+    qc.barrier()
+    qc.h(1)
+    qc.cx(1, 2)
+    qc.barrier()
+    qc.z(1)
+    qc.barrier()
+    # Time evolution of the potential energy part of the Ising model.
+    qc.h(2)
+    qc.u(a['u_v1'], -pi/2, pi/2, 2)
+    qc.h(2)
+    # Two-qubit inverse QFT.
+    qc.h(1)
+    qc.cp(pi/2, 2, 1)
+    qc.h(2)
+    # Time evolution of the kinetic Ising model.
+    qc.p(pi/2, 1)
+    qc.h(1)
+    qc.u(a['u_k1'], -pi/2, pi/2, 1)
+    qc.h(1)
+    qc.h(2)
+    qc.u(a['u_k2'], -pi/2, pi/2, 2)
+    qc.h(2)
+    qc.cp(a['cp_k'], 2, 1)
+    # Two-qubit QFT.
+    qc.h(2)
+    qc.cp(-pi/2, 2, 1)
+    qc.h(1)
+    # Time evolution of the potential energy part.
+    qc.p(a['p_v'], 1)
+    qc.h(2)
+    qc.u(a['u_v2'], -pi/2, pi/2, 2)
+    qc.h(2)
+    qc.barrier()
+    # Continuation of the superdense code algorithm.
+    qc.x(1).c_if(1)
+    qc.barrier()
+    qc.cx(1, 2)
+    qc.h(1)
+    qc.barrier()
+    qc.measure(2, 0)
+    qc.measure(1, 1)
+    qc.swap(1, 2).c_if(2)
+    qc.measure(range(nqubits), range(nqubits))
+    qc.barrier()
+    return qc
+
+def sweep(axes, nqubits=4, chunk=1 << 14):
+#-----------------------------------------------------------------
+# Exact outcome P's of the QDF circuit over the grid of the given
+# angle axes ({angle name: 1-D values}), as a probability tensor of
+# shape (len(axis 1), ..., len(axis k), 2^nqubits) indexed by the
+# classical register value. Grid points are simulated as batches
+# of at most chunk points, each batch in one vectorized pass.
+#-----------------------------------------------------------------
+    names = list(axes)
+    qdf_angles(dict.fromkeys(names, 0.0))  # Check the angle names once.
+    values = [np.asarray(axes[name], dtype=float).ravel() for name in names]
+    shape = tuple(len(v) for v in values)
+    grid = [g.ravel() for g in np.meshgrid(*values, indexing='ij')] if names else []
+    npoints = int(np.prod(shape))
+    probs = np.empty((npoints, 2**nqubits))
+    for start in range(0, npoints, chunk):
+        points = {name: g[start:start + chunk] for name, g in zip(names, grid)}
+        probs[start:start + chunk] = simulate(build_qdf(points, nqubits))
+    return probs.reshape(shape + (2**nqubits,))
+
+@click.command()
+@click.option("-s", "--shots", default=8192, help="Shot budget of the QDF circuit run.")
+@click.option("--seed", type=int, default=None, help="Root seed of the shot tasks (random if not given).")
+@click.option("-w", "--workers", type=int, default=None, help="Process pool size (all cores if not given).")
+@click.option("--exact", is_flag=True, help="Write the exact outcome P's instead of sampling shots.")
+@click.option("-o", "--output", default='ibm-qdf-stats.csv', help="QDF circuit stats table (*.csv).")
+def cli(shots, seed, workers, exact, output):
+    """- Run the QDF circuit on the built-in simulator and write its stats table with the seeds used."""
+    qc = build_qdf()
+    if exact:
+        result = QDFResult(probabilities(qc), backend='local', mode='exact')
+    else:
+        counts, seeds = parallel_counts(qc, shots, seed, workers)
+        result = QDFResult.from_counts(counts, shots, seeds=seeds, backend='local', mode='parallel')
+    result.save(output)
+    print(f'QDF circuit stats written to {output}')
+
+if __name__ == "__main__":
+    cli()
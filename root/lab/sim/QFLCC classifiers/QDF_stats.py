@@ -0,0 +1,96 @@
+##################################################################################
+# QDF circuit stats file writer and reader for the QDF-LCode_IBMQ-2024-codable.py
+# simulator and the PAnalysis_model() step of the QAI-LCode_QFLCC.py program.
+# Standard filename is: QDF_stats.py
+# The simulator writes one row per measured outcome with explicit columns,
+#   binary_string,count,probability
+# so any number of outcomes is kept, and the reader checks the header against
+# that schema instead of scraping numbers by their position in the file.
+# Exact P's (no shots sampled) are written with a count of -1. Run settings such
+# as the backend, shots and the seeds of every shot task are kept next to the
+# table in a *.json sidecar file of the same name.
+# The former two-line ibm-qdf-stats.txt layout ("1, p1, p2, p3" then
+# "P, p(0111), p(0101), p(0001)") is still read, by label, for older results.
+##################################################################################
+import csv
+import json
+from pathlib import Path  # For accessing and conduct operations on files/directories
+from QFLCC_dataset import PDataset  # P table with cached max/min P's.
+
+STATS_FILE = 'ibm-qdf-stats.csv'
+LEGACY_STATS_FILE = 'ibm-qdf-stats.txt'
+STATS_COLUMNS = ['binary_string', 'count', 'probability']
+
+def write_stats(counts, path=STATS_FILE, shots=None, probs=None, meta=None):
+#-----------------------------------------------------------------
+# Write the counts of a QDF circuit run ({binary string: count}) as
+# a stats table sorted by binary string. P's are count/shots, with
+# shots defaulting to the total of the counts. Exact P's of a run
+# with no shots ({binary string: P}) are written with a count of -1.
+# The run settings in meta (e.g. seeds) go to the *.json sidecar.
+#-----------------------------------------------------------------
+    if probs is not None:
+        rows = [[bits, -1, repr(float(probs[bits]))] for bits in sorted(probs)]
+    else:
+        shots = shots or sum(counts.values())
+        if shots <= 0:
+            raise ValueError('No shots to write QDF circuit stats for!')
+        rows = [[bits, int(counts[bits]), repr(counts[bits]/shots)] for bits in sorted(counts)]
+    with open(path, 'w', newline='') as file_to_write:
+        writer = csv.writer(file_to_write)
+        writer.writerow(STATS_COLUMNS)
+        writer.writerows(rows)
+    if meta is not None:
+        with open(Path(path).with_suffix('.json'), 'w') as file_to_write:
+            json.dump(meta, file_to_write, indent=1)
+    return path
+
+def read_meta(path=STATS_FILE):
+    """- Run settings stored next to a stats table ({} when none were written)."""
+    meta = Path(path).with_suffix('.json')
+    if not meta.is_file():
+        return {}
+    with open(meta, 'r') as x:
+        return json.load(x)
+
+def read_stats(path=STATS_FILE):
+#-----------------------------------------------------------------
+# Read a stats table back as a PDataset (with counts and shots),
+# after checking its header holds the STATS_COLUMNS schema.
+#-----------------------------------------------------------------
+    path = Path(path)
+    if path.suffix.lower() == '.txt':
+        return read_legacy_stats(path)
+    with open(path, 'r', newline='') as x:
+        header = [h.strip() for h in next(csv.reader(x), [])]
+    missing = [c for c in STATS_COLUMNS if c not in header]
+    if missing:
+        raise ValueError(f'{path.name}: missing stats column(s) {", ".join(missing)}!')
+    return PDataset.from_csv(path)  # Counts are kept unless the P's are exact (count -1).
+
+def read_legacy_stats(path=LEGACY_STATS_FILE):
+#-----------------------------------------------------------------
+# Read the former two-line stats layout, pairing every P value of
+# the first line with its "p(binary string)" label on the second.
+#-----------------------------------------------------------------
+    path = Path(path)
+    with open(path, 'r') as x:
+        lines = [line.strip() for line in x if line.strip()]
+    if len(lines) < 2:
+        raise ValueError(f'{path.name}: expected a P values line and a labels line!')
+    values = [v.strip() for v in lines[0].split(',')]
+    labels = [l.strip() for l in lines[1].split(',')]
+    if len(values) != len(labels):
+        raise ValueError(f'{path.name}: {len(values)} P values for {len(labels)} labels!')
+    bins, probs = [], []
+    for label, value in zip(labels, values):
+        if label.startswith('p(') and label.endswith(')'):
+            bins.append(label[2:-1])
+            probs.append(float(value))
+    return PDataset(bins, probs, name=path.name, path=str(path))
+
+def load_stats(path=None):
+    """- Read the stats table, or the former ibm-qdf-stats.txt file when no table was written yet."""
+    if path is None:
+        path = STATS_FILE if Path(STATS_FILE).is_file() else LEGACY_STATS_FILE
+    return read_stats(path)
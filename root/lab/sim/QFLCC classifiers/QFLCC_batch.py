@@ -0,0 +1,117 @@
+##################################################################################
+# Headless batch analysis of QFLCA datasets for the QAI-LCode_QFLCC.py program.
+# Standard filename is: QFLCC_batch.py
+# This runs the same max/min P selection, qubit bit-pair extraction and binary
+# string complement as the interactive csv_analyzer(), dataframe() and
+# qdf_PAnalysis() steps of the QFLCC program, but for every dataset matched by
+# a directory or glob pattern in one run, with no prompts or sleep() pauses.
+# Each dataset is read once from its cheapest export (*.csv, *.json, *.htm).
+# Results are written to one consolidated table (*.csv).
+#--------------------------/// Usage ///-----------------------------------------
+# python QFLCC_batch.py "QI_Exp_*.csv" -o QFLCC_batch_results.csv
+# python QFLCC_batch.py ..\QI\test\
+##################################################################################
+import csv
+import glob
+import os
+from pathlib import Path  # For accessing and conduct operations on files/directories
+
+import click
+from QFLCC_dataset import load_dataset, dataset_stems  # Single-parse dataset readers with cached max/min P's.
+from QFLCC_report import archive_run, archive_summary  # Shared failure and summary reporting of the archive CLIs.
+from QFLCC_bits import PAIR_LABELS, row_pairs, pair_report  # Vectorized qubit-pair extraction engine.
+
+#---------------------------------------------------------------
+# Result table columns written per dataset, in order.
+#---------------------------------------------------------------
+BATCH_COLUMNS = ['dataset', 'outcomes', 'max_p', 'max_bin', 'min_p', 'min_bin', 'qdf_pairs',
+                 'pair_state', 'classical_bit', 'complement_bin', 'complement_p', 'bitpair',
+                 'mass_00', 'mass_01', 'mass_10', 'mass_11', 'mass_0b', 'mass_1b', 'mass_state']
+
+# Expected measurement output for the focused qubit pairs as printed by qdf_PAnalysis().
+PAIR_STATES = {'00': 'GS', '01': 'ES', '10': 'ES within GS (QPT)', '11': 'superposition'}
+
+# Bitpair property of the binary string complement relative to the focused qubit pair.
+PAIR_FLIP = {'01': '10', '10': '01', '11': '11', '00': '00'}
+
+def dataset_paths(target, pattern='*', exclude=()):
+#-----------------------------------------------------------------
+# Expand a directory, a glob pattern or a single file path into
+# the sorted list of datasets to analyze, one entry per dataset
+# stem however many exports (*.csv, *.json, *.htm) it has.
+# Files in exclude (e.g. the results table of a previous run
+# written into the same folder) are left out.
+#-----------------------------------------------------------------
+    if os.path.isdir(target):
+        paths = sorted(Path(target).glob(pattern))
+    else:
+        paths = sorted(glob.glob(target))
+    exclude = {Path(path).resolve() for path in exclude}
+    return dataset_stems(path for path in paths if Path(path).resolve() not in exclude)
+
+def pair_state(pairs):
+    """- Verdict on the focused qubit pair codes (the classical bit excluded), with the
+    last matching pair taking the verdict as in qdf_PAnalysis()."""
+    state = ''
+    for code in (1, 0, 2, 3):  # |01>, |00>, |10>, |11>
+        if code in pairs:
+            state = PAIR_STATES[PAIR_LABELS[code]]
+    return state
+
+def analyze_dataset(path, qi=True):
+#-----------------------------------------------------------------
+# Analyze one "binary_string,probability" dataset file and return
+# its row of the consolidated results table.
+#-----------------------------------------------------------------
+    dataset = load_dataset(path)
+    df2bin = dataset.max_bin
+    pairs, cbit, qdf = row_pairs(dataset.bits, dataset.argmax, qi=qi)
+    report = pair_report(dataset.bits, dataset.probs, qi=qi)  # P mass over all rows, not only the max P one.
+
+    return {'dataset': dataset.name,
+            'outcomes': len(dataset),
+            'max_p': dataset.p_max,
+            'max_bin': df2bin,
+            'min_p': dataset.p_min,
+            'min_bin': dataset.min_bin,
+            'qdf_pairs': ' '.join(qdf),
+            'pair_state': pair_state(pairs),
+            'classical_bit': str(cbit) if cbit >= 0 else '',
+            'complement_bin': dataset.complement_bin,
+            'complement_p': dataset.complement_p,
+            'bitpair': PAIR_FLIP.get(qdf[0], '') if qdf else '',
+            'mass_00': report.state_mass[0],
+            'mass_01': report.state_mass[1],
+            'mass_10': report.state_mass[2],
+            'mass_11': report.state_mass[3],
+            'mass_0b': report.cbit_mass[0],
+            'mass_1b': report.cbit_mass[1],
+            'mass_state': PAIR_STATES[report.verdict()]}
+
+def batch_analysis(target, output='QFLCC_batch_results.csv', qi=True, pattern='*'):
+#-----------------------------------------------------------------
+# Analyze every dataset matched by the target directory or glob,
+# then write one consolidated results table. Datasets that fail
+# to parse are reported and skipped rather than halting the run.
+#-----------------------------------------------------------------
+    rows, errors = archive_run(dataset_paths(target, pattern, exclude=[output]),
+                               lambda path: analyze_dataset(path, qi), 'dataset analysis')
+
+    with open(output, 'w', newline='') as file_to_write:
+        writer = csv.DictWriter(file_to_write, fieldnames=BATCH_COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+    return rows, errors
+
+@click.command()
+@click.argument("target")
+@click.option("-o", "--output", default='QFLCC_batch_results.csv', help="Consolidated results table (*.csv).")
+@click.option("-p", "--pattern", default='*', help="File pattern when TARGET is a directory.")
+@click.option("--ibmq", is_flag=True, help="Use the IBMQ bit-pair configuration instead of the QI one.")
+def cli(target, output, pattern, ibmq):
+    """- Analyze every QFLCA dataset in TARGET (a directory or glob) without prompts."""
+    rows, errors = batch_analysis(target, output, qi=not ibmq, pattern=pattern)
+    archive_summary(f'{len(rows)} dataset(s) analyzed, {len(errors)} failed. Results written to {output}', errors)
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,370 @@
+##################################################################################
+# Packed-integer binary strings for the QAI-LCode_QFLCC.py program.
+# Standard filename is: QFLCC_bits.py
+# A measured binary string such as 010010b is stored as an unsigned integer code
+# (the qubit/cbit bits, leftmost bit most significant), its width in bits and a
+# flag for the trailing 'b' classical bit marker of the QI exports.
+# BitColumn holds a whole binary_string column this way (11 bytes per outcome)
+# and computes complements, bit pairs, Hamming distances and parities on all
+# rows at once with integer array operations instead of per-character loops.
+# The pair extraction engine generalizes the qdf0, qdf1 and qdf2 lists of
+# qdf_PAnalysis(): a PairLayout gives the focused pair offset from the central
+# bit-pair and the stride, and extract_pairs() returns pair codes 0..3 (for
+# |00>, |01>, |10>, |11>) plus the classical bit for every row of a dataset.
+# pair_report() sums the P mass of every pair state, qubit and classical bit
+# over all rows of a dataset in one pass, for a table export.
+# An AlignmentIndex lines up binary strings of different register layouts (widths,
+# 'b' marker) on one common qubit ordering through a QubitMap per width, each with
+# a precomputed lookup table, for exact cross-platform outcome comparisons.
+##################################################################################
+import csv
+import numpy as np
+
+MAX_WIDTH = 64  # Widest binary string held by one uint64 code.
+POPCOUNT8 = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)  # Set bits per byte value.
+
+def popcount(codes):
+    """- Number of set bits of each uint64 code."""
+    codes = np.ascontiguousarray(codes, dtype=np.uint64)
+    return POPCOUNT8[codes.view(np.uint8)].reshape(codes.shape + (8,)).sum(axis=-1, dtype=np.uint8)
+
+def width_mask(widths):
+    """- All-ones uint64 mask of each width, e.g. 5 -> 0b11111."""
+    widths = np.asarray(widths, dtype=np.uint64)
+    full = np.uint64(0xFFFFFFFFFFFFFFFF)
+    return np.where(widths >= 64, full, (np.uint64(1) << np.minimum(widths, 63)) - np.uint64(1))
+
+def pack_bins(bins):
+#-----------------------------------------------------------------
+# Pack a column of binary strings into (codes, widths, suffix)
+# arrays, one length group of strings at a time.
+#-----------------------------------------------------------------
+    bins = np.char.strip(np.asarray(bins, dtype=str))
+    suffix = np.char.endswith(bins, 'b')
+    digits = np.where(suffix, np.char.rstrip(bins, 'b'), bins)
+    lengths = np.char.str_len(digits)
+    if len(bins) and lengths.max() > MAX_WIDTH:  # Checked before the uint8 cast, which wraps past 255.
+        raise ValueError(f'Binary strings wider than {MAX_WIDTH} bits cannot be packed!')
+    widths = lengths.astype(np.uint8)
+    codes = np.zeros(len(bins), dtype=np.uint64)
+    for w in map(int, np.unique(widths)):
+        rows = np.flatnonzero(widths == w)
+        if w == 0:
+            continue
+        chars = np.frombuffer(digits[rows].astype(f'S{w}').tobytes(), dtype=np.uint8).reshape(len(rows), w)
+        bits = chars - ord('0')
+        if (bits > 1).any():
+            raise ValueError('Binary strings may only hold 0 and 1 digits (and a trailing b)!')
+        weights = np.uint64(1) << np.arange(w - 1, -1, -1, dtype=np.uint64)
+        codes[rows] = (bits.astype(np.uint64) * weights).sum(axis=1, dtype=np.uint64)
+    return codes, widths, suffix
+
+def unpack_bins(codes, widths, suffix):
+#-----------------------------------------------------------------
+# Unpack (codes, widths, suffix) arrays back into binary strings.
+#-----------------------------------------------------------------
+    codes = np.asarray(codes, dtype=np.uint64)
+    widths = np.asarray(widths, dtype=np.uint8)
+    suffix = np.asarray(suffix, dtype=bool)
+    bins = np.empty(len(codes), dtype=f'U{int(widths.max()) + 1 if len(codes) else 1}')
+    for w in map(int, np.unique(widths)):
+        rows = np.flatnonzero(widths == w)
+        if w == 0:
+            bins[rows] = ''
+            continue
+        shifts = np.arange(w - 1, -1, -1, dtype=np.uint64)
+        chars = ((codes[rows, None] >> shifts) & np.uint64(1)).astype(np.uint8) + ord('0')
+        bins[rows] = np.ascontiguousarray(chars).view(f'S{w}').ravel().astype(str)
+    return np.where(suffix, np.char.add(bins, 'b'), bins)
+
+class BitColumn:
+    """- A column of binary strings as packed uint64 codes, bit widths and trailing 'b' flags.
+    String position 0 is the leftmost (most significant) bit, as in the QI/IBMQ exports."""
+    def __init__(self, codes, widths, suffix):
+        self.codes = np.asarray(codes, dtype=np.uint64)
+        self.widths = np.broadcast_to(np.asarray(widths, dtype=np.uint8), self.codes.shape)
+        self.suffix = np.broadcast_to(np.asarray(suffix, dtype=bool), self.codes.shape)
+
+    @classmethod
+    def from_strings(cls, bins):
+        """- Pack a column of binary strings, e.g. ['01011b', '10101b']."""
+        return cls(*pack_bins(bins))
+
+    def to_strings(self):
+        """- The column as binary strings again."""
+        return unpack_bins(self.codes, self.widths, self.suffix)
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __getitem__(self, rows):
+        return BitColumn(self.codes[rows], self.widths[rows], self.suffix[rows])
+
+    @property
+    def nbytes(self):
+        return self.codes.nbytes + self.widths.nbytes + self.suffix.nbytes
+
+    def complement(self):
+        """- Bitwise complement of every binary string within its width (the 'b' flag is kept)."""
+        return BitColumn(self.codes ^ width_mask(self.widths), self.widths, self.suffix)
+
+    def bit(self, pos):
+        """- The bit at string position pos of every row (0 = leftmost), as uint8."""
+        pos = np.asarray(pos, dtype=np.int64)
+        if np.any(pos < 0) or np.any(pos >= self.widths):
+            raise IndexError(f'Bit position {pos} out of the binary string width!')
+        shift = (self.widths.astype(np.int64) - 1 - pos).astype(np.uint64)
+        return ((self.codes >> shift) & np.uint64(1)).astype(np.uint8)
+
+    def pair(self, pos):
+        """- Pair code 0..3 (|00>..|11>) of the two bits at string positions pos, pos+1 of every row."""
+        pos = np.asarray(pos, dtype=np.int64)
+        return (self.bit(pos) << 1) | self.bit(pos + 1)
+
+    def hamming(self, other):
+        """- Hamming distance of every row to another column (row by row) or to one binary string."""
+        if isinstance(other, str):
+            other = BitColumn.from_strings([other])
+        return popcount(self.codes ^ other.codes)
+
+    def parity(self):
+        """- Parity (0 even, 1 odd number of 1 bits) of every row."""
+        return popcount(self.codes) & np.uint8(1)
+
+PAIR_LABELS = np.array(['00', '01', '10', '11'])  # Pair code -> qubit pair |ij>.
+
+class PairLayout:
+    """- Where the focused qubit pairs sit in a binary string of length L (digits plus 'b').
+    Pairs start at floor(L/2) + offset and repeat every stride characters (stride=None is
+    floor(L/2)). With suffix=True the pair ending on the 'b' marker gives the classical bit."""
+    def __init__(self, name, offset=-1, stride=2, suffix=True):
+        self.name = name
+        self.offset = offset
+        self.stride = stride
+        self.suffix = suffix
+
+    def positions(self, length):
+        """- String positions of the pairs for a binary string of the given length (as qdf0/1/2)."""
+        half = length // 2
+        stride = self.stride or max(half, 1)
+        return list(range(max(half + self.offset, 0), length, stride))
+
+    def __repr__(self):
+        return f'PairLayout({self.name!r}, offset={self.offset}, stride={self.stride}, suffix={self.suffix})'
+
+#---------------------------------------------------------------
+# Layouts of qdf_PAnalysis(): qdf0 and qdf1 for QI datasets of
+# string lengths <= 6 and > 6, qdf2 for IBMQ or other circuits.
+#---------------------------------------------------------------
+QDF0 = PairLayout('qdf0', offset=-1, stride=2)
+QDF1 = PairLayout('qdf1', offset=0, stride=2)
+QDF2 = PairLayout('qdf2', offset=-1, stride=None)
+
+def qdf_layout(length, qi=True):
+    """- Layout picked by qdf_PAnalysis() for a binary string length and dataset platform."""
+    if qi:
+        return QDF0 if length <= 6 else QDF1
+    return QDF2
+
+def extract_pairs(bits, layout=None, qi=True):
+#-----------------------------------------------------------------
+# Focused qubit pair codes (0..3) of every row of a BitColumn as a
+# (rows, pairs) int8 array padded with -1, and the classical bit
+# of every row (-1 when its layout has none). Rows are processed
+# in groups of equal width, all rows of a group at once. With no
+# layout given, each group gets its qdf_PAnalysis() layout.
+#-----------------------------------------------------------------
+    groups = []
+    for w, sfx in sorted(set(zip(bits.widths.tolist(), bits.suffix.tolist()))):
+        rows = np.flatnonzero((bits.widths == w) & (bits.suffix == sfx))
+        length = w + int(sfx)
+        group_layout = layout or qdf_layout(length, qi)
+        groups.append((rows, w, sfx, group_layout.positions(length), group_layout))
+    npairs = max([sum(1 for i in pos if i + 1 < w) for rows, w, sfx, pos, lay in groups] + [0])
+    pairs = np.full((len(bits), npairs), -1, dtype=np.int8)
+    cbit = np.full(len(bits), -1, dtype=np.int8)
+    for rows, w, sfx, pos, lay in groups:
+        group = bits[rows]
+        k = 0
+        for i in pos:
+            if i + 1 < w:  # Both characters are qubit digits.
+                pairs[rows, k] = group.pair(i)
+                k += 1
+            elif i + 1 == w and sfx and lay.suffix:  # The 'Xb' element: classical bit X.
+                cbit[rows] = group.bit(i)
+    return pairs, cbit
+
+def pair_strings(pairs, cbit):
+    """- One row of extract_pairs() output as the qdf list of strings, e.g. ['01', '1b']."""
+    qdf = [str(PAIR_LABELS[p]) for p in pairs if p >= 0]
+    if cbit >= 0:
+        qdf.append(f'{cbit}b')
+    return qdf
+
+def row_pairs(bits, row=0, layout=None, qi=True):
+    """- (pair codes, classical bit, qdf list of strings) of one row of a BitColumn, as qdf_PAnalysis() lists it."""
+    pairs, cbit = extract_pairs(bits[row:row + 1], layout, qi)
+    pairs, cbit = pairs[0].tolist(), int(cbit[0])
+    return pairs, cbit, pair_strings(pairs, cbit)
+
+class PairReport:
+    """- P mass per focused pair state (per pair slot, slot 0 being the central pair), per-qubit
+    marginals P(q[i]=1) with q[0] the rightmost bit, and the classical bit split (0, 1, none)."""
+    def __init__(self, pair_mass, qubit_mass, cbit_mass, name=''):
+        self.name = name
+        self.pair_mass = pair_mass    # (pair slots, 4) array of P mass per pair code.
+        self.qubit_mass = qubit_mass  # (qubits,) array of P(q[i]=1).
+        self.cbit_mass = cbit_mass    # (3,) array of P mass with classical bit 0, 1 or none.
+
+    @property
+    def state_mass(self):
+        """- P mass per pair state of the central (first) focused pair, |00>..|11>."""
+        return self.pair_mass[0] if len(self.pair_mass) else np.zeros(4)
+
+    def verdict(self):
+        """- Pair state label holding the largest P mass on the central focused pair."""
+        return str(PAIR_LABELS[int(np.argmax(self.state_mass))])
+
+    def rows(self):
+        """- The report as (section, key, P mass) rows for a table export."""
+        rows = [('pair', f'{k}:{PAIR_LABELS[c]}', float(m))
+                for k, slot in enumerate(self.pair_mass) for c, m in enumerate(slot)]
+        rows += [('qubit', f'q[{i}]=1', float(m)) for i, m in enumerate(self.qubit_mass)]
+        rows += [('cbit', key, float(m)) for key, m in zip(('0b', '1b', 'none'), self.cbit_mass)]
+        return rows
+
+    def to_csv(self, path):
+        """- Write the report as a "section,key,probability" table."""
+        with open(path, 'w', newline='') as file_to_write:
+            writer = csv.writer(file_to_write)
+            writer.writerow(['section', 'key', 'probability'])
+            writer.writerows(self.rows())
+
+def pair_report(bits, probs, layout=None, qi=True, name=''):
+#-----------------------------------------------------------------
+# Aggregate the P column over all rows of a dataset: pair state
+# mass per focused pair slot, per-qubit marginals and the classical
+# bit split, each as one weighted bincount over every row at once.
+#-----------------------------------------------------------------
+    probs = np.asarray(probs, dtype=np.float64)
+    pairs, cbit = extract_pairs(bits, layout, qi)
+    slots = pairs.shape[1]
+    valid = pairs >= 0
+    index = (np.arange(slots) * 4 + pairs)[valid]
+    weights = np.broadcast_to(probs[:, None], pairs.shape)[valid]
+    pair_mass = np.bincount(index, weights=weights, minlength=slots * 4).reshape(slots, 4)
+    nqubits = int(bits.widths.max()) if len(bits) else 0
+    shifts = np.arange(nqubits, dtype=np.uint64)
+    set_bits = ((bits.codes[:, None] >> shifts) & np.uint64(1)).astype(np.float64)
+    set_bits[shifts[None, :] >= bits.widths[:, None]] = 0  # Qubits beyond a row width are not measured.
+    qubit_mass = probs @ set_bits
+    cbit_mass = np.bincount(np.where(cbit < 0, 2, cbit), weights=probs, minlength=3)
+    return PairReport(pair_mass, qubit_mass, cbit_mass, name=name)
+
+#---------------------------------------------------------------
+# Alignment of outcomes from different register layouts (e.g. the
+# 4-bit IBM QDF counts, 5/6-bit QI exports with a 'b' marker) onto
+# one common qubit ordering, through a qubit map per layout width.
+# Each map is backed by a lookup table of the aligned code of every
+# source code, built once, so aligning a column is one array index.
+#---------------------------------------------------------------
+MAX_LUT_WIDTH = 20  # Widest layout given a lookup table (2^20 codes); wider ones are aligned bit by bit.
+
+class QubitMap:
+    """- Common qubit position of every classical bit c[i] (c[0] rightmost) of a register
+    layout of len(positions) bits, or -1 for a bit left out of the comparison."""
+    def __init__(self, positions, name=''):
+        self.positions = np.asarray(positions, dtype=np.int64)
+        self.name = name
+        kept = self.positions[self.positions >= 0]
+        if len(np.unique(kept)) != len(kept) or (kept >= MAX_WIDTH).any():
+            raise ValueError(f'Qubit map {name!r}: common positions must be distinct and below {MAX_WIDTH}!')
+        self._lut = None
+
+    @classmethod
+    def prefix(cls, width, common_width):
+        """- Map lining up the leftmost bits of a width-bit layout with those of the common
+        ordering, as the binary string prefix match of PAnalysis_model() did. Rightmost bits
+        beyond the common width are left out."""
+        positions = np.arange(width) + common_width - width
+        return cls(np.where(positions >= 0, positions, -1), name=f'prefix{width}:{common_width}')
+
+    @property
+    def width(self):
+        return len(self.positions)
+
+    @property
+    def mask(self):
+        """- Common ordering mask of the qubit positions this map covers."""
+        return np.uint64(sum(1 << int(p) for p in self.positions if p >= 0))
+
+    @property
+    def lut(self):
+        """- Aligned code of every source code 0..2^width-1, built on first use."""
+        if self._lut is None:
+            self._lut = self.align_bits(np.arange(2**self.width, dtype=np.uint64))
+        return self._lut
+
+    def align_bits(self, codes):
+        """- Aligned codes computed bit by bit (no lookup table)."""
+        codes = np.asarray(codes, dtype=np.uint64)
+        aligned = np.zeros(codes.shape, dtype=np.uint64)
+        for i, p in enumerate(self.positions):
+            if p >= 0:
+                aligned |= ((codes >> np.uint64(i)) & np.uint64(1)) << np.uint64(p)
+        return aligned
+
+    def align(self, codes):
+        """- Common ordering codes of source codes of this layout."""
+        if self.width <= MAX_LUT_WIDTH:
+            return self.lut[np.asarray(codes, dtype=np.int64)]
+        return self.align_bits(codes)
+
+    def __repr__(self):
+        return f'QubitMap({self.name!r}, {self.positions.tolist()})'
+
+class AlignmentIndex:
+    """- Qubit maps by layout width onto a common_width-bit ordering; widths with no map given
+    use QubitMap.prefix(). Maps and their lookup tables are kept for reuse."""
+    def __init__(self, common_width, maps=None):
+        self.common_width = int(common_width)
+        self.maps = dict(maps or {})
+
+    def qubit_map(self, width):
+        width = int(width)
+        if width not in self.maps:
+            self.maps[width] = QubitMap.prefix(width, self.common_width)
+        return self.maps[width]
+
+    def align(self, bits):
+        """- (aligned codes, covered mask) of every row of a BitColumn, one width group at a time."""
+        codes = np.zeros(len(bits), dtype=np.uint64)
+        masks = np.zeros(len(bits), dtype=np.uint64)
+        for w in map(int, np.unique(bits.widths)):
+            rows = np.flatnonzero(bits.widths == w)
+            qmap = self.qubit_map(w)
+            codes[rows] = qmap.align(bits.codes[rows])
+            masks[rows] = qmap.mask
+        return codes, masks
+
+    def aligned(self, bits):
+        """- The rows of a BitColumn as common_width-bit binary strings (no 'b' marker)."""
+        return BitColumn(self.align(bits)[0], self.common_width, False)
+
+    def match(self, bits, other):
+        """- True for every row of bits that equals the matching row of other (or its single
+        row) on the common qubits covered by both layouts."""
+        codes, masks = self.align(bits)
+        other_codes, other_masks = self.align(other)
+        both = masks & other_masks
+        return (codes & both) == (other_codes & both)
+
+def bins_match(s1, s2, common_width=None, maps=None):
+#-----------------------------------------------------------------
+# True if binary string s1 (e.g. 010100b) and s2 (e.g. 0101) hold
+# the same bits on the common qubits of their layouts, aligned by
+# the qubit maps given per width (leftmost bits lined up if none).
+#-----------------------------------------------------------------
+    bits = BitColumn.from_strings([s1, s2])
+    index = AlignmentIndex(common_width or int(bits.widths.max()), maps)
+    return bool(index.match(bits[:1], bits[1:])[0])
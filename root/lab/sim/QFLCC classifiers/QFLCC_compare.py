@@ -0,0 +1,65 @@
+##################################################################################
+# Distances between measurement outcome P distributions for the QAI-LCode_QFLCC.py
+# program, the QDF_fit.py fitting engine and the QFLCC dataset comparisons.
+# Standard filename is: QFLCC_compare.py
+# A dataset P table lined up on the QDF register (QDF_fit.observed_vector())
+# is a dense P vector matching the outcome P's of QDF_sim.simulate(), indexed
+# by the classical register value. Every distance works on the last axis and
+# broadcasts over the others, so a dataset is compared to a whole batch of
+# simulated circuits in one call. Datasets of different origin are lined up by
+# support_matrix() over the union of their binary strings.
+##################################################################################
+import numpy as np
+
+EPS = 1e-12  # Floor of the model P's in the KL divergence.
+
+def total_variation(p, q):
+    """- Total variation distance, half the L1 distance of two P distributions."""
+    return 0.5*np.abs(np.asarray(p) - np.asarray(q)).sum(axis=-1)
+
+def kl_divergence(p, q, eps=EPS):
+    """- Kullback-Leibler divergence KL(p || q) of the observed P's p from the model P's q, in nats."""
+    p, q = np.broadcast_arrays(np.asarray(p, dtype=float), np.asarray(q, dtype=float))
+    terms = np.where(p > 0, p*np.log(np.where(p > 0, p, 1)/np.where(p > 0, np.maximum(q, eps), 1)), 0.0)
+    return terms.sum(axis=-1)
+
+def hellinger(p, q):
+    """- Hellinger distance of two P distributions, in [0, 1]."""
+    root = np.sqrt(np.clip(np.asarray(p, dtype=float), 0, None)) - np.sqrt(np.clip(np.asarray(q, dtype=float), 0, None))
+    return np.sqrt(0.5*(root**2).sum(axis=-1))
+
+def js_divergence(p, q):
+    """- Jensen-Shannon divergence of two P distributions, in bits (in [0, 1])."""
+    p, q = np.broadcast_arrays(np.asarray(p, dtype=float), np.asarray(q, dtype=float))
+    m = 0.5*(p + q)
+    return 0.5*(kl_divergence(p, m, 0) + kl_divergence(q, m, 0))/np.log(2)
+
+#---------------------------------------------------------------
+# Distance registry keyed by name.
+# * Add an entry here for any other distance of P distributions.
+#---------------------------------------------------------------
+DISTANCES = {'tv': total_variation,
+             'kl': kl_divergence,
+             'hellinger': hellinger,
+             'js': js_divergence}
+
+def distance(name):
+    """- Distance function of a registered name."""
+    if name not in DISTANCES:
+        raise ValueError(f'Unknown distance {name!r}, expected one of {list(DISTANCES)}!')
+    return DISTANCES[name]
+
+def support_matrix(datasets, key=None):
+#-----------------------------------------------------------------
+# P's of several datasets over their aligned binary string support,
+# as (support, P matrix) with one row per dataset and one column per
+# support key in sorted order. key maps the binary strings of a
+# dataset to their support keys (by default the binary strings as
+# written); P's of binary strings with the same key are summed.
+#-----------------------------------------------------------------
+    keys = [np.asarray(key(d) if key else d.bins, dtype=str) for d in datasets]
+    support, index = np.unique(np.concatenate(keys), return_inverse=True)
+    probs = np.zeros((len(datasets), len(support)))
+    rows = np.repeat(np.arange(len(datasets)), [len(k) for k in keys])
+    np.add.at(probs, (rows, index.ravel()), np.concatenate([d.probs for d in datasets]))
+    return support, probs
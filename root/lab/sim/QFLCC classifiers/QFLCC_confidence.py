@@ -0,0 +1,193 @@
+##################################################################################
+# Confidence intervals and significance of the Δp match verdicts for the
+# PAnalysis_model() step of the QAI-LCode_QFLCC.py program.
+# Standard filename is: QFLCC_confidence.py
+# The Δp verdicts compare P's estimated from a finite number of shots (e.g. 8192
+# shots of the IBM QDF circuit against a 1024-shot QI export), so a "match" may be
+# within shot noise. Here:
+# * every outcome P gets an analytic Clopper-Pearson (or Wilson score) interval,
+# * the Δp of max(P) and min(P) matches get parametric bootstrap intervals, with
+#   the share of bootstrap replicates giving each verdict of QFLCC_verdict.py,
+# * the equality of the two outcome distributions is tested by a parametric
+#   bootstrap of their total variation distance under the pooled distribution.
+# Replicates are drawn as whole (replicates, outcomes) multinomial count arrays,
+# so thousands of them cost a few array operations. Exact P's (no shots, e.g. the
+# QDF_MODE=exact reference) are taken as known and are not resampled.
+##################################################################################
+import math
+import numpy as np
+from QFLCC_verdict import classify, delta_match
+
+Z95 = 1.959963984540054  # Standard normal quantile of a 95% two-sided interval.
+REPLICATES = 4000
+DEFAULT_SHOTS = 1024  # Shots of a QI export whose P's do not give away their shot count.
+SEED = 2024  # Bootstrap seed of PAnalysis_model(), so a verdict gets the same shares on every run.
+
+def wilson_interval(p, n, z=Z95):
+    """- Wilson score interval (low, high) of binomial P estimates p from n shots (arrays broadcast)."""
+    p, n = np.asarray(p, dtype=float), np.asarray(n, dtype=float)
+    center = (p + z**2/(2*n))/(1 + z**2/n)
+    half = z*np.sqrt(p*(1 - p)/n + z**2/(4*n**2))/(1 + z**2/n)
+    return np.clip(center - half, 0, 1), np.clip(center + half, 0, 1)
+
+def binomial_cdf(k, n, p):
+    """- P(X <= k) of X ~ Binomial(n, p) for arrays k and p of the same shape (one n)."""
+    j = np.arange(n + 1)
+    log_comb = np.concatenate([[0.0], np.cumsum(np.log((n - j[1:] + 1)/j[1:]))])
+    p = np.clip(np.asarray(p, dtype=float), 1e-300, 1 - 1e-16)[..., None]
+    log_pmf = log_comb + j*np.log(p) + (n - j)*np.log1p(-p)
+    return np.where(j <= np.asarray(k)[..., None], np.exp(log_pmf), 0).sum(axis=-1)
+
+def clopper_pearson(k, n, alpha=0.05, steps=60):
+#-----------------------------------------------------------------
+# Clopper-Pearson (exact) interval (low, high) of k successes in n
+# shots, for an array k and one n, by bisection on the binomial CDF.
+#-----------------------------------------------------------------
+    k = np.asarray(k, dtype=np.int64)
+    n = int(n)
+    if (k < 0).any() or (k > n).any():
+        raise ValueError(f'Counts must lie within 0..{n} shots!')
+    bounds = []
+    for target, side in ((1 - alpha/2, k - 1), (alpha/2, k)):  # low: P(X >= k) = alpha/2, high: P(X <= k) = alpha/2
+        lo, hi = np.zeros(k.shape), np.ones(k.shape)
+        for _ in range(steps):
+            mid = 0.5*(lo + hi)
+            above = binomial_cdf(side, n, mid) > target  # CDF falls as p grows.
+            lo, hi = np.where(above, mid, lo), np.where(above, hi, mid)
+        bounds.append(0.5*(lo + hi))
+    low, high = bounds
+    return np.where(k == 0, 0.0, low), np.where(k == n, 1.0, high)
+
+#---------------------------------------------------------------
+# Per-outcome interval registry keyed by name, as functions of
+# (P's, shots, level) returning (low, high) arrays.
+# * Add an entry here for any other binomial interval.
+#---------------------------------------------------------------
+INTERVALS = {'wilson': lambda p, n, level: wilson_interval(p, n, normal_quantile(0.5 + level/2)),
+             'clopper-pearson': lambda p, n, level: clopper_pearson(np.round(np.asarray(p)*n), n, 1 - level)}
+
+def normal_quantile(q, steps=60):
+    """- Standard normal quantile of q in (0, 1), by bisection on the error function."""
+    lo, hi = -40.0, 40.0
+    for _ in range(steps):
+        mid = 0.5*(lo + hi)
+        lo, hi = (mid, hi) if 0.5*(1 + math.erf(mid/math.sqrt(2))) < q else (lo, mid)
+    return 0.5*(lo + hi)
+
+def outcome_intervals(probs, shots, level=0.95, method='clopper-pearson'):
+    """- (low, high) arrays of the P of every outcome from shots shots; the P's themselves when shots is None."""
+    if method not in INTERVALS:
+        raise ValueError(f'Unknown interval {method!r}, expected one of {list(INTERVALS)}!')
+    probs = np.asarray(probs, dtype=float)
+    if shots is None:
+        return probs.copy(), probs.copy()
+    return INTERVALS[method](probs, int(shots), level)
+
+def infer_shots(probs, max_shots=1 << 16, tol=1e-6):
+    """- Smallest power of 2 shot count giving whole counts for every P of an export, or None."""
+    probs = np.asarray(probs, dtype=float)
+    n = 1
+    while n <= max_shots:
+        if np.all(np.abs(probs*n - np.round(probs*n)) < tol*n):
+            return n
+        n <<= 1
+    return None
+
+def dataset_shots(dataset, default=DEFAULT_SHOTS):
+    """- Shots behind a dataset: its counted shots, else inferred from its P's, else default."""
+    return dataset.shots or infer_shots(dataset.probs) or default
+
+def resample(probs, shots, replicates, rng):
+    """- (replicates, outcomes) P's of multinomial resamples; the P's themselves when shots is None."""
+    probs = np.clip(np.asarray(probs, dtype=float), 0, None)
+    probs = probs/probs.sum()
+    if shots is None:
+        return np.broadcast_to(probs, (replicates, len(probs)))
+    return rng.multinomial(int(shots), probs, size=replicates)/shots
+
+class MatchConfidence:
+    """- Δp of min(P)/max(P) matches with bootstrap intervals, the share of replicates per
+    verdict, the p-value of the equality test of the two outcome distributions, and the
+    (low, high) interval arrays of every reference and dataset outcome P."""
+    def __init__(self, match_min, match_max, min_interval, max_interval, verdict_share, tv, p_value,
+                 replicates, level=0.95, ref_intervals=None, data_intervals=None):
+        self.match_min = match_min
+        self.match_max = match_max
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.verdict_share = verdict_share  # {verdict: share of bootstrap replicates}
+        self.tv = tv  # Total variation distance of the two outcome distributions.
+        self.p_value = p_value
+        self.replicates = replicates
+        self.level = level
+        self.ref_intervals = ref_intervals
+        self.data_intervals = data_intervals
+
+    def outcome_text(self, side, index):
+        """- Interval of outcome index of the 'ref' or 'data' P's, as text."""
+        low, high = self.ref_intervals if side == 'ref' else self.data_intervals
+        return f'[{low[index]:.3f}, {high[index]:.3f}]'
+
+    def share(self, verdict):
+        return self.verdict_share.get(verdict, 0.0)
+
+    def significant(self, alpha=0.05):
+        """- True if the equality of the two distributions is rejected at level alpha."""
+        return self.p_value < alpha
+
+    def __str__(self):
+        lo1, hi1 = self.min_interval
+        lo2, hi2 = self.max_interval
+        return (f'{self.level:.0%} CI of min(P) match [{lo1:.2f}, {hi1:.2f}], max(P) match [{lo2:.2f}, {hi2:.2f}]; '
+                f'TV = {self.tv:.3f}, equality test p = {self.p_value:.3g} ({self.replicates} replicates)')
+
+def equality_test(ref, data, ref_shots=None, data_shots=None, replicates=REPLICATES, rng=None):
+#-----------------------------------------------------------------
+# Parametric bootstrap test that a reference and a dataset P vector
+# (lined up on the same outcomes) come from one distribution: the
+# total variation distance of the two samples against that of pairs
+# of samples redrawn from their pooled P's. Returns (TV, p-value).
+#-----------------------------------------------------------------
+    ref, data = np.asarray(ref, dtype=float), np.asarray(data, dtype=float)
+    if ref.shape != data.shape:
+        raise ValueError('Reference and dataset P vectors must be lined up on the same outcomes!')
+    ref, data = ref/ref.sum(), data/data.sum()
+    tv = float(0.5*np.abs(ref - data).sum())
+    if ref_shots is None and data_shots is None:  # Exact P's on both sides, nothing to resample.
+        return tv, (1.0 if tv < 1e-12 else 0.0)
+    if ref_shots is None or data_shots is None:  # One side is known exactly: the null is that distribution.
+        pooled = ref if ref_shots is None else data
+    else:
+        pooled = (ref*ref_shots + data*data_shots)/(ref_shots + data_shots)
+    rng = rng or np.random.default_rng()
+    null_tv = 0.5*np.abs(resample(pooled, ref_shots, replicates, rng)
+                         - resample(pooled, data_shots, replicates, rng)).sum(axis=1)
+    return tv, float((1 + (null_tv >= tv - 1e-12).sum())/(replicates + 1))
+
+def match_confidence(ref, data, ref_shots=None, data_shots=None, aligned=None, points=None,
+                     replicates=REPLICATES, level=0.95, seed=None, method='clopper-pearson'):
+#-----------------------------------------------------------------
+# Bootstrap the Δp match verdict of a reference and a dataset, each
+# given by the P's of its own outcomes as in PAnalysis_model(). A
+# shots of None takes the P's as exact. Every replicate redraws both
+# samples and classifies the Δp matches of all replicates at once.
+# points = ((ref min, ref max), (data min, data max)) are the P's
+# the verdict is classified from (by default the min/max of ref and
+# data); the resampled min/max P's are centered on them. aligned =
+# (reference, dataset) P vectors lined up on common outcomes, for
+# the equality test (ref and data themselves when not given).
+#-----------------------------------------------------------------
+    ref, data = np.asarray(ref, dtype=float), np.asarray(data, dtype=float)
+    (ref_min, ref_max), (data_min, data_max) = points or ((ref.min(), ref.max()), (data.min(), data.max()))
+    rng = np.random.default_rng(seed)
+    ref_b, data_b = resample(ref, ref_shots, replicates, rng), resample(data, data_shots, replicates, rng)
+    match_min = delta_match(ref_b.min(axis=1) - ref.min() + ref_min, data_b.min(axis=1) - data.min() + data_min)
+    match_max = delta_match(ref_b.max(axis=1) - ref.max() + ref_max, data_b.max(axis=1) - data.max() + data_max)
+    tails = [100*(1 - level)/2, 100*(1 + level)/2]
+    verdicts, counts = np.unique(classify(match_min, match_max)[0].astype(str), return_counts=True)
+    tv, p_value = equality_test(*(aligned or (ref, data)), ref_shots, data_shots, replicates, rng)
+    return MatchConfidence(float(delta_match(ref_min, data_min)), float(delta_match(ref_max, data_max)),
+                           tuple(np.percentile(match_min, tails)), tuple(np.percentile(match_max, tails)),
+                           dict(zip(verdicts.tolist(), (counts/replicates).tolist())), tv, p_value, replicates, level,
+                           outcome_intervals(ref, ref_shots, level, method),
+                           outcome_intervals(data, data_shots, level, method))
@@ -0,0 +1,310 @@
+##################################################################################
+# QFLCA dataset loader for the QAI-LCode_QFLCC.py program.
+# Standard filename is: QFLCC_dataset.py
+# A "binary_string,probability" dataset file is parsed once into typed columns
+# (str binary strings, float64 probabilities). The max/min P, their row index
+# and the binary string complement used by dataframe(), PAnalysis(),
+# qdf_PAnalysis() and PAnalysis_model() are computed once and cached on the
+# dataset object instead of being recomputed per row and per step.
+# Shot logs ("shot,binary_string" rows as in raw_data.csv) are streamed chunk by
+# chunk into running counts per binary string and emitted as the same P table.
+# The *.csv, *.json and *.htm exports of a QI/IBMQ experiment are read through
+# a reader registry keyed by file extension. A chosen export is read as is; for
+# a bare dataset stem the cheapest export available is read, falling back to
+# the others on a read error.
+# Parsed datasets are kept in a __qflcc_cache__ sidecar folder as typed arrays
+# (packed binary strings + float64 P's) keyed by file name, size and mtime, and
+# are loaded back with a memory map while the dataset file is unchanged.
+##################################################################################
+import csv
+import json
+import os
+from collections import Counter
+from html.parser import HTMLParser
+from pathlib import Path  # For accessing and conduct operations on files/directories
+import numpy as np
+import pandas as pd
+from QFLCC_bits import BitColumn  # Packed-integer binary strings.
+
+DATASET_COLUMNS = ['binary_string', 'probability']  # Columns every dataset table holds.
+
+def bin_complement(bit):
+    """- Complement of a binary string, e.g. 01011b -> 10100b (the classical bit marker is kept)."""
+    return bit.replace("1", "2").replace("0", "1").replace("2", "0")
+
+class PDataset:
+    """- Measurement outcome probability (P) table of a QDF circuit dataset,
+    parsed once with its max/min P statistics cached."""
+    def __init__(self, bins, probs, name='', path=None, counts=None, shots=None):
+        self.name = name
+        self.path = path
+        self.counts = counts  # Counts per binary string when built from a shot log, else None.
+        self.shots = shots
+        self.bins = np.asarray(bins, dtype=str)
+        self.probs = np.asarray(probs, dtype=np.float64)
+        if self.bins.shape != self.probs.shape:
+            raise ValueError(f'{name}: binary_string and probability columns differ in length!')
+        if len(self.probs) == 0:
+            raise ValueError(f'{name}: empty dataset!')
+        self._frame = None
+        self._bits = None
+        # One pass statistics of the P column.
+        self.argmax = int(np.argmax(self.probs))
+        self.argmin = int(np.argmin(self.probs))
+        self.p_max = float(self.probs[self.argmax])
+        self.p_min = float(self.probs[self.argmin])
+        self.max_bin = str(self.bins[self.argmax])
+        self.min_bin = str(self.bins[self.argmin])
+        self.complement_bin = bin_complement(self.max_bin)  # Complement of the max P binary string.
+        self.complement_p = 1 - self.p_max   # P' complement for the bitpair.
+
+    @classmethod
+    def from_csv(cls, path):
+#-----------------------------------------------------------------
+# Parse a *.csv dataset file once, finding its binary_string and
+# probability columns by header name. A count column (as in the
+# QDF circuit stats table) is kept as the dataset counts. A
+# "shot,binary_string" shot log is streamed into its P table.
+#-----------------------------------------------------------------
+        bins, probs, counts = [], [], []
+        with open(path, 'r', newline='') as x:
+            reader = csv.DictReader(x, delimiter=",")
+            header = [h.strip() for h in reader.fieldnames or []]
+            if header[:1] == ['shot']:
+                return read_shots(path)
+            missing = [c for c in DATASET_COLUMNS if c not in header]
+            if missing:
+                raise ValueError(f'{Path(path).name}: no {", ".join(missing)} column, not a dataset table!')
+            reader.fieldnames = header
+            for row in reader:
+                if row['binary_string']:
+                    bins.append(row['binary_string'].strip())
+                    probs.append(float(row['probability']))
+                    counts.append(int(row['count']) if 'count' in header else -1)
+        if counts and all(n >= 0 for n in counts):
+            return cls(bins, probs, name=Path(path).name, path=str(path),
+                       counts=dict(zip(bins, counts)), shots=sum(counts))
+        return cls(bins, probs, name=Path(path).name, path=str(path))
+
+    @classmethod
+    def from_table(cls, table, name='', path=None):
+        """- Build a dataset from a CACHE_DTYPE structured array (e.g. a memory mapped cache entry)."""
+        bits = BitColumn(table['code'], table['width'], table['suffix'])
+        bins = bits.to_strings()
+        counts = shots = None
+        if len(table) and (table['count'] >= 0).all():
+            counts = dict(zip(bins.tolist(), table['count'].tolist()))
+            shots = int(table['count'].sum())
+        dataset = cls(bins, table['probability'], name=name, path=path, counts=counts, shots=shots)
+        dataset._bits = bits
+        return dataset
+
+    @property
+    def bits(self):
+        """- The binary_string column as a packed BitColumn, built once on first use."""
+        if self._bits is None:
+            self._bits = BitColumn.from_strings(self.bins)
+        return self._bits
+
+    def to_table(self):
+        """- The dataset as a CACHE_DTYPE structured array of packed binary strings and P's."""
+        table = np.zeros(len(self), dtype=CACHE_DTYPE)
+        table['code'], table['width'], table['suffix'] = self.bits.codes, self.bits.widths, self.bits.suffix
+        table['probability'] = self.probs
+        table['count'] = [self.counts[b] for b in self.bins] if self.counts else -1
+        return table
+
+    def __len__(self):
+        return len(self.probs)
+
+    def rows(self):
+        """- Table data list as printed by csv_analyzer(), header row first."""
+        return [['binary_string', 'probability']] + [[b, repr(p)] for b, p in zip(self.bins, self.probs)]
+
+    def to_frame(self):
+        """- The dataset as a pandas dataframe, built once on first use."""
+        if self._frame is None:
+            self._frame = pd.DataFrame({'binary_string': self.bins, 'probability': self.probs})
+        return self._frame
+
+    def max_rows(self):
+        """- Rows (as a dataframe) holding the max P value of the dataset."""
+        df = self.to_frame()
+        return df[self.probs == self.p_max]
+
+    def min_rows(self):
+        """- Rows (as a dataframe) holding the min P value of the dataset."""
+        df = self.to_frame()
+        return df[self.probs == self.p_min]
+
+    def to_csv(self, path):
+        """- Write the P table in the "binary_string,probability" layout of the QI_Exp_*.csv files."""
+        with open(path, 'w', newline='') as file_to_write:
+            writer = csv.writer(file_to_write)
+            writer.writerow(['binary_string', 'probability'])
+            writer.writerows(zip(self.bins, (repr(float(p)) for p in self.probs)))
+
+#---------------------------------------------------------------
+# Sidecar cache of parsed datasets. One *.npy entry per dataset
+# file, named <file name>.<size>-<mtime_ns>-v<version>.npy, so
+# any change to the file, or to how the readers parse it (a new
+# CACHE_VERSION), makes its previous entry stale.
+#---------------------------------------------------------------
+CACHE_DIR = '__qflcc_cache__'
+CACHE_VERSION = 2
+CACHE_DTYPE = np.dtype([('code', '<u8'), ('width', 'u1'), ('suffix', '?'),
+                        ('probability', '<f8'), ('count', '<i8')])
+
+def cache_path(path):
+    """- Cache entry of a dataset file for its current size and mtime."""
+    path = Path(path)
+    st = os.stat(path)
+    return path.parent / CACHE_DIR / f'{path.name}.{st.st_size}-{st.st_mtime_ns}-v{CACHE_VERSION}.npy'
+
+def read_cached(path, reader):
+#-----------------------------------------------------------------
+# Load a dataset from its cache entry with a memory map, or parse
+# it with the reader and store a new entry in place of stale ones.
+# A cache that cannot be written (e.g. read-only folder) is skipped.
+#-----------------------------------------------------------------
+    path = Path(path)
+    entry = cache_path(path)
+    if entry.is_file():
+        try:
+            return PDataset.from_table(np.load(entry, mmap_mode='r'), name=path.name, path=str(path))
+        except (OSError, ValueError):
+            pass  # Unreadable entry, parse the dataset again.
+    dataset = reader(path)
+    try:
+        table = dataset.to_table()
+        entry.parent.mkdir(exist_ok=True)
+        for stale in os.listdir(entry.parent):
+            if stale.startswith(path.name + '.') and stale.endswith('.npy') and stale != entry.name:
+                os.remove(entry.parent / stale)
+        tmp = entry.with_name(entry.name + '.tmp')
+        with open(tmp, 'wb') as file_to_write:
+            np.save(file_to_write, table)
+        os.replace(tmp, entry)
+    except (OSError, ValueError):
+        pass
+    return dataset
+
+class ShotHistogram:
+    """- Running counts per binary string of a shot log, updated chunk by chunk.
+    Memory is bounded by the number of distinct outcomes, not the number of shots."""
+    def __init__(self):
+        self.counts = Counter()
+        self.shots = 0
+
+    def update(self, bitstrings):
+        """- Add a chunk of measured binary strings (any iterable or pandas series)."""
+        if isinstance(bitstrings, pd.Series):
+            chunk = bitstrings.str.strip().value_counts(sort=False)
+            self.counts.update(dict(zip(chunk.index, chunk.to_numpy().tolist())))
+            self.shots += int(chunk.sum())
+        else:
+            chunk = Counter(b.strip() for b in bitstrings)
+            self.counts.update(chunk)
+            self.shots += sum(chunk.values())
+
+    def dataset(self, name='', path=None):
+        """- The P table of the shots counted so far, sorted by binary string."""
+        if self.shots == 0:
+            raise ValueError(f'{name}: no shots counted!')
+        bins = sorted(self.counts)
+        counts = np.array([self.counts[b] for b in bins], dtype=np.int64)
+        return PDataset(bins, counts/self.shots, name=name, path=path,
+                        counts=dict(zip(bins, counts.tolist())), shots=self.shots)
+
+def read_shots(path, chunksize=1 << 16, column='binary_string'):
+#-----------------------------------------------------------------
+# Stream a "shot,binary_string" shot log in chunks of rows into a
+# probability table, without loading the whole log at once.
+#-----------------------------------------------------------------
+    histogram = ShotHistogram()
+    for chunk in pd.read_csv(path, usecols=[column], dtype={column: str}, chunksize=chunksize):
+        histogram.update(chunk[column].dropna())
+    return histogram.dataset(name=Path(path).name, path=str(path))
+
+def read_json(path):
+    """- Read a *.json export, a list of {binary_string, probability} objects."""
+    with open(path, 'r') as x:
+        records = json.load(x)
+    return PDataset([str(r['binary_string']).strip() for r in records],
+                    [float(r['probability']) for r in records], name=Path(path).name, path=str(path))
+
+class _TableParser(HTMLParser):
+    """- Collects the <td> cells of each <tr> row of an *.htm table export."""
+    def __init__(self):
+        super().__init__()
+        self.rows = []
+        self._cell = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'tr':
+            self.rows.append([])
+        elif tag == 'td':
+            self._cell = ''
+
+    def handle_endtag(self, tag):
+        if tag == 'td' and self._cell is not None:
+            self.rows[-1].append(self._cell.strip())
+            self._cell = None
+
+    def handle_data(self, data):
+        if self._cell is not None:
+            self._cell += data
+
+def read_htm(path):
+    """- Read an *.htm table export with binary_string and probability columns."""
+    parser = _TableParser()
+    with open(path, 'r') as x:
+        parser.feed(x.read())
+    rows = [row for row in parser.rows if len(row) >= 2]
+    return PDataset([row[0] for row in rows], [float(row[1]) for row in rows],
+                    name=Path(path).name, path=str(path))
+
+#---------------------------------------------------------------
+# Reader registry keyed by file extension, in order of parsing
+# cost (cheapest first) when several exports of a dataset exist.
+# * Add an entry here for any other dataset export format.
+#---------------------------------------------------------------
+READERS = {'.csv': PDataset.from_csv,
+           '.json': read_json,
+           '.htm': read_htm,
+           '.html': read_htm}
+
+def load_dataset(path, cache=True):
+#-----------------------------------------------------------------
+# Load a dataset through the reader registry. The path may be any
+# export of the dataset, which is then the one read, or its stem
+# (e.g. QI_Exp_04). For a stem the cheapest export present is read
+# first; the others are tried in turn when a reader fails. With
+# cache=True, unchanged files are loaded from the __qflcc_cache__
+# sidecar folder instead of being parsed.
+#-----------------------------------------------------------------
+    path = Path(path)
+    if path.is_file() and path.suffix.lower() not in READERS:
+        raise ValueError(f'{path.name}: no dataset reader for the {path.suffix} extension!')
+    if path.suffix.lower() in READERS:
+        candidates = [path] if path.is_file() else []
+    else:
+        candidates = [c for c in (path.with_name(path.name + ext) for ext in READERS) if c.is_file()]
+    if not candidates:
+        raise FileNotFoundError(f'{path}: no {", ".join(READERS)} export of this dataset found!')
+    errors = []
+    for candidate in candidates:
+        try:
+            reader = READERS[candidate.suffix.lower()]
+            return read_cached(candidate, reader) if cache else reader(candidate)
+        except (ValueError, KeyError, IndexError, TypeError, json.JSONDecodeError) as e:
+            errors.append(f'{candidate.name}: {e}')
+    raise ValueError('No readable export of the dataset! ' + '; '.join(errors))
+
+def dataset_stems(paths):
+    """- Unique dataset stems of a list of export files, in order, with unregistered extensions skipped."""
+    stems = []
+    for path in map(Path, paths):
+        if path.suffix.lower() in READERS and path.with_suffix('') not in stems:
+            stems.append(path.with_suffix(''))
+    return stems
@@ -0,0 +1,89 @@
+##################################################################################
+# In-process event log of the QAI-LCode_QFLCC.py program checkpoints.
+# Standard filename is: QFLCC_log.py
+# Every checkpoint (file listing, simulation stages, program exit, game entries)
+# is kept as one JSON line with its timestamp, stage, dataset and message, next to
+# the human-readable line of the shell_output.txt log shown by the QFLCC game GUI.
+# Lines are buffered in memory and written in batches (and at program exit), so
+# logging hundreds of files costs no shell process per line. The JSON log is
+# rotated by size: qflcc_log.jsonl -> qflcc_log.jsonl.1 -> ... up to BACKUPS.
+#--------------------------/// Usage ///-----------------------------------------
+# event_log = EventLog()
+# event_log.start('///--- QFLCC Shell Log_file START ---///')
+# event_log.log('1- Checkpoint logged on ...', stage='listing', dataset='QI_Exp_01.csv')
+##################################################################################
+import atexit
+import datetime  # For recording r/w file time entry
+import json
+import os
+
+LOG_FILE = 'shell_output.txt'  # Human-readable log, read back by the QFLCC game GUI.
+JSONL_FILE = 'qflcc_log.jsonl'
+BATCH = 64  # Events buffered before a write.
+MAX_BYTES = 1 << 20  # JSON log size that triggers a rotation.
+BACKUPS = 3  # Rotated JSON logs kept.
+
+class EventLog:
+    """- Buffered JSON lines event log with a plain text copy, rotated by size."""
+    def __init__(self, path=JSONL_FILE, text_path=LOG_FILE, batch=BATCH, max_bytes=MAX_BYTES, backups=BACKUPS):
+        if batch < 1:
+            raise ValueError('The event log batch must hold at least one event!')
+        self.path = path
+        self.text_path = text_path
+        self.batch = batch
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.pending = []  # (JSON line, text line) pairs not yet written.
+        atexit.register(self.flush)
+
+    def start(self, message):
+        """- Begin a new text log (truncating the previous run's) with a header line; the JSON log is kept."""
+        self.flush()
+        if self.text_path:
+            open(self.text_path, 'w').close()
+        self.log(message, stage='start', flush=True)
+
+    def log(self, message, stage=None, dataset=None, flush=False, **fields):
+#-----------------------------------------------------------------
+# Buffer one event: message is the text log line, stage and
+# dataset (and any other fields) are kept in its JSON line only.
+# The buffer is written when it holds a batch, or on flush=True.
+#-----------------------------------------------------------------
+        record = {'time': datetime.datetime.now().isoformat(timespec='milliseconds'),
+                  'stage': stage, 'dataset': dataset, 'message': message, **fields}
+        self.pending.append((json.dumps(record, ensure_ascii=False, default=str), message))
+        if flush or len(self.pending) >= self.batch:
+            self.flush()
+
+    def flush(self):
+        """- Write the buffered events to both logs."""
+        if not self.pending:
+            return
+        pending, self.pending = self.pending, []
+        lines = ''.join(line + '\n' for line, _ in pending)
+        if self.max_bytes and os.path.exists(self.path) \
+                and os.path.getsize(self.path) + len(lines.encode('utf-8')) > self.max_bytes:
+            self.rotate()
+        with open(self.path, 'a', encoding='utf-8') as file_to_write:
+            file_to_write.write(lines)
+        if self.text_path:
+            with open(self.text_path, 'a', errors='replace') as file_to_write:
+                file_to_write.write(''.join(text + '\n' for _, text in pending))
+
+    def rotate(self):
+        """- Shift the JSON log to *.1, *.1 to *.2 and so on, dropping the oldest past BACKUPS."""
+        for n in range(self.backups, 0, -1):
+            src = self.path if n == 1 else f'{self.path}.{n - 1}'
+            if os.path.exists(src):
+                os.replace(src, f'{self.path}.{n}')
+        if not self.backups and os.path.exists(self.path):
+            os.remove(self.path)
+
+    def close(self):
+        self.flush()
+        atexit.unregister(self.flush)
+
+def read_log(path=JSONL_FILE):
+    """- Events of a JSON log as a list of dicts, oldest first."""
+    with open(path, 'r', encoding='utf-8') as file_to_read:
+        return [json.loads(line) for line in file_to_read if line.strip()]
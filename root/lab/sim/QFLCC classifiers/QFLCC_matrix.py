@@ -0,0 +1,125 @@
+##################################################################################
+# All-pairs similarity matrix between QFLCA datasets and reference distributions
+# for the QAI-LCode_QFLCC.py program.
+# Standard filename is: QFLCC_matrix.py
+# PAnalysis_model() compares one selected dataset with the IBM QDF circuit by its
+# max/min P's only. Here N datasets are compared with M references (QDF circuit
+# stats tables, cQASM *.cq circuits run on the local simulator, or any other
+# dataset) in one run: the P's of all of them are lined up over their union of
+# binary strings and every N x M distance matrix is computed at once:
+# * Δp of max(P) and min(P), and the Δp validation verdict of QFLCC_verdict.py,
+# * total variation, Hellinger distance and Jensen-Shannon divergence.
+# The matrices are written as one row per (dataset, reference) pair (*.csv), and
+# optionally as N x M arrays with their dataset/reference labels (*.npz) for
+# clustering the archive of experiments by circuit configuration. With --align,
+# binary strings of different widths (e.g. 4-bit IBM counts and 6-bit QI exports)
+# are lined up on their common leftmost qubits first (see QFLCC_bits.AlignmentIndex).
+#--------------------------/// Usage ///-----------------------------------------
+# python QFLCC_matrix.py "QI_Exp_*.csv" -r ibm-qdf-stats.csv -r "QDF-LCode (QI).cq" -o QFLCC_matrix.csv
+##################################################################################
+import csv
+from pathlib import Path  # For accessing and conduct operations on files/directories
+import numpy as np
+import click
+from QFLCC_dataset import load_dataset  # Single-parse dataset readers with cached max/min P's.
+from QFLCC_report import archive_run, archive_summary  # Shared failure and summary reporting of the archive CLIs.
+from QFLCC_bits import AlignmentIndex  # Common qubit ordering of different register layouts.
+from QFLCC_compare import hellinger, js_divergence, support_matrix, total_variation
+from QFLCC_verdict import classify, delta_match
+
+MATRIX_METRICS = ['dp_max', 'dp_min', 'match_max', 'match_min', 'tv', 'hellinger', 'js']
+MATRIX_COLUMNS = ['dataset', 'reference'] + MATRIX_METRICS + ['verdict']
+
+def load_reference(path):
+#-----------------------------------------------------------------
+# Load a reference distribution: a *.cq circuit run exactly on the
+# local simulator, or any dataset export (a QDF circuit stats table
+# is read by its column names, with its counts).
+#-----------------------------------------------------------------
+    path = Path(path)
+    if path.suffix.lower() == '.cq':
+        from QDF_cqasm import run_cqasm
+        return run_cqasm(path).to_dataset(name=path.name, path=str(path))
+    return load_dataset(path)
+
+class SimilarityMatrix:
+    """- N x M distance matrices (one per MATRIX_METRICS name) between datasets and references."""
+    def __init__(self, datasets, references, metrics, verdicts):
+        self.datasets = datasets  # Dataset names (rows).
+        self.references = references  # Reference names (columns).
+        self.metrics = metrics  # {metric name: N x M array}
+        self.verdicts = verdicts  # N x M array of Δp validation verdicts.
+
+    def __getitem__(self, metric):
+        return self.metrics[metric]
+
+    def rows(self):
+        """- One row of MATRIX_COLUMNS per (dataset, reference) pair, dataset major."""
+        return [{'dataset': d, 'reference': r,
+                 **{m: float(self.metrics[m][i, j]) for m in MATRIX_METRICS},
+                 'verdict': self.verdicts[i, j]}
+                for i, d in enumerate(self.datasets) for j, r in enumerate(self.references)]
+
+    def to_csv(self, path):
+        with open(path, 'w', newline='') as file_to_write:
+            writer = csv.DictWriter(file_to_write, fieldnames=MATRIX_COLUMNS)
+            writer.writeheader()
+            writer.writerows(self.rows())
+
+    def to_npz(self, path):
+        """- Write every metric matrix with the dataset and reference labels (numpy *.npz)."""
+        np.savez(path, datasets=np.array(self.datasets), references=np.array(self.references),
+                 verdicts=self.verdicts.astype(str), **self.metrics)
+
+def similarity(datasets, references, key=None):
+#-----------------------------------------------------------------
+# Similarity matrices of N datasets against M references (lists of
+# PDataset's), over their union of binary strings (or support keys,
+# see QFLCC_compare.support_matrix).
+#-----------------------------------------------------------------
+    if not datasets or not references:
+        raise ValueError('The similarity matrix needs at least one dataset and one reference!')
+    _, probs = support_matrix(list(datasets) + list(references), key)
+    probs = probs/probs.sum(axis=1, keepdims=True)  # Exports rounded to a total P slightly off 1.
+    data, ref = probs[:len(datasets), None], probs[None, len(datasets):]  # (N, 1, K) and (1, M, K)
+    p_max = np.array([d.p_max for d in datasets])[:, None], np.array([r.p_max for r in references])[None]
+    p_min = np.array([d.p_min for d in datasets])[:, None], np.array([r.p_min for r in references])[None]
+    match_max, match_min = delta_match(p_max[1], p_max[0]), delta_match(p_min[1], p_min[0])
+    metrics = {'dp_max': 1 - match_max,
+               'dp_min': 1 - match_min,
+               'match_max': match_max,
+               'match_min': match_min,
+               'tv': total_variation(data, ref),
+               'hellinger': hellinger(data, ref),
+               'js': js_divergence(data, ref)}
+    verdicts = classify(match_min, match_max)[0]
+    return SimilarityMatrix([d.name for d in datasets], [r.name for r in references], metrics, verdicts)
+
+@click.command()
+@click.argument("target")
+@click.option("-r", "--reference", "references", multiple=True, required=True,
+              help="Reference distribution: a stats table, a *.cq circuit or a dataset (repeat for several).")
+@click.option("-o", "--output", default='QFLCC_matrix.csv', help="Pairwise results table (*.csv).")
+@click.option("--npz", default=None, help="Also write the N x M matrices to this numpy file (*.npz).")
+@click.option("-p", "--pattern", default='*', help="File pattern when TARGET is a directory.")
+@click.option("--align", is_flag=True, help="Compare binary strings of different widths on their common leftmost bits.")
+def cli(target, references, output, npz, pattern, align):
+    """- Compare every QFLCA dataset in TARGET (a directory or glob) with every reference."""
+    from QFLCC_batch import dataset_paths
+    datasets, errors = archive_run(dataset_paths(target, pattern, exclude=[output]), load_dataset, 'dataset read')
+    if not datasets:
+        raise click.ClickException(f'No dataset could be read from {target!r}, nothing to compare!')
+    references = [load_reference(r) for r in references]
+    key = None
+    if align:
+        index = AlignmentIndex(min(int(d.bits.widths.min()) for d in datasets + references))
+        key = lambda d: index.aligned(d.bits).to_strings()
+    matrix = similarity(datasets, references, key)
+    matrix.to_csv(output)
+    if npz:
+        matrix.to_npz(npz)
+    archive_summary(f'{len(matrix.datasets)} dataset(s) x {len(matrix.references)} reference(s) compared, '
+                    f'{len(errors)} failed. Results written to {output}', errors)
+
+if __name__ == "__main__":
+    cli()
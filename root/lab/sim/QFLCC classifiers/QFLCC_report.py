@@ -0,0 +1,39 @@
+##################################################################################
+# Failure and summary reporting of the QFLCC archive command line tools.
+# Standard filename is: QFLCC_report.py
+# The archive CLIs (QFLCC_batch.py, QFLCC_matrix.py, QDF_fit.py) run one step
+# per dataset of a directory or glob pattern. A dataset whose step fails is
+# reported and skipped rather than halting the run, and the run exits with
+# status 1 after its summary line if any dataset failed.
+#--------------------------/// Usage ///-----------------------------------------
+# rows, errors = archive_run(paths, analyze_dataset, 'dataset analysis')
+# archive_summary(f'{len(rows)} dataset(s) analyzed, {len(errors)} failed.', errors)
+##################################################################################
+import sys
+import click
+
+def archive_run(paths, step, action, event_log=None):
+#-----------------------------------------------------------------
+# Run step(path) on every path of a dataset archive and return the
+# (results, errors) lists. A path whose step fails is reported on
+# stderr (and to event_log, a QFLCC_log.EventLog, if given) and
+# skipped rather than halting the run.
+#-----------------------------------------------------------------
+    results, errors = [], []
+    for path in paths:
+        try:
+            results.append(step(path))
+        except Exception as e:
+            errors.append((path, e))
+            click.echo(f'{path}: {action} failed! {e}', err=True)
+            if event_log is not None:
+                event_log.log(f'{path}: {action} failed! {e}', stage=action, dataset=str(path), error=repr(e))
+    return results, errors
+
+def archive_summary(message, errors=(), event_log=None):
+    """- Echo the summary line of an archive run, and exit with status 1 if any dataset failed."""
+    click.echo(message)
+    if event_log is not None:
+        event_log.log(message, stage='summary', failed=len(errors), flush=True)
+    if errors:
+        sys.exit(1)
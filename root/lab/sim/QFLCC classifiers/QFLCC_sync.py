@@ -0,0 +1,116 @@
+##################################################################################
+# Incremental dataset sync of the IBMQ/test and QI/test folders into the QFLCC
+# program directory, for the QAI-LCode_QFLCC.py program.
+# Standard filename is: QFLCC_sync.py
+# Only new or changed files are copied (size/mtime or content hash check), every
+# copy is waited on, and per-file errors are reported instead of being lost in
+# an unchecked thread future. Files can also be symlinked or referenced in place.
+##################################################################################
+import hashlib
+import os
+import shutil  # For copying I/O data files from other directories concurrently.
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+SYNC_MODES = ('copy', 'symlink', 'reference')
+SYNC_CHECKS = ('stat', 'hash')
+
+class SyncReport:
+    """- Per-file outcome of a dataset sync: copied, linked, referenced, skipped (unchanged), failed
+    or shadowed (same file name as a file of a later source folder, which is synced instead)."""
+    def __init__(self):
+        self.copied = []
+        self.linked = []
+        self.referenced = []
+        self.skipped = []
+        self.errors = []  # List of (source file, exception) pairs.
+        self.shadowed = []  # List of (source file, source file synced instead) pairs.
+
+    def failed(self, src_dir=None):
+        """- Source files that failed to sync, optionally only those from src_dir (or src_dir
+        itself when it could not be listed)."""
+        src_dir = src_dir and os.path.normpath(src_dir)
+        return [src for src, e in self.errors if src_dir is None or src_dir in (src, os.path.dirname(src))]
+
+    def __str__(self):
+        return (f'{len(self.copied)} copied, {len(self.linked)} linked, {len(self.referenced)} referenced, '
+                f'{len(self.skipped)} unchanged, {len(self.errors)} failed, {len(self.shadowed)} shadowed')
+
+def file_hash(path, blocksize=1 << 20):
+    """- SHA-256 content hash of a file, read in blocks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file_to_read:
+        for block in iter(lambda: file_to_read.read(blocksize), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def unchanged(src, dst, check='stat'):
+#-----------------------------------------------------------------
+# True if dst already holds the content of src: same size and an
+# mtime no older than src ('stat'), or the same content ('hash').
+#-----------------------------------------------------------------
+    if not os.path.isfile(dst):
+        return False
+    s, d = os.stat(src), os.stat(dst)
+    if s.st_size != d.st_size:
+        return False
+    if check == 'hash':
+        return file_hash(src) == file_hash(dst)
+    return d.st_mtime_ns >= s.st_mtime_ns
+
+def sync_file(src, dst_dir, mode='copy', check='stat'):
+#-----------------------------------------------------------------
+# Sync one file and return how it was synced: 'copied', 'linked',
+# 'referenced' or 'skipped'. Exceptions propagate to the caller.
+#-----------------------------------------------------------------
+    dst = os.path.join(dst_dir, os.path.basename(src))
+    if mode == 'reference':
+        return 'referenced'
+    if mode == 'symlink':
+        if os.path.realpath(dst) == os.path.realpath(src):  # Already linked, or dst_dir is the source folder.
+            return 'skipped'
+        if os.path.lexists(dst):
+            os.remove(dst)
+        os.symlink(os.path.abspath(src), dst)
+        return 'linked'
+    if not os.path.islink(dst) and unchanged(src, dst, check):
+        return 'skipped'
+    if os.path.islink(dst):
+        os.remove(dst)
+    shutil.copy2(src, dst)  # Keep the source mtime so the next 'stat' check can skip this file.
+    return 'copied'
+
+def sync_datasets(src_dirs, dst_dir, mode='copy', check='stat', max_workers=4):
+#-----------------------------------------------------------------
+# Sync the files of every source folder into dst_dir on a thread
+# pool, wait on all of them and report per-file outcomes. With
+# mode='reference', nothing is written and the source paths are
+# listed in report.referenced to be read in place.
+#-----------------------------------------------------------------
+    if mode not in SYNC_MODES:
+        raise ValueError(f'Unknown sync mode {mode!r}, expected one of {SYNC_MODES}!')
+    if check not in SYNC_CHECKS:
+        raise ValueError(f'Unknown sync check {check!r}, expected one of {SYNC_CHECKS}!')
+    report = SyncReport()
+    sources = {}  # File name -> source file; a later source folder wins on the same name (see report.shadowed).
+    for src_dir in src_dirs:
+        try:
+            names = sorted(os.listdir(src_dir))
+        except OSError as e:
+            report.errors.append((os.path.normpath(src_dir), e))
+            continue
+        for name in names:
+            if os.path.isfile(os.path.join(src_dir, name)):
+                src = os.path.join(os.path.normpath(src_dir), name)
+                if name in sources:
+                    report.shadowed.append((sources[name], src))
+                sources[name] = src
+
+    with ThreadPoolExecutor(max(1, int(max_workers))) as executor:
+        futures = {executor.submit(sync_file, src, dst_dir, mode, check): src for src in sources.values()}
+        for future in as_completed(futures):  # Wait on every future, not only the last one.
+            src = futures[future]
+            try:
+                getattr(report, future.result()).append(src)
+            except Exception as e:
+                report.errors.append((src, e))
+    return report
@@ -0,0 +1,86 @@
+##################################################################################
+# Δp validation verdict classifier for the PAnalysis_model() step of the
+# QAI-LCode_QFLCC.py program.
+# Standard filename is: QFLCC_verdict.py
+# The Δp of min(P) and max(P) matches (1 - |Δp|) between a dataset and the IBM
+# QDF circuit are classified by a declarative threshold table. The rules are
+# listed in order of precedence: the first rule whose Δmin and Δmax intervals
+# both hold gives the verdict, and the first rule that colors a Δp bar gives its
+# color. Any number of (Δmin, Δmax) pairs are classified at once with array
+# masks, e.g. every dataset against every reference circuit.
+# A verdict of ␀ denotes missing information or unknown about the max or min of
+# the P's (calculable if the circuit config is corrected or complemented).
+##################################################################################
+import numpy as np
+
+INF = float('inf')
+DECIMALS = 2  # Δp matches are rounded to 2 decimals before the thresholds are applied.
+NULL = '␀'  # Verdict when no rule holds.
+NA = '{∞ , ⁿ/ₐ}'
+
+class VerdictRule:
+    """- A verdict for Δmin/Δmax match values inside the given intervals, with the colors of
+    the Δp of max(P) and min(P) bars (None leaves a bar to a lower precedence rule)."""
+    def __init__(self, verdict, dmin=(-INF, INF, '[]'), dmax=(-INF, INF, '[]'), max_color=None, min_color=None):
+        self.verdict = verdict
+        self.dmin = dmin  # (low, high, bounds), bounds '[]', '[)', '(]' or '()' for closed/open ends.
+        self.dmax = dmax
+        self.max_color = max_color
+        self.min_color = min_color
+
+    def __repr__(self):
+        return f'VerdictRule({self.verdict!r}, Δmin {interval_text(self.dmin)}, Δmax {interval_text(self.dmax)})'
+
+def interval_text(interval):
+    low, high, bounds = interval
+    return f'{bounds[0]}{low:.3g}, {high:.3g}{bounds[1]}'
+
+def in_interval(x, interval):
+    """- Mask of the values of x inside a (low, high, bounds) interval."""
+    low, high, bounds = interval
+    above = x >= low if bounds[0] == '[' else x > low
+    below = x <= high if bounds[1] == ']' else x < high
+    return above & below
+
+#---------------------------------------------------------------
+# Threshold table of the Δp validation verdict, highest precedence
+# first. Both Δmin and Δmax at or below 1/2 is a ␀ match whatever
+# the other rules say; a Weak Δmin (below 1/3) outranks the Δmax
+# only rules below it.
+#---------------------------------------------------------------
+VERDICT_RULES = [VerdictRule(NULL, dmin=(-INF, 0.5, '[]'), dmax=(-INF, 0.5, '[]'), max_color='silver', min_color='silver'),
+                 VerdictRule('Strong', dmin=(0.9, INF, '[]'), dmax=(0.9, 1, '[]'), max_color='green', min_color='green'),
+                 VerdictRule('Above Avg.', dmin=(0.66, INF, '[]'), dmax=(0.66, 0.9, '[)'), max_color='magenta', min_color='magenta'),
+                 VerdictRule('Avg.', dmax=(0.55, 0.66, '()'), max_color='yellow'),
+                 VerdictRule('Weak', dmin=(0, 1/3, '[)'), min_color='red'),
+                 VerdictRule(NA, dmax=(0.5, 0.55, '[]'), max_color='silver'),
+                 VerdictRule('Weak', dmax=(0, 0.5, '[)'), max_color='red')]
+DEFAULT_COLOR = 'white'
+
+def delta_match(p_ref, p_data):
+    """- Δp match, 1 - |Δp|, of reference and dataset P's (arrays broadcast together)."""
+    return 1 - np.abs(np.asarray(p_ref, dtype=float) - np.asarray(p_data, dtype=float))
+
+def classify(dmin, dmax, rules=None, decimals=DECIMALS):
+#-----------------------------------------------------------------
+# Verdicts of (Δmin, Δmax) match pairs (scalars or arrays broadcast
+# together) as (verdicts, max_colors, min_colors) string arrays of
+# their broadcast shape: the first holding rule in order of
+# precedence gives the verdict and each bar color.
+#-----------------------------------------------------------------
+    rules = VERDICT_RULES if rules is None else rules
+    dmin, dmax = np.broadcast_arrays(np.round(np.asarray(dmin, dtype=float), decimals),
+                                     np.round(np.asarray(dmax, dtype=float), decimals))
+    holds = [in_interval(dmin, rule.dmin) & in_interval(dmax, rule.dmax) for rule in rules]
+    verdicts = np.select(holds, [rule.verdict for rule in rules], NULL) if rules else np.full(dmin.shape, NULL)
+    colors = []
+    for attr in ('max_color', 'min_color'):
+        colored = [(mask, getattr(rule, attr)) for mask, rule in zip(holds, rules) if getattr(rule, attr)]
+        colors.append(np.select([m for m, _ in colored], [c for _, c in colored], DEFAULT_COLOR)
+                      if colored else np.full(dmin.shape, DEFAULT_COLOR))
+    return verdicts.astype(object), colors[0].astype(object), colors[1].astype(object)
+
+def verdict(dmin, dmax, rules=None, decimals=DECIMALS):
+    """- (verdict, max color, min color) of a single (Δmin, Δmax) match pair."""
+    verdicts, max_colors, min_colors = classify(dmin, dmax, rules, decimals)
+    return str(verdicts[()]), str(max_colors[()]), str(min_colors[()])
@@ -0,0 +1,8 @@
+##################################################################################
+# Test setup of the QFLCC classifiers modules: they import each other by module
+# name from their own folder, so the folder is put on the module search path.
+##################################################################################
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -0,0 +1,31 @@
+##################################################################################
+# Headless batch analysis of a dataset folder with QFLCC_batch.py.
+##################################################################################
+import csv
+import shutil
+from pathlib import Path
+from click.testing import CliRunner
+from QFLCC_batch import cli
+
+HERE = Path(__file__).resolve().parents[1]
+
+def test_batch_folder(tmp_path, monkeypatch):
+    for name in ('QI_Exp_01', 'QI_Exp_02'):
+        shutil.copy(HERE / f'{name}.csv', tmp_path)
+        shutil.copy(HERE / f'{name}.json', tmp_path)  # Same dataset: analyzed once.
+    monkeypatch.chdir(tmp_path)
+    for _ in range(2):  # The results table of the first run is not taken as a dataset by the second.
+        result = CliRunner().invoke(cli, ['.'])
+        assert result.exit_code == 0, result.output
+        assert '2 dataset(s) analyzed, 0 failed' in result.output
+    with open('QFLCC_batch_results.csv', newline='') as file_to_read:
+        rows = list(csv.DictReader(file_to_read))
+    assert [row['dataset'] for row in rows] == ['QI_Exp_01.csv', 'QI_Exp_02.csv']
+    assert float(rows[0]['max_p']) == 0.67578125
+    assert rows[0]['max_bin'] == '01011b'
+
+def test_batch_failure_exit_status(tmp_path):
+    (tmp_path / 'QI_Exp_09.csv').write_text('binary_string,probability\n010100b,not a P\n')
+    result = CliRunner().invoke(cli, [str(tmp_path), '-o', str(tmp_path / 'results.csv')])
+    assert result.exit_code == 1
+    assert '0 dataset(s) analyzed, 1 failed' in result.output
@@ -0,0 +1,41 @@
+##################################################################################
+# Packed binary strings, pair extraction and register alignment of QFLCC_bits.py.
+##################################################################################
+import pytest
+from QFLCC_bits import AlignmentIndex, BitColumn, QubitMap, bins_match, pack_bins, row_pairs
+
+def test_pack_round_trip():
+    bins = ['010010b', '0101', '1', '000000000011b']
+    assert BitColumn.from_strings(bins).to_strings().tolist() == bins
+
+def test_complement_keeps_marker():
+    assert BitColumn.from_strings(['010010b', '0101']).complement().to_strings().tolist() == ['101101b', '1010']
+
+def test_pack_rejects_wide_strings():
+    for width in (65, 256, 300):  # 256 and 300 wrap to 0 and 44 as uint8 widths.
+        with pytest.raises(ValueError):
+            pack_bins(['1' * width])
+
+def test_row_pairs_layouts():
+    bits = BitColumn.from_strings(['01011b', '010100b'])
+    assert row_pairs(bits, 0)[2] == ['01', '1b']
+    assert row_pairs(bits, 1)[2] == ['10', '0b']
+
+def test_bins_match_on_common_qubits():
+    assert bins_match('010100b', '0101')
+    assert bins_match('01011b', '0101')
+    assert not bins_match('010010b', '0101')
+
+def test_bins_match_multi_line_input():
+    # df2.to_string() lists every row of the max P range on its own line: only its first line is compared.
+    s3 = '010010b\n010100b'
+    with pytest.raises(ValueError):
+        pack_bins([s3])
+    assert not bins_match(s3.split()[0], '0101')
+    assert bins_match('010100b\n010010b'.split()[0], '0101')
+
+def test_alignment_index_prefix_maps():
+    index = AlignmentIndex(4)
+    bits = BitColumn.from_strings(['010100b', '01011b', '0111'])
+    assert index.aligned(bits).to_strings().tolist() == ['0101', '0101', '0111']
+    assert QubitMap.prefix(6, 4).positions.tolist() == [-1, -1, 0, 1, 2, 3]
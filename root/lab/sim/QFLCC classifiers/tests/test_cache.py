@@ -0,0 +1,32 @@
+##################################################################################
+# Circuit keys of QDF_sim.py and the on-disk QDF result cache of QDF_cache.py.
+##################################################################################
+import os
+from QDF_cache import ResultCache
+from QDF_sim import QDFResult, build_qdf, circuit_key
+
+def test_circuit_key_is_stable():
+    assert circuit_key(build_qdf(), shots=None, mode='exact') == circuit_key(build_qdf(), shots=None, mode='exact')
+    assert circuit_key(build_qdf(), shots=1024) != circuit_key(build_qdf(), shots=2048)
+    assert circuit_key(build_qdf(), mode='exact') != circuit_key(build_qdf({'u_v1': 1.0}), mode='exact')
+
+def test_lru_eviction(tmp_path):
+    cache = ResultCache(tmp_path, max_entries=2)
+    for n, key in enumerate('abc'):
+        cache.put(key, QDFResult({'0101': 1.0}, mode='exact'))
+        os.utime(cache.entry(key), ns=(n * 10**9, n * 10**9))  # a oldest, c newest.
+        if key == 'b':
+            assert cache.get('a').probabilities == {'0101': 1.0}  # A hit makes a the most recently used.
+    assert len(cache) == 2
+    assert 'a' in cache and 'c' in cache and 'b' not in cache
+
+def test_atomic_write_and_bad_entry(tmp_path):
+    cache = ResultCache(tmp_path)
+    result = QDFResult.from_counts({'0101': 3, '0001': 1}, 4, seeds={'seed': 1}, mode='shots')
+    cache.put('key', result)
+    assert os.listdir(tmp_path) == ['key.json']  # No *.tmp file left behind.
+    again = cache.get('key')
+    assert again.counts == result.counts and again.seeds == {'seed': 1}
+    cache.entry('key').write_text('{"probabilities": {"0101"')  # Cut short, e.g. by a crash.
+    assert cache.get('key') is None
+    assert 'key' not in cache
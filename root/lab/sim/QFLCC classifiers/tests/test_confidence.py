@@ -0,0 +1,29 @@
+##################################################################################
+# Binomial intervals and the Δp verdict bootstrap of QFLCC_confidence.py.
+##################################################################################
+import numpy as np
+from QFLCC_confidence import clopper_pearson, infer_shots, match_confidence, outcome_intervals, wilson_interval
+
+def test_intervals_bracket_the_estimate():
+    k = np.array([0, 10, 512, 692, 1024])
+    low, high = clopper_pearson(k, 1024)
+    wlow, whigh = wilson_interval(k/1024, 1024)
+    assert (low <= k/1024).all() and (k/1024 <= high).all()
+    assert low[0] == 0 and high[-1] == 1
+    assert np.allclose(low[1:-1], wlow[1:-1], atol=0.005) and np.allclose(high[1:-1], whigh[1:-1], atol=0.005)
+
+def test_exact_p_has_no_interval():
+    low, high = outcome_intervals([0.25, 0.75], None)
+    assert low.tolist() == high.tolist() == [0.25, 0.75]
+
+def test_infer_shots():
+    assert infer_shots([0.67578125, 0.10546875, 0.0849609375, 0.1337890625]) == 1024
+
+def test_verdict_share_is_seeded_and_follows_points():
+    ref = np.array([0.05, 0.67, 0.28])
+    first = match_confidence(ref, ref, 8192, 1024, seed=1, points=((0.05, 0.67), (0.05, 0.5)))
+    again = match_confidence(ref, ref, 8192, 1024, seed=1, points=((0.05, 0.67), (0.05, 0.5)))
+    assert first.verdict_share == again.verdict_share
+    assert abs(first.match_max - 0.83) < 1e-12  # Classified from the points given, not from max(data).
+    assert first.share('Above Avg.') > 0.9
+    assert not first.significant()
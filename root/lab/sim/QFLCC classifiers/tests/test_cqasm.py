@@ -0,0 +1,37 @@
+##################################################################################
+# The cQASM front-end of QDF_cqasm.py on the QI circuit "QDF-LCode (QI).cq".
+##################################################################################
+from pathlib import Path
+import numpy as np
+from QDF_cqasm import load_cqasm, parse_cqasm, run_cqasm, to_circuit
+from QDF_sim import probabilities
+
+QI_CIRCUIT = Path(__file__).resolve().parents[1] / 'QDF-LCode (QI).cq'
+
+def test_qi_circuit_gate_mapping():
+    program = parse_cqasm(QI_CIRCUIT.read_text(encoding='utf-8'))
+    assert program.nqubits == 6 and program.version == '1.0'
+    assert [(sub.name, sub.iterations) for sub in program.subcircuits] == [
+        ('init', 1), ('superpose_entangle', 2), ('sender_encode_bits', 1), ('receiver_decode_bits', 1),
+        ('full_adder', 1)]
+    ops = load_cqasm(QI_CIRCUIT).ops
+    assert [op.name for op in ops] == (['reset'] * 6 + ['x', 'x'] + ['h', 'cx', 'cp', 'h'] * 2
+                                       + ['z', 'rz', 'rz', 'cp', 'x'] + ['h', 'cp', 'cx', 'h', 'swap']
+                                       + ['measure'] * 2 + ['ccx', 'cx', 'ccx', 'cx', 'cx'] + ['measure'] * 3)
+    cr = ops[10]
+    assert cr.qubits == (1, 4) and cr.params == (0.39,)
+    assert [op.qubits for op in ops if op.name == 'measure'] == [(1,), (2,), (2,), (4,), (5,)]
+
+def test_qi_circuit_result():
+    result = run_cqasm(QI_CIRCUIT)
+    assert all(len(bits) == 7 and bits.endswith('b') for bits in result.probabilities)  # b[5]...b[0] + 'b'.
+    assert np.isclose(sum(result.probabilities.values()), 1)
+    sampled = run_cqasm(QI_CIRCUIT, shots=1024, seed=1)
+    assert sum(sampled.counts.values()) == 1024 and set(sampled.counts) <= set(result.probabilities)
+
+def test_gate_equivalences():
+    bell = probabilities(to_circuit(parse_cqasm('version 1.0\nqubits 2\nh q[0]\ncnot q[0], q[1]\nmeasure_all')))
+    assert set(bell) == {'00', '11'}
+    identity = to_circuit(parse_cqasm('qubits 1\n{x90 q[0]}\nmx90 q[0]\ny90 q[0]\nmy90 q[0]\nmeasure q[0]'))
+    assert np.isclose(probabilities(identity).get('0', 0), 1)
+    assert np.isclose(probabilities(to_circuit(parse_cqasm('qubits 1\nx90 q[0]\nx90 q[0]\nmeasure q[0]')))['1'], 1)
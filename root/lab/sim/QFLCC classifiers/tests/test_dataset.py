@@ -0,0 +1,49 @@
+##################################################################################
+# Dataset readers, export selection and the parsed dataset cache of
+# QFLCC_dataset.py.
+##################################################################################
+import os
+import shutil
+from pathlib import Path
+import numpy as np
+import pytest
+from QFLCC_dataset import CACHE_DIR, load_dataset
+
+HERE = Path(__file__).resolve().parents[1]
+
+@pytest.fixture
+def exports(tmp_path):
+    """- The csv, json and htm exports of QI_Exp_01 in a scratch folder."""
+    for ext in ('.csv', '.json', '.htm'):
+        shutil.copy(HERE / f'QI_Exp_01{ext}', tmp_path)
+    return tmp_path
+
+def test_explicit_export_is_read(exports):
+    for ext in ('.csv', '.json', '.htm'):
+        dataset = load_dataset(exports / f'QI_Exp_01{ext}', cache=False)
+        assert dataset.name == f'QI_Exp_01{ext}'
+        assert dataset.max_bin == '01011b' and dataset.p_max == 0.67578125
+
+def test_stem_reads_cheapest_export_with_fallback(exports):
+    assert load_dataset(exports / 'QI_Exp_01', cache=False).name == 'QI_Exp_01.csv'
+    (exports / 'QI_Exp_01.csv').write_text('binary_string,probability\n01011b,not a P\n')
+    assert load_dataset(exports / 'QI_Exp_01', cache=False).name == 'QI_Exp_01.json'
+    with pytest.raises(ValueError):
+        load_dataset(exports / 'QI_Exp_01.csv', cache=False)  # A chosen export is not swapped for another.
+
+def test_cache_entry_follows_mtime_and_size(exports):
+    path = exports / 'QI_Exp_01.csv'
+    first = load_dataset(path)
+    entries = os.listdir(exports / CACHE_DIR)
+    assert len(entries) == 1
+    cached = load_dataset(path)
+    assert isinstance(cached.probs.base, np.memmap) or isinstance(cached.probs, np.memmap)
+    assert cached.bins.tolist() == first.bins.tolist()
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))  # Same content, newer mtime.
+    load_dataset(path)
+    assert os.listdir(exports / CACHE_DIR) != entries and len(os.listdir(exports / CACHE_DIR)) == 1
+    path.write_text('binary_string,probability\n01011b,0.75\n10101b,0.25\n')  # New size.
+    changed = load_dataset(path)
+    assert changed.p_max == 0.75 and len(changed) == 2
+    assert len(os.listdir(exports / CACHE_DIR)) == 1  # Stale entries are replaced, not kept.
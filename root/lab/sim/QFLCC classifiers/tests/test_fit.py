@@ -0,0 +1,43 @@
+##################################################################################
+# Circuit-to-dataset fitting of QDF_fit.py.
+##################################################################################
+import numpy as np
+import pytest
+from click.testing import CliRunner
+from QDF_fit import cli, fit
+from QDF_sim import build_qdf, outcome_bins, simulate
+from QFLCC_dataset import PDataset
+
+def synthetic_dataset(angles, marker=''):
+    """- Exact outcome P table of the QDF circuit with the given angles, as a 4-bit dataset
+    (or a QI style export when marker extends every binary string, e.g. 00b)."""
+    probs = simulate(build_qdf(angles))[0]
+    bins = [b + marker for b, p in zip(outcome_bins(4), probs) if p > 1e-9]
+    return PDataset(bins, probs[probs > 1e-9], name='synthetic')
+
+def test_fit_recovers_a_4_bit_dataset():
+    result = fit(synthetic_dataset({'u_v1': 2.0}), names=['u_v1'], population=64, rounds=30, seed=1)
+    assert result.default_value > 0.1
+    assert result.value < 1e-3
+    assert np.allclose(result.model, result.observed, atol=1e-2)
+
+def test_fit_lines_up_qi_strings():
+    plain = fit(synthetic_dataset({'u_v1': 2.0}), names=['u_v1'], population=32, rounds=5, seed=1)
+    for marker in ('b', '00b'):  # 5-bit and 6-bit QI layouts, lined up on their leftmost 4 bits.
+        marked = fit(synthetic_dataset({'u_v1': 2.0}, marker), names=['u_v1'], population=32, rounds=5, seed=1)
+        assert marked.value == pytest.approx(plain.value)
+        assert marked.value < marked.default_value
+
+def test_fit_rejects_disjoint_support_and_no_rounds():
+    with pytest.raises(ValueError):
+        fit(PDataset(['1000', '1100'], [0.5, 0.5], name='disjoint'), rounds=2, seed=1)
+    with pytest.raises(ValueError):
+        fit(synthetic_dataset({}), rounds=0)
+
+def test_fit_cli_folder(tmp_path, monkeypatch):
+    synthetic_dataset({'u_v1': 2.0}).to_csv(tmp_path / 'QI_Exp_09.csv')
+    monkeypatch.chdir(tmp_path)
+    for _ in range(2):  # The results table of the first run is not fitted by the second.
+        result = CliRunner().invoke(cli, ['.', '-a', 'u_v1', '-n', '16', '-r', '2', '--seed', '1'])
+        assert result.exit_code == 0, result.output
+        assert '1 dataset(s) fitted, 0 failed' in result.output
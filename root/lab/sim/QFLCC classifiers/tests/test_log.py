@@ -0,0 +1,31 @@
+##################################################################################
+# The buffered JSON lines event log of QFLCC_log.py.
+##################################################################################
+import os
+from QFLCC_log import EventLog, read_log
+
+def test_jsonl_round_trip(tmp_path):
+    log = EventLog(tmp_path / 'log.jsonl', tmp_path / 'shell_output.txt', batch=2)
+    log.start('///--- START ---///')
+    log.log('1- Checkpoint for file # 1', stage='listing', dataset='QI_Exp_01.csv', index=1)
+    assert len(read_log(tmp_path / 'log.jsonl')) == 1  # Buffered until the batch is full.
+    log.log('Sim: Ψ done', stage='simulation')
+    log.close()
+    events = read_log(tmp_path / 'log.jsonl')
+    assert [e['stage'] for e in events] == ['start', 'listing', 'simulation']
+    assert events[1]['dataset'] == 'QI_Exp_01.csv' and events[1]['index'] == 1
+    assert events[2]['message'] == 'Sim: Ψ done'
+    assert (tmp_path / 'shell_output.txt').read_text(errors='replace').splitlines()[:2] == [
+        '///--- START ---///', '1- Checkpoint for file # 1']
+
+def test_rotation(tmp_path):
+    path = tmp_path / 'log.jsonl'
+    log = EventLog(path, None, batch=1, max_bytes=300, backups=2)
+    for n in range(20):
+        log.log(f'event {n:02d}', stage='listing')
+    log.close()
+    assert sorted(os.listdir(tmp_path)) == ['log.jsonl', 'log.jsonl.1', 'log.jsonl.2']
+    assert all(os.path.getsize(tmp_path / name) <= 300 for name in os.listdir(tmp_path))
+    kept = read_log(f'{path}.2') + read_log(f'{path}.1') + read_log(path)
+    messages = [e['message'] for e in kept]
+    assert messages == sorted(messages) and messages[-1] == 'event 19'  # Oldest dropped, order kept.
@@ -0,0 +1,31 @@
+##################################################################################
+# The similarity matrix CLI of QFLCC_matrix.py.
+##################################################################################
+from pathlib import Path
+from click.testing import CliRunner
+from QFLCC_matrix import cli
+
+STATS = str(Path(__file__).resolve().parents[1] / 'ibm-qdf-stats.csv')
+
+def test_align_with_no_dataset(tmp_path):
+    result = CliRunner().invoke(cli, [str(tmp_path / 'missing_*.csv'), '-r', STATS, '--align',
+                                      '-o', str(tmp_path / 'matrix.csv')])
+    assert result.exit_code == 1
+    assert 'No dataset could be read' in result.output
+    assert not isinstance(result.exception, ValueError)
+
+def test_align_matrix(tmp_path):
+    data = tmp_path / 'QI_Exp_09.csv'
+    data.write_text('binary_string,probability\n010100b,0.75\n000100b,0.25\n')
+    output = tmp_path / 'matrix.csv'
+    result = CliRunner().invoke(cli, [str(data), '-r', STATS, '--align', '-o', str(output)])
+    assert result.exit_code == 0, result.output
+    assert output.read_text().count('\n') == 2
+
+def test_matrix_folder_rerun(tmp_path, monkeypatch):
+    (tmp_path / 'QI_Exp_09.csv').write_text('binary_string,probability\n0101,0.75\n0111,0.25\n')
+    monkeypatch.chdir(tmp_path)
+    for _ in range(2):  # The matrix table of the first run is not read as a dataset by the second.
+        result = CliRunner().invoke(cli, ['.', '-r', STATS])
+        assert result.exit_code == 0, result.output
+        assert '1 dataset(s) x 1 reference(s) compared, 0 failed' in result.output
@@ -0,0 +1,26 @@
+##################################################################################
+# Readout and gate noise of the QDF circuit simulation in QDF_noise.py.
+##################################################################################
+from functools import reduce
+import numpy as np
+from QDF_noise import noisy_probabilities, noisy_sweep, readout_error
+from QDF_sim import build_qdf, simulate
+
+def test_readout_matrix_keeps_total_p():
+    probs = np.random.default_rng(1).dirichlet(np.ones(16), size=3)
+    noisy = readout_error(probs, [0.0, 0.02, 0.3], [0.0, 0.05, 0.1])
+    assert np.allclose(noisy.sum(axis=-1), 1)
+    assert np.allclose(noisy[0], probs[0])  # No flips at rate 0.
+    flip = np.array([[1 - 0.02, 0.05], [0.02, 1 - 0.05]])  # Column: read bit; row: measured bit.
+    assert np.allclose(noisy[1], reduce(np.kron, [flip] * 4) @ probs[1])
+
+def test_readout_flips_one_bit():
+    assert np.allclose(readout_error([1.0, 0.0], 0.1), [0.9, 0.1])
+    assert np.allclose(readout_error([0.0, 1.0], 0.1, 0.25), [0.25, 0.75])
+
+def test_noisy_qdf_circuit():
+    exact = simulate(build_qdf())[0]
+    assert np.allclose(noisy_sweep(build_qdf(), p1=0.0, p2=0.0, trajectories=4, seed=1)[0], exact)
+    noisy = noisy_probabilities(build_qdf(), p1=0.01, p2=0.05, p01=0.02, trajectories=256, seed=1)
+    assert np.isclose(sum(noisy.values()), 1)
+    assert len(noisy) > (exact > 1e-12).sum()  # Noise spreads P over more outcomes.
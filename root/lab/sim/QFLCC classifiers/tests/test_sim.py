@@ -0,0 +1,30 @@
+##################################################################################
+# Statevector simulation of the QDF circuit (mid-circuit measurements and c_if
+# branches) of QDF_sim.py.
+##################################################################################
+import numpy as np
+from QDF_sim import Circuit, build_qdf, probabilities, simulate
+
+QDF_P = {'0001': 0.050384, '0101': 0.673232, '0111': 0.276384}  # Exact P's of the default QDF circuit.
+
+def test_qdf_exact_probabilities():
+    probs = probabilities(build_qdf())
+    assert set(probs) == set(QDF_P)
+    for bits, p in QDF_P.items():
+        assert abs(probs[bits] - p) < 1e-6
+
+def test_c_if_branches():
+    qc = Circuit(2)
+    qc.h(0)
+    qc.measure(0, 0)
+    qc.x(1).c_if(1)  # Flips q[1] only on the branch where c = 1.
+    qc.measure(1, 1)
+    probs = probabilities(qc)
+    assert set(probs) == {'00', '11'}
+    assert abs(probs['11'] - 0.5) < 1e-12
+
+def test_batched_angles():
+    probs = simulate(build_qdf({'u_v1': np.array([5.0, 1.0])}))
+    assert probs.shape == (2, 16)
+    assert np.allclose(probs.sum(axis=1), 1)
+    assert np.allclose(probs[0], simulate(build_qdf())[0])
@@ -0,0 +1,32 @@
+##################################################################################
+# The QDF circuit stats table of QDF_stats.py, and the column detection of the
+# dataset *.csv reader in QFLCC_dataset.py.
+##################################################################################
+import numpy as np
+import pytest
+from QDF_stats import read_stats, write_stats
+from QFLCC_dataset import load_dataset
+
+def test_stats_round_trip(tmp_path):
+    path = write_stats({'0101': 6, '0001': 2}, tmp_path / 'stats.csv')
+    stats = read_stats(path)
+    assert stats.bins.tolist() == ['0001', '0101']
+    assert stats.shots == 8
+    assert np.allclose(stats.probs, [0.25, 0.75])
+
+def test_stats_table_read_as_dataset(tmp_path):
+    path = write_stats({'0101': 6, '0001': 2}, tmp_path / 'ibm-qdf-stats.csv')
+    dataset = load_dataset(path)
+    assert dataset.p_max == 0.75 and dataset.max_bin == '0101'  # Not the count column.
+    assert dataset.counts == {'0001': 2, '0101': 6}
+    exact = load_dataset(write_stats(None, tmp_path / 'exact.csv', probs={'0101': 0.75, '0001': 0.25}))
+    assert exact.counts is None and exact.p_max == 0.75
+
+def test_csv_columns_by_header(tmp_path):
+    path = tmp_path / 'swapped.csv'
+    path.write_text('probability,binary_string\n0.25,0001\n0.75,0101\n')
+    assert load_dataset(path, cache=False).max_bin == '0101'
+    path = tmp_path / 'QFLCC_batch_results.csv'
+    path.write_text('dataset,outcomes,max_p\nQI_Exp_01.csv,4,0.67578125\n')
+    with pytest.raises(ValueError, match='probability'):
+        load_dataset(path, cache=False)
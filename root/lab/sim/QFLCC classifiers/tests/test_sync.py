@@ -0,0 +1,44 @@
+##################################################################################
+# Incremental sync of the IBMQ/test and QI/test dataset folders of QFLCC_sync.py.
+##################################################################################
+import os
+from QFLCC_sync import sync_datasets
+
+def folders(tmp_path):
+    """- QI and IBMQ source folders (with one file name in both) and an empty destination."""
+    qi, ibmq, dst = tmp_path / 'QI', tmp_path / 'IBMQ', tmp_path / 'dst'
+    for folder in (qi, ibmq, dst):
+        folder.mkdir()
+    (qi / 'QI_Exp_01.csv').write_text('binary_string,probability\n01011b,1.0\n')
+    (qi / 'shared.csv').write_text('binary_string,probability\n0101,1.0\n')
+    (ibmq / 'shared.csv').write_text('binary_string,probability\n0111,1.0\n')
+    return qi, ibmq, dst
+
+def test_unchanged_files_are_skipped(tmp_path):
+    qi, ibmq, dst = folders(tmp_path)
+    first = sync_datasets([qi, ibmq], dst)
+    assert len(first.copied) == 2 and not first.errors
+    assert first.shadowed == [(str(qi / 'shared.csv'), str(ibmq / 'shared.csv'))]
+    assert (dst / 'shared.csv').read_text().endswith('0111,1.0\n')  # The later folder wins.
+    again = sync_datasets([qi, ibmq], dst)
+    assert not again.copied and len(again.skipped) == 2
+    (qi / 'QI_Exp_01.csv').write_text('binary_string,probability\n01011b,0.5\n10100b,0.5\n')
+    changed = sync_datasets([qi, ibmq], dst, check='hash')
+    assert changed.copied == [str(qi / 'QI_Exp_01.csv')]
+
+def test_errors_are_recorded_per_file(tmp_path):
+    qi, ibmq, dst = folders(tmp_path)
+    report = sync_datasets([qi, ibmq], tmp_path / 'missing')  # No destination folder: every copy fails.
+    assert sorted(report.failed()) == sorted([str(qi / 'QI_Exp_01.csv'), str(ibmq / 'shared.csv')])
+    assert report.failed(qi) == [str(qi / 'QI_Exp_01.csv')]
+    report = sync_datasets([tmp_path / 'QI_missing', ibmq], dst)
+    assert report.failed(tmp_path / 'QI_missing') == [str(tmp_path / 'QI_missing')]
+    assert report.copied == [str(ibmq / 'shared.csv')]
+
+def test_symlink_into_the_source_folder(tmp_path):
+    qi, ibmq, dst = folders(tmp_path)
+    report = sync_datasets([qi], qi, mode='symlink')
+    assert len(report.skipped) == 2 and not report.errors
+    assert (qi / 'QI_Exp_01.csv').is_file() and not os.path.islink(qi / 'QI_Exp_01.csv')
+    linked = sync_datasets([qi], dst, mode='symlink')
+    assert len(linked.linked) == 2 and os.path.islink(dst / 'shared.csv')
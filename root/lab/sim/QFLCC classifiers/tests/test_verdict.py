@@ -0,0 +1,46 @@
+##################################################################################
+# The Δp verdict threshold table of QFLCC_verdict.py against the if-chain of
+# PAnalysis_model() it replaced.
+##################################################################################
+import numpy as np
+from QFLCC_verdict import NA, NULL, classify, verdict
+
+def old_verdict(dmin, dmax):
+    """- Verdict and (max, min) bar colors of the former PAnalysis_model() if-chain."""
+    dmin, dmax = round(dmin, 2), round(dmax, 2)
+    text, colors = NULL, ['white', 'white']  # No rule: the verdict list was left unchanged.
+    if 0 <= dmax < 0.5:
+        colors[0], text = 'red', 'Weak'
+    if 0.5 <= dmax <= 0.55:
+        colors[0], text = 'silver', NA
+    if 0 <= dmin < 1/3:
+        colors[1], text = 'red', 'Weak'
+    if (dmin <= 1/3 and dmax <= 1/3) or (dmin <= 1/2 and dmax <= 1/2):
+        colors, text = ['silver', 'silver'], NA
+    if 0.55 < dmax < 0.66:
+        colors[0], text = 'yellow', 'Avg.'
+    if 0.66 <= dmax < 0.9 and dmin >= 0.66:
+        colors, text = ['magenta', 'magenta'], 'Above Avg.'
+    if 0.9 <= dmax <= 1 and dmin >= 0.9:
+        colors, text = ['green', 'green'], 'Strong'
+    if (dmin <= 1/3 and dmax <= 1/2) or (dmin <= 1/2 and dmax <= 1/2):
+        colors, text = ['silver', 'silver'], NULL
+    return text, colors[0], colors[1]
+
+def match_values(n, seed):
+    """- Random Δp matches in [0, 1] away from the 2-decimal rounding ties, plus the 2-decimal grid."""
+    x = np.random.default_rng(seed).random(n)
+    x = x[np.abs((x*100) % 1 - 0.5) > 1e-6]
+    return np.concatenate([x, np.arange(101)/100])
+
+def test_table_matches_if_chain():
+    dmin, dmax = match_values(3000, 1), match_values(3000, 2)
+    dmin, dmax = np.meshgrid(dmin[::7], dmax[::7])
+    verdicts, max_colors, min_colors = classify(dmin, dmax)
+    for i in np.ndindex(dmin.shape):
+        assert (verdicts[i], max_colors[i], min_colors[i]) == old_verdict(float(dmin[i]), float(dmax[i])), i
+
+def test_scalar_verdict():
+    assert verdict(0.95, 0.99) == ('Strong', 'green', 'green')
+    assert verdict(0.4, 0.45) == (NULL, 'silver', 'silver')
+    assert verdict(0.2, 0.7)[0] == 'Weak'